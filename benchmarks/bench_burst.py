@@ -0,0 +1,72 @@
+"""Serial capture() versus pipelined capture_burst() on the simulated backend.
+
+Each shot reaches the host transfer_delay after its trigger and takes
+download_time to download. The serial loop pays for both on every shot; the
+burst keeps triggering while earlier files download.
+
+Usage:
+    python benchmarks/bench_burst.py [--shots 20] [--delay-ms 60] [--download-ms 80]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+os.environ["EDSDK_BACKEND"] = "simulated"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from edsdk import simulated  # noqa: E402
+from edsdk.camera_controller import CameraController  # noqa: E402
+
+_IMAGE_SIZE = 64 * 1024
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--shots", type=int, default=20)
+    p.add_argument("--delay-ms", type=float, default=60.0)
+    p.add_argument("--download-ms", type=float, default=80.0)
+    p.add_argument("--max-in-flight", type=int, default=4)
+    args = p.parse_args()
+
+    simulated.configure(
+        transfer_delay=args.delay_ms / 1000.0,
+        image_size=_IMAGE_SIZE,
+        download_rate=_IMAGE_SIZE / (args.download_ms / 1000.0),
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with CameraController(save_dir=tmp, auto_capacity=False) as cam:
+            start = time.perf_counter()
+            cam.capture(shots=args.shots)
+            serial_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            timings = cam.capture_burst(args.shots, max_in_flight=args.max_in_flight)
+            burst_s = time.perf_counter() - start
+
+    # Shots triggered before the previous shot's download had finished
+    overlap = sum(
+        1
+        for prev, cur in zip(timings, timings[1:])
+        if cur.triggered < prev.transfer_done
+    )
+    result = {
+        "shots": args.shots,
+        "delay_ms": args.delay_ms,
+        "download_ms": args.download_ms,
+        "max_in_flight": args.max_in_flight,
+        "serial_s": serial_s,
+        "burst_s": burst_s,
+        "speedup": serial_s / burst_s,
+        "shots_triggered_during_previous_download": overlap,
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
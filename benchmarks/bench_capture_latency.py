@@ -0,0 +1,89 @@
+"""Trigger-to-path latency of CameraController.capture().
+
+Runs against the simulated backend (EDSDK_BACKEND=simulated), whose camera
+fires DirItemRequestTransfer a configurable delay after each TakePicture, and compares the event-driven wait with the
+previous 10 ms sleep-poll loop. The reported overhead is the time between the
+transfer event firing and capture() returning the saved path.
+
+Usage:
+    python benchmarks/bench_capture_latency.py [--delay-ms 50] [--jitter-ms 20] [--shots 50]
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ["EDSDK_BACKEND"] = "simulated"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from edsdk import simulated  # noqa: E402
+from edsdk.camera_controller import CameraController  # noqa: E402
+
+
+def _polling_wait(self, timeout, already=None):
+    # The loop used before capture completion was event driven
+    deadline = time.time() + timeout
+    if already is None:
+        already = self._transfer_count
+    while time.time() < deadline:
+        time.sleep(0.01)
+        if self._transfer_count > already:
+            return
+    raise TimeoutError("Timed out waiting for image transfer event")
+
+
+def _measure(controller_cls, camera, shots: int) -> dict:
+    camera.fired_at.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        with controller_cls(save_dir=tmp, auto_capacity=False) as cam:
+            returned_at = []
+            for _ in range(shots):
+                cam.capture()
+                returned_at.append(time.perf_counter())
+    overhead_ms = sorted(
+        (done - fired) * 1000 for fired, done in zip(camera.fired_at, returned_at)
+    )
+    return {
+        "shots": shots,
+        "mean_overhead_ms": statistics.mean(overhead_ms),
+        "p50_overhead_ms": overhead_ms[len(overhead_ms) // 2],
+        "p95_overhead_ms": overhead_ms[
+            min(len(overhead_ms) - 1, math.ceil(0.95 * len(overhead_ms)) - 1)
+        ],
+        "max_overhead_ms": overhead_ms[-1],
+    }
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--delay-ms", type=float, default=50.0)
+    p.add_argument("--jitter-ms", type=float, default=20.0)
+    p.add_argument("--shots", type=int, default=50)
+    args = p.parse_args()
+
+    (camera,) = simulated.configure(
+        transfer_delay=args.delay_ms / 1000.0,
+        transfer_jitter=args.jitter_ms / 1000.0,
+        image_size=64 * 1024,
+    )
+
+    class PollingController(CameraController):
+        _wait_for_transfer = _polling_wait
+
+    result = {
+        "delay_ms": args.delay_ms,
+        "jitter_ms": args.jitter_ms,
+        "event": _measure(CameraController, camera, args.shots),
+        "poll_10ms": _measure(PollingController, camera, args.shots),
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Cost of reading PropID.FocusInfo: nested dicts vs. the compact FocusInfo view.
+
+Compares ``GetPropertyData`` (a dict holding 1053 per-point dicts), filtered to
+the valid points, with ``get_focus_info().valid_points()``, which reads the raw
+structure with ``GetPropertyDataBytes`` and decodes only the valid points.
+Reports the time per call and the peak Python memory allocated by one call.
+
+Requires a connected camera that reports FocusInfo (live view running helps on
+most bodies).
+
+Usage:
+    python benchmarks/bench_focus_info.py [--index 0] [--calls 500]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import edsdk
+from edsdk import PropID
+from edsdk.camera_controller import CameraController
+from edsdk.focus_info import get_focus_info
+
+
+def _dict_valid_points(camera) -> list:
+    info = edsdk.GetPropertyData(camera, PropID.FocusInfo, 0)
+    return [p for p in info["focusPoint"][: info["pointNumber"]] if p["valid"]]
+
+
+def _view_valid_points(camera) -> list:
+    return get_focus_info(camera).valid_points()
+
+
+def _measure(fn, camera, calls: int) -> dict:
+    points = len(fn(camera))
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn(camera)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(camera)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "valid_points": points,
+        "us_per_call": elapsed / calls * 1e6,
+        "peak_kib_per_call": peak / 1024,
+    }
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--index", type=int, default=0)
+    p.add_argument("--calls", type=int, default=500)
+    p.add_argument("--live-view", action="store_true", help="Start live view first")
+    args = p.parse_args()
+
+    with CameraController(index=args.index) as cam:
+        if args.live_view:
+            cam.start_live_view()
+        camera = cam._cam
+        before = _measure(_dict_valid_points, camera, args.calls)
+        after = _measure(_view_valid_points, camera, args.calls)
+    result = {
+        "calls": args.calls,
+        "dict": before,
+        "focus_info": after,
+        "speedup": before["us_per_call"] / after["us_per_call"],
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
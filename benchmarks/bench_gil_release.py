@@ -0,0 +1,136 @@
+"""Measure how much Python work can run while EDSDK calls are in flight.
+
+A set of worker threads repeatedly copies a large payload between two SDK
+memory streams with ``CopyData`` while the main thread spins a pure-Python
+counter. With the GIL released around the SDK call, the counter keeps
+advancing during the copies; with the GIL held it stalls.
+
+The baseline mode reproduces a GIL-holding build: every SDK call runs under
+one lock that the counter also takes between short batches of iterations,
+so the copies and the Python work are serialized as they were before the
+GIL was released. Both modes run by default and the summary compares them.
+
+No camera is required: only ``InitializeSDK`` and host-side memory streams
+are used.
+
+Usage:
+    python benchmarks/bench_gil_release.py [--threads 4] [--size-mb 40]
+        [--mode both|released|baseline]
+"""
+
+import argparse
+import contextlib
+import json
+import threading
+import time
+from typing import ContextManager, Optional
+
+import edsdk
+from edsdk import SeekOrigin
+from edsdk.camera_controller import sdk_lifetime
+
+# Counter iterations per lock acquisition in baseline mode
+_SPIN_BATCH = 1000
+
+
+def _copy_worker(
+    size: int,
+    stop: threading.Event,
+    counts: list,
+    idx: int,
+    held: Optional[threading.Lock],
+) -> None:
+    src = edsdk.CreateMemoryStream(size)
+    dst = edsdk.CreateMemoryStream(size)
+    guard: ContextManager = held if held is not None else contextlib.nullcontext()
+    while not stop.is_set():
+        with guard:
+            edsdk.Seek(src, 0, SeekOrigin.Begin)
+            edsdk.Seek(dst, 0, SeekOrigin.Begin)
+            edsdk.CopyData(src, size, dst)
+        counts[idx] += 1
+
+
+def _spin(duration: float, held: Optional[threading.Lock]) -> int:
+    n = 0
+    end = time.perf_counter() + duration
+    guard: ContextManager = held if held is not None else contextlib.nullcontext()
+    while time.perf_counter() < end:
+        with guard:
+            for _ in range(_SPIN_BATCH):
+                n += 1
+    return n
+
+
+def run(threads: int, size_mb: int, duration: float, baseline: bool = False) -> dict:
+    size = size_mb * 1024 * 1024
+    held = threading.Lock() if baseline else None
+    idle = _spin(duration, held)
+
+    stop = threading.Event()
+    counts = [0] * threads
+    workers = [
+        threading.Thread(
+            target=_copy_worker, args=(size, stop, counts, i, held), daemon=True
+        )
+        for i in range(threads)
+    ]
+    for w in workers:
+        w.start()
+    loaded = _spin(duration, held)
+    stop.set()
+    for w in workers:
+        w.join()
+
+    copies = sum(counts)
+    return {
+        "mode": "baseline" if baseline else "released",
+        "threads": threads,
+        "size_mb": size_mb,
+        "duration_s": duration,
+        "copies": copies,
+        "copy_mb_per_s": copies * size_mb / duration,
+        "python_iters_idle": idle,
+        "python_iters_loaded": loaded,
+        "python_progress_ratio": loaded / idle if idle else 0.0,
+    }
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--threads", type=int, default=4)
+    p.add_argument("--size-mb", type=int, default=40)
+    p.add_argument("--duration", type=float, default=3.0)
+    p.add_argument(
+        "--mode",
+        choices=("both", "released", "baseline"),
+        default="both",
+        help="baseline serializes SDK calls and Python work under one lock",
+    )
+    args = p.parse_args()
+
+    results = []
+    with sdk_lifetime.hold():
+        if args.mode in ("both", "baseline"):
+            results.append(run(args.threads, args.size_mb, args.duration, True))
+        if args.mode in ("both", "released"):
+            results.append(run(args.threads, args.size_mb, args.duration))
+    summary: dict = {"results": results}
+    if len(results) == 2:
+        before, after = results
+        summary["python_progress_gain"] = (
+            after["python_progress_ratio"] / before["python_progress_ratio"]
+            if before["python_progress_ratio"]
+            else None
+        )
+        summary["copy_throughput_gain"] = (
+            after["copy_mb_per_s"] / before["copy_mb_per_s"]
+            if before["copy_mb_per_s"]
+            else None
+        )
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
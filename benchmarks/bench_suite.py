@@ -0,0 +1,327 @@
+"""Benchmark suite for the CameraController hot paths on the simulated backend.
+
+Covers capture() and capture_bytes() latency, shutter-to-preview against
+shutter-to-file latency with enable_previews(), capture_burst() throughput,
+grab_live_view_frame() rate with and without JPEG decoding, get_properties()
+and set_properties() round trips, the value parsers, and ``import edsdk`` time.
+Device latencies are configurable and the simulator is seeded, so runs are
+repeatable. Results are printed (or written with --output) as JSON, together
+with the environment and settings they were measured with. --compare adds the
+relative change of every metric against an earlier result file.
+
+Usage:
+    python benchmarks/bench_suite.py [--output results.json] [--compare old.json]
+        [--only capture,preview,live_view] [--delay-ms 30] [--property-latency-ms 2]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import queue
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+os.environ["EDSDK_BACKEND"] = "simulated"
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _REPO_ROOT)
+
+from edsdk import WhiteBalance, simulated  # noqa: E402
+from edsdk.camera_controller import (  # noqa: E402
+    CameraController,
+    _enum_code,
+    _parse_av,
+    _parse_tv,
+)
+
+# Metrics where a larger value is better; every other number is a cost
+_HIGHER_IS_BETTER = ("fps", "shots_per_s", "calls_per_s")
+_PROPERTY_APIS = (
+    "GetPropertyData",
+    "GetPropertyDataMany",
+    "SetPropertyData",
+    "GetPropertyDesc",
+)
+
+
+def _summary(samples_s: List[float]) -> Dict[str, float]:
+    ms = sorted(s * 1000 for s in samples_s)
+    return {
+        "n": len(ms),
+        "mean_ms": statistics.mean(ms),
+        "p50_ms": ms[len(ms) // 2],
+        "p95_ms": ms[min(len(ms) - 1, math.ceil(0.95 * len(ms)) - 1)],
+        "min_ms": ms[0],
+        "max_ms": ms[-1],
+    }
+
+
+def _timed(fn: Callable[[], object], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _controller(save_dir: str, **options) -> CameraController:
+    return CameraController(index=0, save_dir=save_dir, auto_capacity=False, **options)
+
+
+def bench_capture(args: argparse.Namespace, tmp: str) -> dict:
+    with _controller(tmp) as cam:
+        cam.capture()  # warm-up
+        to_disk = _summary(_timed(cam.capture, args.shots))
+        to_memory = _summary(_timed(cam.capture_bytes, args.shots))
+    return {"capture": to_disk, "capture_bytes": to_memory}
+
+
+def bench_preview(args: argparse.Namespace, tmp: str) -> dict:
+    to_preview, to_file = [], []
+    with _controller(tmp) as cam:
+        previews: queue.Queue = queue.Queue()
+        cam.enable_previews(preview_queue=previews)
+        cam.capture()  # warm-up
+        previews.get_nowait()
+        for _ in range(args.shots):
+            start = time.monotonic()
+            cam.capture()
+            to_file.append(time.monotonic() - start)
+            to_preview.append(previews.get_nowait().received - start)
+    return {"preview": _summary(to_preview), "file": _summary(to_file)}
+
+
+def bench_burst(args: argparse.Namespace, tmp: str) -> dict:
+    with _controller(tmp) as cam:
+        start = time.perf_counter()
+        cam.capture_burst(args.shots, max_in_flight=args.max_in_flight)
+        elapsed = time.perf_counter() - start
+    return {
+        "elapsed_s": elapsed,
+        "shots_per_s": args.shots / elapsed,
+    }
+
+
+def _frame_rate(grab: Callable[[], object], duration: float) -> Dict[str, float]:
+    frames = 0
+    start = time.perf_counter()
+    end = start + duration
+    while time.perf_counter() < end:
+        grab()
+        frames += 1
+    return {"frames": frames, "fps": frames / (time.perf_counter() - start)}
+
+
+def bench_live_view(args: argparse.Namespace, tmp: str) -> dict:
+    result: Dict[str, object] = {}
+    with _controller(tmp) as cam:
+        cam.start_live_view()
+        try:
+            result["raw"] = _frame_rate(cam.grab_live_view_frame, args.duration)
+            try:
+                import PIL  # noqa: F401
+            except ImportError:
+                result["decoded"] = {"skipped": "Pillow is not installed"}
+            else:
+                result["decoded"] = _frame_rate(cam.grab_live_view_pil, args.duration)
+        finally:
+            cam.stop_live_view()
+    return result
+
+
+def bench_properties(args: argparse.Namespace, tmp: str) -> dict:
+    with _controller(tmp, property_cache=False) as cam:
+        get = _summary(_timed(cam.get_properties, args.calls))
+        values = iter(["1/125", "1/250"] * args.calls)
+        set_ = _summary(
+            _timed(lambda: cam.set_properties(tv=next(values), av="5.6"), args.calls)
+        )
+    return {
+        "get_properties": get,
+        "set_properties": set_,
+    }
+
+
+def bench_parsers(args: argparse.Namespace, tmp: str) -> dict:
+    cases = {
+        "parse_tv": lambda: _parse_tv("1/125"),
+        "parse_av": lambda: _parse_av("f/5.6"),
+        "enum_code": lambda: _enum_code(WhiteBalance, "Daylight"),
+    }
+    result = {}
+    for name, fn in cases.items():
+        calls = args.calls * 100
+        elapsed = sum(_timed(fn, calls))
+        result[name] = {
+            "us_per_call": elapsed / calls * 1e6,
+            "calls_per_s": calls / elapsed,
+        }
+    return result
+
+
+def bench_import(args: argparse.Namespace, tmp: str) -> dict:
+    code = (
+        "import time; start = time.perf_counter(); import edsdk; "
+        "import edsdk.camera_controller; print(time.perf_counter() - start)"
+    )
+    env = dict(os.environ, EDSDK_BACKEND="simulated", PYTHONPATH=_REPO_ROOT)
+    samples = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(args.imports)
+    ]
+    return {"import_edsdk": _summary(samples)}
+
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace, str], dict]] = {
+    "capture": bench_capture,
+    "preview": bench_preview,
+    "burst": bench_burst,
+    "live_view": bench_live_view,
+    "properties": bench_properties,
+    "parsers": bench_parsers,
+    "import": bench_import,
+}
+
+
+def _flatten(tree: dict, prefix: str = "") -> Dict[str, float]:
+    flat: Dict[str, float] = {}
+    for key, value in tree.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(old: dict, new: dict) -> Dict[str, dict]:
+    """Relative change of every metric present in both result sets.
+
+    "better" is True when the metric improved: lower for costs, higher for
+    rates (fps, shots_per_s, calls_per_s). Counts are skipped.
+    """
+    before = _flatten(old.get("results", {}))
+    after = _flatten(new.get("results", {}))
+    changes = {}
+    for name in sorted(before.keys() & after.keys()):
+        metric = name.rsplit(".", 1)[-1]
+        higher = metric in _HIGHER_IS_BETTER
+        if not (higher or metric.endswith(("_ms", "_s", "us_per_call"))):
+            continue
+        if not before[name]:
+            continue
+        change = (after[name] - before[name]) / before[name]
+        changes[name] = {
+            "before": before[name],
+            "after": after[name],
+            "change": change,
+            "better": change > 0 if higher else change < 0,
+        }
+    return changes
+
+
+def run(args: argparse.Namespace, names: List[str]) -> dict:
+    latencies = {api: args.property_latency_ms / 1000.0 for api in _PROPERTY_APIS}
+    simulated.configure(
+        1,
+        transfer_delay=args.delay_ms / 1000.0,
+        transfer_jitter=args.jitter_ms / 1000.0,
+        download_rate=args.download_mb_per_s * 1024 * 1024 or None,
+        image_size=args.image_kb * 1024,
+        evf_fps=args.evf_fps or None,
+        latencies=latencies,
+        seed=args.seed,
+    )
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in names:
+            results[name] = BENCHMARKS[name](args, tmp)
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "settings": {
+                key: value
+                for key, value in vars(args).items()
+                if key not in ("output", "compare")
+            },
+        },
+        "results": results,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument(
+        "--only", default=",".join(BENCHMARKS), help="Comma-separated benchmarks"
+    )
+    p.add_argument("--output", help="Write the JSON result here instead of stdout")
+    p.add_argument("--compare", help="Earlier JSON result to compare against")
+    p.add_argument("--shots", type=int, default=20)
+    p.add_argument("--calls", type=int, default=200)
+    p.add_argument("--imports", type=int, default=5)
+    p.add_argument(
+        "--duration", type=float, default=1.0, help="Live view seconds per mode"
+    )
+    p.add_argument("--max-in-flight", type=int, default=4)
+    p.add_argument(
+        "--delay-ms", type=float, default=30.0, help="TakePicture to transfer event"
+    )
+    p.add_argument("--jitter-ms", type=float, default=0.0)
+    p.add_argument(
+        "--download-mb-per-s", type=float, default=40.0, help="0 for instant"
+    )
+    p.add_argument("--image-kb", type=int, default=512)
+    p.add_argument("--evf-fps", type=float, default=30.0, help="0 for unthrottled")
+    p.add_argument("--property-latency-ms", type=float, default=1.0)
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    names = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        p.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    result = run(args, names)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            result["comparison"] = compare(json.load(f), result)
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
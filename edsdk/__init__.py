@@ -1,2 +1,14 @@
-from edsdk.api import *
+import os as _os
+
+# EDSDK_BACKEND=simulated selects the pure-Python simulator (edsdk.simulated)
+BACKEND = _os.environ.get("EDSDK_BACKEND", "native").strip().lower()
+
+if BACKEND == "native":
+    from edsdk.api import *
+elif BACKEND == "simulated":
+    from edsdk.simulated import *
+else:
+    raise ImportError(
+        f"Unknown EDSDK_BACKEND {BACKEND!r}; expected 'native' or 'simulated'"
+    )
 from edsdk.constants import *
@@ -1,4 +1,4 @@
-from typing import Tuple, Dict, Callable, Any, Union
+from typing import Tuple, Dict, Callable, Any, Iterable, Optional, Union
 from edsdk.constants import (
     CameraStatusCommand,
     ProgressOption,
@@ -11,10 +11,12 @@ from edsdk.constants import (
     FileCreateDisposition,
     DataType,
     ImageSource,
+    SeekOrigin,
     TargetImageType,
 )
 
-class EdsObject: ...
+class EdsObject:
+    def __buffer__(self, flags: int) -> memoryview: ...
 
 def InitializeSDK() -> None:
     """Initializes the libraries
@@ -92,6 +94,42 @@ def GetPropertyData(
     """
     ...
 
+def GetPropertyDataBytes(
+    camera_or_image: EdsObject, property_id: PropID, param: int = 0
+) -> bytes:
+    """Gets the raw, undecoded property data from the designated object.
+
+    The data is read straight into the returned bytes with the GIL released.
+        Use it for large structures such as FocusInfo, see edsdk.focus_info.
+
+    :param EdsObject camera_or_image: The reference of the item.
+    :param PropID property_id: The PropertyID.
+    :param int param: Specify an index in case there are two or
+        more values over the same ID, defaults to 0.
+    :raises EdsError: Any of the sdk errors.
+    :return bytes: The property data, laid out as the EDSDK structure.
+    """
+    ...
+
+def GetPropertyDataMany(
+    camera_or_image: EdsObject,
+    properties: Iterable[Union[PropID, int, Tuple[Union[PropID, int], int]]],
+) -> Tuple[Any, ...]:
+    """Gets several properties from the designated object in one call.
+
+    All the size and data requests are made with the GIL released,
+        into a single buffer shared by the whole batch.
+
+    :param EdsObject camera_or_image: The reference of the item.
+    :param Iterable[Union[PropID, Tuple[PropID, int]]] properties: The
+        PropertyIDs to get, optionally paired with the param index.
+    :raises EdsError: Only for errors that are not specific to a property.
+    :return Tuple[Any, ...]: The property values, in request order.
+        A property that could not be read is returned as the exception
+        instance (usually an EdsError) instead of being raised.
+    """
+    ...
+
 def SetPropertyData(
     camera_or_image: EdsObject, property_id: PropID, param: int, data: Any
 ) -> None:
@@ -249,6 +287,7 @@ def Download(dir_item: EdsObject, size: int, stream: EdsObject) -> None:
     :param EdsObject dir_item: The directory item.
     :param int size: The number of bytes to be retrieved.
     :param EdsObject stream: The stream.
+    :raises BufferError: The stream memory is exported through a memoryview.
     :raises EdsError: Any of the sdk errors.
     """
     ...
@@ -275,15 +314,16 @@ def DownloadComplete(dir_item: EdsObject) -> None:
     """
     ...
 
-def DownloadThumbnail(dir_item: EdsObject) -> EdsObject:
+def DownloadThumbnail(dir_item: EdsObject, stream: EdsObject) -> None:
     """Extracts and downloads thumbnail information from image files in a camera.
     Thumbnail information in the camera's image files is downloaded
         to the host computer.
     Downloaded thumbnails are sent directly to a file stream created in advance.
 
     :param EdsObject dir_item: The directory item.
+    :param EdsObject stream: The file or memory stream receiving the thumbnail.
+    :raises BufferError: The stream memory is exported through a memoryview.
     :raises EdsError: Any of the sdk errors.
-    :return EdsObject: The stream.
     """
     ...
 
@@ -352,6 +392,66 @@ def CreateMemoryStreamFromPointer(
     """
     ...
 
+def GetPointer(stream: EdsObject) -> memoryview:
+    """Gets the memory of a stream created in host memory,
+        such as by CreateMemoryStream.
+    The returned memoryview shares the stream memory (no copy is made)
+        and keeps the stream alive. It covers GetLength(stream) bytes.
+    Writing past the end of a stream created with CreateMemoryStream
+        reallocates its memory, so take the view after the stream is filled;
+        Write, Download, CopyData, etc. raise BufferError while views exist.
+
+    EdsObject also supports the buffer protocol directly, so memory streams
+        can be passed to memoryview(), numpy.frombuffer(), etc.
+
+    :param EdsObject stream: The stream.
+    :raises BufferError: The stream has no host memory (e.g. file streams).
+    :return memoryview: The stream memory.
+    """
+    ...
+
+def Read(stream: EdsObject, read_size: int) -> bytes:
+    """Reads data the size of read_size into the buffer,
+        starting at the current read or write position of the stream.
+    The size of data actually read can be designated in the return value.
+
+    :param EdsObject stream: The stream or image.
+    :param int read_size: The number of bytes to read.
+    :raises EdsError: Any of the sdk errors.
+    :return bytes: The data read.
+    """
+    ...
+
+def Write(stream: EdsObject, data: Union[bytes, bytearray, memoryview]) -> int:
+    """Writes data of a designated buffer
+        to the current read or write position of the stream.
+
+    :param EdsObject stream: The stream or image.
+    :param Union[bytes, bytearray, memoryview] data: The data to write.
+    :raises BufferError: The stream memory is exported through a memoryview.
+    :raises EdsError: Any of the sdk errors.
+    :return int: The number of bytes written.
+    """
+    ...
+
+def Seek(stream: EdsObject, offset: int, origin: SeekOrigin) -> None:
+    """Moves the read or write position of the stream
+        (that is, the file position indicator).
+
+    :param EdsObject stream: The stream or image.
+    :param int offset: Number of bytes to move the pointer.
+    :param SeekOrigin origin: Pointer movement mode.
+        Must be one of the following values.
+            SeekOrigin.Cur
+                Move the stream pointer offset bytes from the current position.
+            SeekOrigin.Begin
+                Move the stream pointer offset bytes from the beginning of the stream.
+            SeekOrigin.End
+                Move the stream pointer offset bytes from the end of the stream.
+    :raises EdsError: Any of the sdk errors.
+    """
+    ...
+
 def GetPosition(stream_or_image: EdsObject) -> int:
     """Gets the current read or write position of the stream
         (that is, the file position indicator).
@@ -384,11 +484,16 @@ def CopyData(
     :param EdsObject in_stream_or_image: The input stream or image.
     :param int write_size: The number of bytes to copy.
     :param EdsObject out_stream_or_image: The output stream or image.
+    :raises BufferError: The output stream memory is exported through a memoryview.
+    :raises EdsError: Any of the sdk errors.
     """
     ...
 
 def SetProgressCallback(
-    camera: EdsObject, callback: Callable, option: ProgressOption
+    stream_or_image: EdsObject,
+    callback: Optional[Callable],
+    option: ProgressOption,
+    context: Optional[Any] = None,
 ) -> None:
     """Register a progress callback function.
     An event is received as notification of progress during processing that
@@ -399,8 +504,11 @@ def SetProgressCallback(
     This timing can be used in updating on-screen progress bars, for example.
 
     :param EdsObject stream_or_image: the stream or image object.
-    :param Callable callback: The callback function.
-        Expected signature (percent: int, cancel: bool) -> int.
+    :param Optional[Callable] callback: The callback function,
+        or None to unregister the current one.
+        Expected signature
+            (percent: int, cancel: bool, context: Optional[Any] = None) -> int.
+        Return EDS_ERR_OPERATION_CANCELLED (0x05) to cancel the operation.
     :param ProgressOption option: The option about progress is specified.
         Must be one of the following values.
             ProgressOption.Done
@@ -506,21 +614,23 @@ def DownloadEvfImage(camera: EdsObject, evf_image: EdsObject) -> None:
 
     :param EdsObject camera: The camera.
     :param EdsObject evf_image: The EVFData.
+    :raises BufferError: The stream memory is exported through a memoryview.
     :raises EdsError: Any of the sdk errors.
     """
     ...
 
-def SetCameraAddedHandler(callback: Callable) -> None:
+def SetCameraAddedHandler(callback: Optional[Callable]) -> None:
     """Registers a callback function for when a camera is detected.
 
-    :param Callable callback: the callback called when a camera is connected.
+    :param Optional[Callable] callback: the callback called when a camera
+        is connected, or None to unregister the current one.
         Expected signature () -> int.
     :raises EdsError: Any of the sdk errors.
     """
     ...
 
 def SetPropertyEventHandler(
-    camera: EdsObject, event: PropertyEvent, callback: Callable
+    camera: EdsObject, event: PropertyEvent, callback: Optional[Callable]
 ) -> None:
     """Registers a callback function for receiving status
             change notification events for property states on a camera.
@@ -528,14 +638,15 @@ def SetPropertyEventHandler(
     :param EdsObject camera: the camera object.
     :param PropertyEvent event: the event to be supplemented.
         To designate all events, use PropertyEvent.All.
-    :param Callable callback: the callback for receiving events.
+    :param Optional[Callable] callback: the callback for receiving events,
+        or None to unregister the current one.
         Expected signature (event: StateEvent, prop_id: PropID, param: int) -> int.
     :raises EdsError: Any of the sdk errors.
     """
     ...
 
 def SetObjectEventHandler(
-    camera: EdsObject, event: ObjectEvent, callback: Callable
+    camera: EdsObject, event: ObjectEvent, callback: Optional[Callable]
 ) -> None:
     """Registers a callback function for receiving status
             change notification events for objects on a remote camera.
@@ -545,14 +656,15 @@ def SetObjectEventHandler(
     :param EdsObject camera: the camera object.
     :param ObjectEvent event: the event to be supplemented.
         To designate all events, use ObjectEvent.All.
-    :param Callable callback: the callback for receiving events.
+    :param Optional[Callable] callback: the callback for receiving events,
+        or None to unregister the current one.
         Expected signature (event: ObjectEvent, obj_ref: EdsObject) -> int.
     :raises EdsError: Any of the sdk errors.
     """
     ...
 
 def SetCameraStateEventHandler(
-    camera: EdsObject, event: StateEvent, callback: Callable
+    camera: EdsObject, event: StateEvent, callback: Optional[Callable]
 ) -> None:
     """Registers a callback function for receiving status
             change notification events for property states on a camera
@@ -560,7 +672,8 @@ def SetCameraStateEventHandler(
     :param EdsObject camera: the camera object.
     :param StateEvent event: the event to be supplemented.
         To designate all events, use StateEvent.All.
-    :param Callable callback: the callback for receiving the events.
+    :param Optional[Callable] callback: the callback for receiving the events,
+        or None to unregister the current one.
         Expected signature (event: StateEvent, event_data: int) -> int.
     :raises EdsError: Any of the sdk errors.
     """
@@ -4,9 +4,36 @@ import os
 import json
 import io
 import asyncio
+import atexit
+import bisect
+import concurrent.futures
+import contextlib
+import functools
+import queue
+import re
+import string
+import threading
 import time
 import uuid
-from typing import Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING, Type
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+    Type,
+)
 
 # Only imported for type checking to avoid runtime cost if deps not installed
 if TYPE_CHECKING:  # pragma: no cover
@@ -22,8 +49,11 @@ from edsdk import (
     EdsObject,
     FileCreateDisposition,
     ObjectEvent,
+    ProgressOption,
     PropID,
     PropertyEvent,
+    SeekOrigin,
+    StateEvent,
 )
 from edsdk.constants.properties import (
     Av as AvTable,
@@ -40,22 +70,142 @@ from edsdk.constants.properties import (
     AFMode,
     EvfAFMode,
 )
+from edsdk import instrumentation
+from edsdk.focus_info import FocusInfo, get_focus_info
 
 
 # Public callback / return type aliases (after imports to satisfy linters)
 ObjectCallback = Callable[["ObjectEvent", "EdsObject"], int]
 PropertyCallback = Callable[["PropertyEvent", "PropID", int], int]
-LiveViewData = Union[bytes, str]
+StateCallback = Callable[["StateEvent", int], int]
+ProgressCallback = Callable[["TransferProgress"], None]
+PreviewCallback = Callable[["Preview"], Optional[bool]]
+LiveViewData = Union[bytes, memoryview, str]
+
+
+class ShotTiming(NamedTuple):
+    """Timestamps of one burst shot, in time.monotonic() seconds.
+
+    path is the first file of the shot and paths all of them (RAW+JPEG shots
+    have two). The transfer times span every file of the shot.
+    """
+
+    index: int
+    path: str
+    triggered: float
+    transfer_requested: float
+    transfer_started: float
+    transfer_done: float
+    paths: Tuple[str, ...] = ()
+
+
+class RigShot(NamedTuple):
+    """Outcome of one body in CameraRig.trigger(), in time.perf_counter() seconds.
+
+    triggered is when the body accepted TakePicture, and skew how much later
+    that was than on the first body. error is set (and the timings may be None)
+    when the body failed to arm, shoot or transfer.
+    """
+
+    camera: int
+    path: Optional[str]
+    triggered: Optional[float]
+    skew: Optional[float]
+    transfer_time: Optional[float]
+    error: Optional[BaseException] = None
+
+
+class LiveViewFrame(NamedTuple):
+    """A live view frame delivered by LiveViewStream.
+
+    data is a view into the stream's ring buffer and stays valid until the next
+    get()/poll() on the stream. image is the result of the stream's decode
+    callable (None without one).
+    """
+
+    seq: int
+    timestamp: float
+    data: memoryview
+    image: Any = None
+
+
+class TransferProgress(NamedTuple):
+    """Progress of one file download, as reported to on_progress().
+
+    bytes_done is derived from the SDK's percentage. mb_per_s is the rate
+    since the previous report (10**6 bytes per second) and elapsed the time
+    since the attempt started. attempt grows when a stalled download is
+    retried.
+    """
+
+    filename: str
+    percent: int
+    bytes_done: int
+    total_bytes: int
+    mb_per_s: float
+    elapsed: float
+    attempt: int
+
+
+class Preview(NamedTuple):
+    """Embedded thumbnail of a transferred file, delivered before the file itself.
+
+    filename is the name the full file is saved under. requested and received
+    are the time.monotonic() of the transfer event and of the thumbnail's
+    arrival.
+    """
+
+    filename: str
+    data: bytes
+    requested: float
+    received: float
+
+
+class TransferSkipped(Exception):
+    """A captured file was not downloaded because enable_previews() skipped it.
+
+    Raised by capture() for a frame the preview callback rejected, or for
+    every frame with enable_previews(download=False). The shot was taken but
+    no file was saved.
+    """
+
+    def __init__(self, filename: str, reason: str) -> None:
+        super().__init__(f"Transfer of {filename} skipped: {reason}")
+        self.filename = filename
+
+
+# Live view frames are downloaded into a reusable host buffer. Canon EVF JPEGs are
+# typically well below 1 MB; the buffer grows on demand up to the upper bound.
+_EVF_BUFFER_SIZE = 2 * 1024 * 1024
+_EVF_BUFFER_MAX = 32 * 1024 * 1024
+# Errors reported when a frame does not fit in a fixed-size memory stream
+_ERR_STREAM_FULL = (0x000000A8, 0x000000AC)  # STREAM_WRITE_ERROR, STREAM_END_OF_STREAM
+# Returned by TakePicture while the body's buffer is full during a burst
+_ERR_DEVICE_BUSY = 0x00000081
+# Returned by DownloadEvfImage until the next frame is ready
+_ERR_OBJECT_NOT_READY = 0x0000A102
+# Returned by a progress callback to cancel the download
+_ERR_OPERATION_CANCELLED = 0x00000005
+_BUSY_RETRY_DELAY = 0.02
+# Low 16 bits of an ImageQuality code when there is no secondary (JPEG) image
+_QUALITY_NO_SECONDARY = 0xFF0F
+# How often an idle SdkExecutor pumps SDK events
+_IDLE_PUMP_INTERVAL = 0.05
+# Characters kept when a port name is used as a directory name
+_UNSAFE_PATH_CHARS_RE = re.compile(r"[^\w.-]+")
 
 
 # Windows message pumping for EDSDK callbacks
 if os.name == "nt":
     try:
         import pythoncom  # type: ignore
+        import win32event  # type: ignore
     except Exception:  # pragma: no cover - optional dependency
         pythoncom = None  # type: ignore
+        win32event = None  # type: ignore
 else:  # pragma: no cover - not required outside Windows
     pythoncom = None  # type: ignore
+    win32event = None  # type: ignore
 
 
 def _pump_messages_once() -> None:
@@ -63,25 +213,558 @@ def _pump_messages_once() -> None:
         pythoncom.PumpWaitingMessages()
 
 
+def _pump_sdk_events() -> None:
+    """Deliver pending SDK events to this thread's callbacks."""
+    if pythoncom is not None:
+        pythoncom.PumpWaitingMessages()
+        return
+    # Only fails while the SDK is not initialized; there is nothing to deliver then
+    with contextlib.suppress(Exception):
+        edsdk.GetEvent()
+
+
+@contextlib.contextmanager
+def _com_initialized() -> Iterator[None]:
+    """Initialise COM for SDK calls made from a worker thread (Windows)."""
+    if pythoncom is None:
+        yield
+        return
+    pythoncom.CoInitialize()
+    try:
+        yield
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def _resolve_future(future: asyncio.Future, result: Any) -> None:
+    """Set an asyncio future's result unless it was cancelled (runs on its loop)."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _fail_future(future: asyncio.Future, error: BaseException) -> None:
+    """Set an asyncio future's exception unless it was cancelled (runs on its loop)."""
+    if not future.done():
+        future.set_exception(error)
+
+
+class _EventWaiter:
+    """Block until a condition signalled by SDK callbacks (or other threads) holds.
+
+    On Windows the SDK delivers callbacks through the message queue of the thread
+    that opened the session, so waiting pumps messages and wakes up as soon as a
+    message is posted or notify() is called. Elsewhere callbacks arrive on SDK
+    threads and a plain Condition is used.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._wake = (
+            win32event.CreateEvent(None, False, False, None)
+            if win32event is not None
+            else None
+        )
+
+    def notify(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+        if self._wake is not None:
+            win32event.SetEvent(self._wake)
+
+    def wait_until(self, predicate: Callable[[], bool], timeout: float) -> bool:
+        """Return True once predicate() holds, False if timeout elapses first."""
+        deadline = time.monotonic() + timeout
+        while True:
+            _pump_messages_once()
+            with self._cond:
+                if predicate():
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if self._wake is None:
+                    self._cond.wait(remaining)
+                    continue
+            win32event.MsgWaitForMultipleObjects(
+                [self._wake], False, int(remaining * 1000) + 1, win32event.QS_ALLINPUT
+            )
+
+
+class SdkLifetime:
+    """Process-wide, thread-safe owner of InitializeSDK/TerminateSDK.
+
+    Every user of the SDK (CameraController, CameraRig, ...) brackets its work
+    with acquire()/release() or hold(). The SDK is initialized on the first
+    acquire() and terminated when the last user releases it, or at interpreter
+    exit. Set keep_alive (or keep an outer hold() open) to keep the SDK
+    initialized between sessions, so reopening a camera does not pay for a
+    full SDK init and teardown.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._users = 0
+        self._initialized = False
+        self._atexit_registered = False
+        self.keep_alive = False
+
+    @property
+    def users(self) -> int:
+        return self._users
+
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+
+    def acquire(self) -> None:
+        with self._lock:
+            if not self._initialized:
+                edsdk.InitializeSDK()
+                self._initialized = True
+                if not self._atexit_registered:
+                    atexit.register(self.terminate)
+                    self._atexit_registered = True
+            self._users += 1
+
+    def release(self) -> None:
+        with self._lock:
+            if self._users <= 0:
+                raise RuntimeError("SDK released more often than acquired")
+            self._users -= 1
+            if self._users == 0 and not self.keep_alive:
+                self._terminate()
+
+    @contextlib.contextmanager
+    def hold(self) -> Iterator[None]:
+        """Keep the SDK initialized for the duration of the block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def terminate(self) -> None:
+        """Terminate the SDK now, whatever the number of users (atexit hook)."""
+        with self._lock:
+            self._terminate()
+
+    def _terminate(self) -> None:
+        if not self._initialized:
+            return
+        self._initialized = False
+        try:
+            edsdk.TerminateSDK()
+        except Exception:
+            pass
+
+
+# Shared by every controller in the process
+sdk_lifetime = SdkLifetime()
+
+
+# Marks a property cache miss (None is a valid cached value)
+_MISSING = object()
+
+
+class _SupportedCodes(NamedTuple):
+    """Supported codes of a property descriptor, in camera order and as a set."""
+
+    ordered: Tuple[int, ...]
+    members: FrozenSet[int]
+
+
+_NO_SUPPORTED_CODES = _SupportedCodes((), frozenset())
+
+
+class _PropertyCache:
+    """Property values and descriptors kept coherent by SDK property events.
+
+    Values are keyed by (PropID, param) and descriptors (the supported codes)
+    by PropID. PropertyChanged drops the cached values of that property and
+    PropertyDescChanged its descriptor. Every invalidation bumps a generation,
+    so a read that raced with an event does not store what it fetched.
+    Entries older than max_age seconds count as misses, in case an event was
+    never delivered. Descriptors are always cached; values only when
+    cache_values is set.
+    """
+
+    def __init__(
+        self, max_age: Optional[float] = None, cache_values: bool = True
+    ) -> None:
+        self.max_age = max_age
+        self.cache_values = cache_values
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[int, int], Tuple[Any, float]] = {}
+        self._descs: Dict[int, Tuple[_SupportedCodes, float]] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def _lookup(self, table: Dict[Any, Tuple[Any, float]], key: Any) -> Any:
+        with self._lock:
+            entry = table.get(key)
+            if entry is not None and (
+                self.max_age is None or time.monotonic() - entry[1] <= self.max_age
+            ):
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+            return _MISSING
+
+    def _store(
+        self, table: Dict[Any, Tuple[Any, float]], key: Any, value: Any, generation: int
+    ) -> None:
+        with self._lock:
+            if generation == self._generation:
+                table[key] = (value, time.monotonic())
+
+    def get_value(self, pid: int, param: int = 0) -> Any:
+        return self._lookup(self._values, (int(pid), int(param)))
+
+    def put_value(self, pid: int, param: int, value: Any, generation: int) -> None:
+        self._store(self._values, (int(pid), int(param)), value, generation)
+
+    def get_desc(self, pid: int) -> Any:
+        return self._lookup(self._descs, int(pid))
+
+    def put_desc(self, pid: int, codes: _SupportedCodes, generation: int) -> None:
+        self._store(self._descs, int(pid), codes, generation)
+
+    def invalidate(self, event: int, prop_id: int) -> None:
+        pid = int(prop_id)
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            if pid == int(PropID.Unknown):
+                self._values.clear()
+                self._descs.clear()
+                return
+            if event != PropertyEvent.PropertyDescChanged:
+                for key in [k for k in self._values if k[0] == pid]:
+                    del self._values[key]
+            if event != PropertyEvent.PropertyChanged:
+                self._descs.pop(pid, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._values.clear()
+            self._descs.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "values": len(self._values),
+                "descs": len(self._descs),
+            }
+
+
+def _download_thumbnail(object_handle: EdsObject) -> bytes:
+    """The thumbnail (a small JPEG) embedded in a directory item's file."""
+    stream = edsdk.CreateMemoryStream(0)
+    edsdk.DownloadThumbnail(object_handle, stream)
+    return bytes(edsdk.GetPointer(stream))
+
+
+def _shot_key(info: Optional[Dict[str, Any]], path: str) -> Union[int, str]:
+    """Identifies the shot a file belongs to: the SDK group ID, else the file stem.
+
+    The files of a RAW+JPEG shot share both (IMG_0001.CR3 / IMG_0001.JPG).
+    """
+    if info is not None:
+        if info.get("groupID"):
+            return int(info["groupID"])
+        if info.get("szFileName"):
+            return os.path.splitext(info["szFileName"])[0]
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+class _BurstFiles:
+    """Downloaded files of a burst, grouped into shots in order of arrival.
+
+    Written by the transfer worker only; count and complete are read by the
+    triggering thread.
+    """
+
+    def __init__(self, files_per_shot: int) -> None:
+        self.files_per_shot = files_per_shot
+        # Files downloaded, and shots with all their files downloaded
+        self.count = 0
+        self.complete = 0
+        self._shots: Dict[Any, List[Tuple[str, float, float, float]]] = {}
+
+    def add(
+        self,
+        key: Any,
+        path: str,
+        requested: float,
+        started: float,
+        finished: float,
+    ) -> None:
+        shot = self._shots.setdefault(key, [])
+        shot.append((path, requested, started, finished))
+        if len(shot) == self.files_per_shot:
+            self.complete += 1
+        self.count += 1
+
+    def shots(self) -> List[List[Tuple[str, float, float, float]]]:
+        return list(self._shots.values())
+
+
+class _DownloadMonitor:
+    """Progress callback and stall state of one download attempt."""
+
+    def __init__(
+        self,
+        controller: "CameraController",
+        object_handle: EdsObject,
+        filename: str,
+        total_bytes: int,
+        attempt: int,
+        stall_timeout: Optional[float] = None,
+    ) -> None:
+        self._controller = controller
+        self.object_handle = object_handle
+        self.filename = filename
+        self.total_bytes = total_bytes
+        self.attempt = attempt
+        self.stall_timeout = stall_timeout
+        self.started = self.last_progress = time.monotonic()
+        self._percent = 0
+        # Set when the download was cancelled for making no progress
+        self.stalled = False
+
+    def attach(self, stream: EdsObject) -> None:
+        edsdk.SetProgressCallback(
+            stream, self._on_progress, ProgressOption.Periodically
+        )
+
+    def _on_progress(self, percent: int, cancel: bool) -> int:
+        # Periodic callbacks keep coming while no data arrives; a stalled
+        # download is cancelled from here, on the thread running Download()
+        now = time.monotonic()
+        if percent <= self._percent:
+            if (
+                self.stall_timeout is not None
+                and now - self.last_progress > self.stall_timeout
+            ):
+                if not self.stalled:
+                    self._controller._log(
+                        f"Download of {self.filename} stalled for "
+                        f"{self.stall_timeout:.3g}s; cancelling"
+                    )
+                self.stalled = True
+                return _ERR_OPERATION_CANCELLED
+            return 0
+        done = self.total_bytes * percent // 100
+        delta = done - self.total_bytes * self._percent // 100
+        interval = now - self.last_progress
+        self._percent = percent
+        self.last_progress = now
+        self._controller._report_progress(
+            TransferProgress(
+                self.filename,
+                percent,
+                done,
+                self.total_bytes,
+                delta / interval / 1e6 if interval > 0 else 0.0,
+                now - self.started,
+                self.attempt,
+            )
+        )
+        return 0
+
+
 def _save_directory_item(
-    object_handle: EdsObject, save_dir: str, dst_basename: Optional[str] = None
+    object_handle: EdsObject,
+    save_dir: str,
+    dst_basename: Optional[str] = None,
+    info: Optional[Dict[str, Any]] = None,
+    monitor: Optional[_DownloadMonitor] = None,
 ) -> str:
-    info = edsdk.GetDirectoryItemInfo(object_handle)
+    if info is None:
+        info = edsdk.GetDirectoryItemInfo(object_handle)
     orig_name = info.get("szFileName") or f"{uuid.uuid4()}.bin"
     filename = dst_basename or orig_name
     # sanitize path separators in provided name
     filename = filename.replace("\\", "_").replace("/", "_")
     dst = os.path.join(save_dir, filename)
-    out_stream = edsdk.CreateFileStream(
-        dst,
-        FileCreateDisposition.CreateAlways,
-        Access.ReadWrite,
-    )
-    edsdk.Download(object_handle, info["size"], out_stream)
-    edsdk.DownloadComplete(object_handle)
+    with instrumentation.span("transfer.download", info["size"]):
+        out_stream = edsdk.CreateFileStream(
+            dst,
+            FileCreateDisposition.CreateAlways,
+            Access.ReadWrite,
+        )
+        if monitor is not None:
+            monitor.attach(out_stream)
+        edsdk.Download(object_handle, info["size"], out_stream)
+        edsdk.DownloadComplete(object_handle)
     return dst
 
 
+def _download_directory_item(
+    object_handle: EdsObject,
+    dst_basename: Optional[str] = None,
+    info: Optional[Dict[str, Any]] = None,
+    monitor: Optional[_DownloadMonitor] = None,
+) -> Tuple[str, bytearray]:
+    """Download a directory item into memory; returns (filename, data)."""
+    if info is None:
+        info = edsdk.GetDirectoryItemInfo(object_handle)
+    orig_name = info.get("szFileName") or f"{uuid.uuid4()}.bin"
+    filename = (dst_basename or orig_name).replace("\\", "_").replace("/", "_")
+    size = info["size"]
+    data = bytearray(size)
+    with instrumentation.span("transfer.download", size):
+        if size:
+            # The SDK writes straight into data; the stream is released on return
+            stream = edsdk.CreateMemoryStreamFromPointer(data)
+            if monitor is not None:
+                monitor.attach(stream)
+            edsdk.Download(object_handle, size, stream)
+        edsdk.DownloadComplete(object_handle)
+    return filename, data
+
+
+# Fields available to file_pattern and dir_pattern
+_PATTERN_FIELDS = frozenset(
+    {"basename", "ext", "timestamp", "date", "year", "month", "day", "seq"}
+)
+_CLOCK_FIELDS = frozenset({"timestamp", "date", "year", "month", "day"})
+
+
+# Used to check a pattern's format specs once, up front
+_SAMPLE_PATTERN_VALUES: Dict[str, Any] = {
+    "basename": "IMG_0001",
+    "ext": "JPG",
+    "timestamp": "20250101_000000",
+    "date": "20250101",
+    "year": "2025",
+    "month": "01",
+    "day": "01",
+    "seq": 1,
+}
+
+
+def _pattern_fields(pattern: str) -> FrozenSet[str]:
+    """Names used by a str.format pattern; raises ValueError if it cannot format."""
+    fields: Set[str] = set()
+    for _text, field, _spec, _conversion in string.Formatter().parse(pattern):
+        if field is None:
+            continue
+        name = re.split(r"[.\[]", field, maxsplit=1)[0]
+        if name not in _PATTERN_FIELDS:
+            raise ValueError(
+                f"Unknown field {{{field}}} in pattern {pattern!r}; "
+                f"available: {', '.join(sorted(_PATTERN_FIELDS))}"
+            )
+        fields.add(name)
+    try:
+        pattern.format(**_SAMPLE_PATTERN_VALUES)
+    except (ValueError, TypeError, KeyError, IndexError, AttributeError) as e:
+        raise ValueError(f"Invalid pattern {pattern!r}: {e}") from e
+    return frozenset(fields)
+
+
+class _FilenamePlanner:
+    """Destination directory and base name of each transferred file.
+
+    Patterns are parsed once, so a transfer only computes the fields they use:
+    time fields are rendered at most once per second, sequence numbers are
+    reserved under a lock (transfers may be planned concurrently), and each
+    output directory is created once.
+    """
+
+    def __init__(
+        self,
+        file_pattern: Optional[str],
+        dir_pattern: Optional[str] = None,
+        seq_start: int = 1,
+    ) -> None:
+        self._file_pattern = file_pattern
+        self._dir_pattern = dir_pattern
+        self._file_fields = _pattern_fields(file_pattern) if file_pattern else None
+        self._dir_fields = _pattern_fields(dir_pattern) if dir_pattern else None
+        self._seq = int(seq_start)
+        self._lock = threading.Lock()
+        # (epoch second, time fields) of the last rendered clock
+        self._clock: Tuple[int, Dict[str, str]] = (-1, {})
+        self._created: Set[str] = set()
+
+    def plan(
+        self, save_dir: str, orig_name: str, explicit: Optional[str] = None
+    ) -> Tuple[str, Optional[str]]:
+        """(directory, base name) for a transfer; base name None keeps orig_name.
+
+        explicit, a one-shot name from capture(filename=...), takes precedence
+        over file_pattern and keeps the camera's extension.
+        """
+        fields: Set[str] = set()
+        if self._dir_fields:
+            fields |= self._dir_fields
+        if explicit is None and self._file_fields:
+            fields |= self._file_fields
+        values: Dict[str, Any] = {}
+        if fields:
+            base, ext = os.path.splitext(orig_name)
+            values["basename"] = base
+            values["ext"] = ext.lstrip(".") or "bin"
+            if not fields.isdisjoint(_CLOCK_FIELDS):
+                values.update(self._clock_fields())
+            if "seq" in fields:
+                with self._lock:
+                    values["seq"] = self._seq
+                    self._seq += 1
+        directory = save_dir
+        if self._dir_pattern:
+            directory = os.path.join(save_dir, self._dir_pattern.format(**values))
+        self.ensure_dir(directory)
+        if explicit is not None:
+            provided = explicit.replace("\\", "_").replace("/", "_")
+            base_prov = os.path.splitext(provided)[0] or "image"
+            return directory, base_prov + (os.path.splitext(orig_name)[1] or ".bin")
+        if self._file_pattern:
+            return directory, self._file_pattern.format(**values)
+        return directory, None
+
+    def ensure_dir(self, directory: str) -> None:
+        if directory in self._created:
+            return
+        os.makedirs(directory, exist_ok=True)
+        self._created.add(directory)
+
+    def prepare(self, save_dir: str) -> None:
+        """Create save_dir, and the current dir_pattern folder if only time-based."""
+        self.ensure_dir(save_dir)
+        if self._dir_pattern and self._dir_fields is not None:
+            if self._dir_fields <= _CLOCK_FIELDS:
+                shard = self._dir_pattern.format(**self._clock_fields())
+                self.ensure_dir(os.path.join(save_dir, shard))
+
+    def _clock_fields(self) -> Dict[str, str]:
+        now = int(time.time())
+        second, fields = self._clock
+        if second != now:
+            t = time.localtime(now)
+            fields = {
+                "timestamp": time.strftime("%Y%m%d_%H%M%S", t),
+                "date": time.strftime("%Y%m%d", t),
+                "year": f"{t.tm_year:04d}",
+                "month": f"{t.tm_mon:02d}",
+                "day": f"{t.tm_mday:02d}",
+            }
+            self._clock = (now, fields)
+        return fields
+
+
 def _reverse_lookup(table: Dict[int, str]) -> Dict[str, int]:
     # Normalize keys to a canonical string for robust matching
     rev: Dict[str, int] = {}
@@ -110,6 +793,70 @@ def _reverse_lookup(table: Dict[int, str]) -> Dict[str, int]:
 _AV_STR_TO_CODE = _reverse_lookup(AvTable)
 _TV_STR_TO_CODE = _reverse_lookup(TvTable)
 
+# Properties read by CameraController.get_properties() in a single batch
+_SNAPSHOT_PROPERTIES = (
+    PropID.Av,
+    PropID.Tv,
+    PropID.ISOSpeed,
+    PropID.SaveTo,
+    PropID.AEMode,
+    PropID.MeteringMode,
+    PropID.WhiteBalance,
+    PropID.ImageQuality,
+    PropID.DriveMode,
+    PropID.AFMode,
+    PropID.Evf_AFMode,
+)
+
+# Properties set_properties() can validate against their descriptors
+_VALIDATED_PROPERTIES = (
+    PropID.Av,
+    PropID.Tv,
+    PropID.ISOSpeed,
+    PropID.AEMode,
+    PropID.MeteringMode,
+    PropID.WhiteBalance,
+    PropID.ImageQuality,
+    PropID.DriveMode,
+    PropID.AFMode,
+    PropID.Evf_AFMode,
+)
+
+# Tolerance for matching a numeric Av / Tv value against the tables
+_NUMERIC_MATCH_TOLERANCE = 1e-6
+
+
+def _numeric_table(
+    table: Dict[int, str], to_number: Callable[[str], float]
+) -> Tuple[List[float], List[int]]:
+    """Sorted (values, codes) of the table entries with a numeric display value.
+
+    For equal values the first entry of the table wins.
+    """
+    entries: Dict[float, int] = {}
+    for code, disp in table.items():
+        try:
+            value = to_number(disp)
+        except Exception:
+            continue
+        entries.setdefault(value, code)
+    values = sorted(entries)
+    return values, [entries[v] for v in values]
+
+
+def _nearest_code(
+    values: List[float], codes: List[int], target: float
+) -> Optional[Tuple[int, float]]:
+    """Return (code, abs error) of the entry closest to target, by bisection."""
+    i = bisect.bisect_left(values, target)
+    best: Optional[Tuple[int, float]] = None
+    for j in (i - 1, i):
+        if 0 <= j < len(values):
+            err = abs(values[j] - target)
+            if best is None or err < best[1]:
+                best = (codes[j], err)
+    return best
+
 
 def _parse_av(value: Union[str, float, int]) -> int:
     if isinstance(value, (int, float)):
@@ -119,6 +866,9 @@ def _parse_av(value: Union[str, float, int]) -> int:
         key2 = f"f/{float(value):g}"
         if key2 in _AV_STR_TO_CODE:
             return _AV_STR_TO_CODE[key2]
+        best = _nearest_code(_AV_VALUES, _AV_CODES, float(value))
+        if best is not None and best[1] < _NUMERIC_MATCH_TOLERANCE:
+            return best[0]
         raise ValueError(f"Unsupported Av value: {value}")
     key = str(value).strip().lower()
     key = key.replace("f ", "f/") if key.startswith("f ") else key
@@ -147,17 +897,9 @@ def _parse_tv(value: Union[str, float, int]) -> int:
             c = c.lower()
             if c in _TV_STR_TO_CODE:
                 return _TV_STR_TO_CODE[c]
-        # Try to find nearest by computing numeric seconds of table
-        best: Optional[Tuple[int, float]] = None
-        for code, disp in TvTable.items():
-            try:
-                s = _tv_display_to_seconds(disp)
-            except Exception:
-                continue
-            err = abs(s - seconds)
-            if best is None or err < best[1]:
-                best = (code, err)
-        if best is not None and best[1] < 1e-6:  # exact or very close
+        # Nearest entry of the table by seconds (exact or very close only)
+        best = _nearest_code(_TV_SECONDS, _TV_CODES, seconds)
+        if best is not None and best[1] < _NUMERIC_MATCH_TOLERANCE:
             return best[0]
         raise ValueError(f"Unsupported Tv value: {value}")
     key = str(value).strip().lower()
@@ -175,15 +917,16 @@ def _parse_tv(value: Union[str, float, int]) -> int:
     raise ValueError(f"Unsupported Tv value: {value}")
 
 
-def _tv_display_to_seconds(display: str) -> float:
-    import re
+_TV_FRACTIONAL_SECONDS_RE = re.compile(r"(\d+)\"(\d)")
 
+
+def _tv_display_to_seconds(display: str) -> float:
     disp = str(display).strip()
     if disp.lower() == "bulb":
         raise ValueError("Bulb has no fixed seconds")
     # Canon style: 0"5 -> 0.5s, 3"2 -> 3.2s, 30" -> 30s
     if '"' in disp:
-        m = re.fullmatch(r"(\d+)\"(\d)", disp)
+        m = _TV_FRACTIONAL_SECONDS_RE.fullmatch(disp)
         if m:
             return float(f"{m.group(1)}.{m.group(2)}")
         # pure seconds like 30"
@@ -201,6 +944,10 @@ def _tv_display_to_seconds(display: str) -> float:
     return float(d)
 
 
+_TV_SECONDS, _TV_CODES = _numeric_table(TvTable, _tv_display_to_seconds)
+_AV_VALUES, _AV_CODES = _numeric_table(AvTable, float)
+
+
 def _parse_iso(value: Union[str, int]) -> int:
     if isinstance(value, int):
         if value == 0:
@@ -244,7 +991,15 @@ class CameraController:
         register_property_events: bool = True,
         file_pattern: Optional[str] = None,
         seq_start: int = 1,
+        dir_pattern: Optional[str] = None,
+        property_cache: bool = False,
+        property_cache_max_age: Optional[float] = None,
+        prewarm_supported: bool = False,
+        stall_timeout: Optional[float] = None,
+        stall_retries: int = 2,
     ) -> None:
+        if stall_timeout is not None and stall_timeout <= 0:
+            raise ValueError("stall_timeout must be > 0")
         self.index = index
         self.save_dir = save_dir
         self.save_to = save_to
@@ -253,22 +1008,63 @@ class CameraController:
         self._log = logger or (print if verbose else (lambda *_args, **_kw: None))
         self._cam: Optional[EdsObject] = None
         self._saved_paths: List[str] = []
+        # Images downloaded by capture_bytes(): (planned directory, filename, data)
+        self._captured_data: List[Tuple[str, str, bytearray]] = []
+        self._download_to_memory: bool = False
+        self._transfer_count: int = 0
+        # Set when a transfer outside capture_burst() failed for good
+        self._transfer_error: Optional[Exception] = None
+        self._transfer_waiter = _EventWaiter()
+        # asyncio futures resolved, in order, by the next transfers
+        # (AsyncCameraController.capture)
+        self._transfer_futures: Deque[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = deque()
+        # Set during capture_burst(): transfers are handed to the download worker
+        self._transfer_queue: Optional[queue.Queue] = None
         self._obj_cb: Optional[ObjectCallback] = None
         self._prop_cb: Optional[PropertyCallback] = None
+        self._state_cb: Optional[StateCallback] = None
+        self._progress_cb: Optional[ProgressCallback] = None
+        # Downloads without progress for stall_timeout seconds are cancelled
+        # and retried up to stall_retries times
+        self.stall_timeout = stall_timeout
+        self.stall_retries = stall_retries
+        # Thumbnail-first ingest (enable_previews): previews are delivered from
+        # the event handler, full downloads run on the ingest worker
+        self._previews: bool = False
+        self._preview_cb: Optional[PreviewCallback] = None
+        self._preview_queue: Optional[queue.Queue] = None
+        self._preview_download: bool = True
+        self._ingest_queue: Optional[queue.Queue] = None
+        self._ingest_worker: Optional[threading.Thread] = None
         self._live_view_on: bool = False
+        # Reusable in-memory live view target (buffer -> stream -> EvfImageRef)
+        self._evf_buffer_size: int = _EVF_BUFFER_SIZE
+        self._evf_buffer: Optional[bytearray] = None
+        self._evf_stream: Optional[EdsObject] = None
+        self._evf_image: Optional[EdsObject] = None
         # asyncio event queue support
         self._async_queue: Optional[asyncio.Queue[Dict[str, Union[str, int]]]] = None
         self._async_loop: Optional[asyncio.AbstractEventLoop] = None
         self._async_pumping: bool = False
         self._register_property_events = register_property_events
-        self._file_pattern = file_pattern
-        self._seq = int(seq_start)
+        # Destination of transferred files (file_pattern / dir_pattern)
+        self._planner = _FilenamePlanner(file_pattern, dir_pattern, seq_start)
         # One-shot explicit filename (base name); if set, next capture uses this name
         self._next_filename: Optional[str] = None
+        # Per-session cache of property descriptors (and, opt-in, values),
+        # invalidated by property events
+        self._prop_cache: Optional[_PropertyCache] = _PropertyCache(
+            property_cache_max_age, cache_values=property_cache
+        )
+        self._prewarm_supported = prewarm_supported
+        self._sdk_acquired = False
 
     # ---------- Lifecycle ----------
     def __enter__(self) -> "CameraController":
-        edsdk.InitializeSDK()
+        sdk_lifetime.acquire()
+        self._sdk_acquired = True
         cam_list = edsdk.GetCameraList()
         nr_cameras = edsdk.GetChildCount(cam_list)
         if nr_cameras == 0:
@@ -280,21 +1076,49 @@ class CameraController:
                 f"Camera index {self.index} out of range (found {nr_cameras})"
             )
         cam = edsdk.GetChildAtIndex(cam_list, self.index)
+        self._open_session(cam)
+        return self
+
+    def _open_session(self, cam: EdsObject) -> None:
+        """Open a session on an already enumerated camera and install handlers.
+
+        __enter__ does this after acquiring the SDK; callers holding the SDK
+        themselves (e.g. CameraRig) call it directly, paired with
+        _close_session().
+        """
         edsdk.OpenSession(cam)
 
         # Event handlers (property event can be suppressed to avoid noisy warnings)
         edsdk.SetObjectEventHandler(cam, ObjectEvent.All, self._on_object_event)
+        try:
+            edsdk.SetCameraStateEventHandler(cam, StateEvent.All, self._on_state_event)
+        except Exception as e:
+            self._log(f"Skip state events: {e}")
+        property_events = False
         if self._register_property_events:
             try:
                 edsdk.SetPropertyEventHandler(
                     cam, PropertyEvent.All, self._on_property_event
                 )
+                property_events = True
             except Exception as e:
                 # Non-fatal: log only if verbose
                 self._log(f"Skip property events: {e}")
+        if self._prop_cache is not None:
+            self._prop_cache.clear()
+            # Without events nothing would ever invalidate the cache
+            if not property_events and self._prop_cache.max_age is None:
+                self._log("Property cache disabled: property events not registered")
+                self._prop_cache = None
 
         # Save to host and capacity
         edsdk.SetPropertyData(cam, PropID.SaveTo, 0, int(self.save_to))
+        if self.save_to != SaveTo.Camera:
+            # Created now rather than on the callback thread of the first transfer
+            try:
+                self._planner.prepare(self.save_dir)
+            except OSError as e:
+                self._log(f"Cannot create {self.save_dir}: {e}")
         if self.auto_capacity:
             edsdk.SetCapacity(
                 cam,
@@ -306,80 +1130,118 @@ class CameraController:
             )
         self._cam = cam
         self._log("Camera session opened")
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> None:
-        try:
-            if self._cam is not None:
-                try:
-                    edsdk.CloseSession(self._cam)
-                except Exception:
-                    pass
-        finally:
+        if self._prewarm_supported:
+            self.prewarm_supported()
+
+    def _close_session(self) -> None:
+        """Close the session opened by _open_session(); the SDK stays initialized."""
+        self.disable_previews()
+        self._release_evf_stream()
+        if self._prop_cache is not None:
+            self._prop_cache.clear()
+        if self._cam is not None:
             try:
-                edsdk.TerminateSDK()
+                edsdk.CloseSession(self._cam)
             except Exception:
                 pass
         self._cam = None
         self._log("Camera session closed")
 
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._close_session()
+        finally:
+            if self._sdk_acquired:
+                self._sdk_acquired = False
+                sdk_lifetime.release()
+
     # ---------- Event handlers ----------
     def on_object(self, fn: ObjectCallback) -> None:
+        """Receive every object event, including transfers whose download failed."""
         self._obj_cb = fn
 
     def on_property(self, fn: PropertyCallback) -> None:
         self._prop_cb = fn
 
+    def on_state(self, fn: StateCallback) -> None:
+        self._state_cb = fn
+
+    def on_progress(self, fn: Optional[ProgressCallback]) -> None:
+        """Receive a TransferProgress for each download step (on the SDK thread)."""
+        self._progress_cb = fn
+
+    def enable_previews(
+        self,
+        callback: Optional[PreviewCallback] = None,
+        *,
+        preview_queue: Optional[queue.Queue] = None,
+        download: bool = True,
+    ) -> None:
+        """Deliver each file's thumbnail first and download the file in the background.
+
+        On every transfer request the thumbnail is downloaded and delivered as
+        a Preview to callback (on the SDK thread), to preview_queue and as an
+        async event of kind "preview", before the full file. Full downloads
+        then run in arrival order on a background thread, keeping the SDK
+        thread free for the next shot's preview. callback may return False to
+        reject a frame: its transfer is cancelled instead of downloaded and the
+        capture() waiting for it raises TransferSkipped. With download=False no
+        full file is downloaded (every capture() raises TransferSkipped).
+        capture_burst() downloads every file regardless. Stays on until
+        disable_previews() or the session closes.
+        """
+        self._preview_cb = callback
+        self._preview_queue = preview_queue
+        self._preview_download = download
+        if self._ingest_worker is None:
+            self._ingest_queue = queue.Queue()
+            self._ingest_worker = threading.Thread(
+                target=self._ingest_loop,
+                args=(self._ingest_queue,),
+                name="edsdk-ingest",
+                daemon=True,
+            )
+            self._ingest_worker.start()
+        self._previews = True
+
+    def disable_previews(self) -> None:
+        """Return to direct downloads once the queued background downloads finish."""
+        self._previews = False
+        worker, self._ingest_worker = self._ingest_worker, None
+        if worker is not None:
+            self._ingest_queue.put(None)
+            worker.join()
+            self._ingest_queue = None
+
     def _on_object_event(self, event: ObjectEvent, object_handle: EdsObject) -> int:
+        status = 0
         if event == ObjectEvent.DirItemRequestTransfer:
-            # compute custom filename if pattern is provided
-            dst_name: Optional[str] = None
-            # 1) Highest priority: explicitly specified next filename via capture(filename=...)
-            try:
-                info = edsdk.GetDirectoryItemInfo(object_handle)
-                orig_name = info.get("szFileName") or f"{uuid.uuid4()}.bin"
-            except Exception:
-                info = {}
-                orig_name = f"{uuid.uuid4()}.bin"
-            if self._next_filename:
-                # preserve original extension; ignore any extension in provided name
-                provided = self._next_filename.replace("\\", "_").replace("/", "_")
-                self._next_filename = None
-                base_prov, _ext_prov = os.path.splitext(provided)
-                if not base_prov:
-                    base_prov = "image"
-                _base_orig, ext_orig = os.path.splitext(orig_name)
-                if not ext_orig:
-                    ext_orig = ".bin"
-                dst_name = f"{base_prov}{ext_orig}"
-            # 2) Next: pattern-based naming if provided
-            elif self._file_pattern:
+            requested = time.monotonic()
+            with instrumentation.span("transfer.plan"):
+                info, directory, dst_name = self._plan_transfer(object_handle)
+            ingest = self._ingest_queue if self._previews else None
+            keep = True
+            if ingest is not None:
+                keep = self._deliver_preview(object_handle, info, dst_name, requested)
+            if self._transfer_queue is not None:
+                self._transfer_queue.put(
+                    (object_handle, info, directory, dst_name, requested)
+                )
+            elif not keep:
+                self._skip_transfer(
+                    object_handle, dst_name or (info or {}).get("szFileName") or ""
+                )
+            elif ingest is not None:
+                ingest.put((object_handle, info, directory, dst_name))
+            else:
                 try:
-                    base, ext = os.path.splitext(orig_name)
-                    if not ext:
-                        ext = ".bin"
-                    ts = time.strftime("%Y%m%d_%H%M%S")
-                    dst_name = self._file_pattern.format(
-                        basename=base,
-                        ext=ext.lstrip("."),
-                        timestamp=ts,
-                        seq=self._seq,
-                    )
-                    self._seq += 1
-                except Exception:
-                    dst_name = None
-
-            path = _save_directory_item(
-                object_handle, self.save_dir, dst_basename=dst_name
-            )
-            self._saved_paths.append(path)
-            self._enqueue_async_event(
-                {
-                    "kind": "object",
-                    "event": getattr(ObjectEvent, "DirItemRequestTransfer").name,
-                    "path": path,
-                }
-            )
+                    self._download_transfer(object_handle, info, directory, dst_name)
+                except Exception as e:
+                    # E.g. the download kept stalling: fail the waiting capture
+                    # now, without raising into the SDK
+                    self._log(f"Download failed: {e}")
+                    self._on_transfer_failed(e)
+                    status = _ERR_OPERATION_CANCELLED
         else:
             self._enqueue_async_event(
                 {
@@ -391,14 +1253,216 @@ class CameraController:
             )
         if self._obj_cb:
             try:
-                return int(self._obj_cb(event, object_handle))
+                result = int(self._obj_cb(event, object_handle))
             except Exception:
-                return 0
-        return 0
+                result = 0
+            # The handler also sees failed transfers; the failure is still reported
+            return status or result
+        return status
+
+    def _plan_transfer(
+        self, object_handle: EdsObject
+    ) -> Tuple[Dict[str, Any], str, Optional[str]]:
+        """(item info, directory, base name or None) for a transferred item.
+
+        The directory item info is fetched once here and reused for the download.
+        """
+        try:
+            info = edsdk.GetDirectoryItemInfo(object_handle)
+            orig_name = info.get("szFileName") or f"{uuid.uuid4()}.bin"
+        except Exception:
+            info = None
+            orig_name = f"{uuid.uuid4()}.bin"
+        # A one-shot name from capture(filename=...) takes precedence over the pattern
+        explicit, self._next_filename = self._next_filename or None, None
+        directory, dst_name = self._planner.plan(self.save_dir, orig_name, explicit)
+        return info, directory, dst_name
+
+    def _deliver_preview(
+        self,
+        object_handle: EdsObject,
+        info: Optional[Dict[str, Any]],
+        dst_name: Optional[str],
+        requested: float,
+    ) -> bool:
+        """Download and hand out an item's thumbnail; False if the file is rejected."""
+        filename = dst_name or (info or {}).get("szFileName") or ""
+        try:
+            with instrumentation.span("transfer.thumbnail"):
+                data = _download_thumbnail(object_handle)
+        except Exception as e:
+            # Not every file has a thumbnail; its download is still scheduled
+            self._log(f"No preview for {filename}: {e}")
+            return self._preview_download
+        preview = Preview(filename, data, requested, time.monotonic())
+        keep = self._preview_download
+        if self._preview_cb is not None:
+            try:
+                if self._preview_cb(preview) is False:
+                    keep = False
+            except Exception as e:
+                self._log(f"Preview callback failed: {e}")
+        if self._preview_queue is not None:
+            try:
+                self._preview_queue.put_nowait(preview)
+            except queue.Full:
+                self._log(f"Preview queue full; dropped preview of {filename}")
+        self._enqueue_async_event({"kind": "preview", "file": filename, "data": data})
+        return keep
+
+    def _skip_transfer(self, object_handle: EdsObject, filename: str) -> None:
+        """Release a rejected file without downloading it.
+
+        The waiting capture fails with TransferSkipped; the file does not count
+        as a finished transfer.
+        """
+        try:
+            edsdk.DownloadCancel(object_handle)
+        except Exception as e:
+            self._log(f"DownloadCancel failed: {e}")
+        reason = (
+            "rejected by the preview callback"
+            if self._preview_download
+            else "previews only (download=False)"
+        )
+        self._on_transfer_failed(TransferSkipped(filename, reason))
+        self._enqueue_async_event(
+            {
+                "kind": "object",
+                "event": ObjectEvent.DirItemRequestTransfer.name,
+                "skipped": filename,
+            }
+        )
+
+    def _ingest_loop(self, ingest: queue.Queue) -> None:
+        with _com_initialized():
+            while True:
+                item = ingest.get()
+                if item is None:
+                    return
+                try:
+                    self._download_transfer(*item)
+                except Exception as e:
+                    self._log(f"Background download failed: {e}")
+                    self._on_transfer_failed(e)
+
+    def _download_transfer(
+        self,
+        object_handle: EdsObject,
+        info: Optional[Dict[str, Any]],
+        directory: str,
+        dst_name: Optional[str],
+    ) -> None:
+        if self._download_to_memory:
+            filename, data = self._monitored_download(
+                _download_directory_item, object_handle, info, dst_name
+            )
+            self._captured_data.append((directory, filename, data))
+            self._on_transfer_done(None)
+        else:
+            path = self._monitored_download(
+                functools.partial(_save_directory_item, save_dir=directory),
+                object_handle,
+                info,
+                dst_name,
+            )
+            self._on_transfer_done(path)
+
+    def _monitored_download(
+        self,
+        download: Callable[..., Any],
+        object_handle: EdsObject,
+        info: Optional[Dict[str, Any]],
+        dst_name: Optional[str],
+    ) -> Any:
+        """Run one of the download helpers with progress reporting and stall retries.
+
+        Without an on_progress() callback, async event queue or stall_timeout the
+        helper runs as is.
+        """
+        if (
+            self._progress_cb is None
+            and self._async_queue is None
+            and self.stall_timeout is None
+        ):
+            return download(object_handle, dst_basename=dst_name, info=info)
+        if info is None:
+            info = edsdk.GetDirectoryItemInfo(object_handle)
+        filename = dst_name or info.get("szFileName") or ""
+        attempt = 1
+        while True:
+            monitor = _DownloadMonitor(
+                self, object_handle, filename, info["size"], attempt, self.stall_timeout
+            )
+            try:
+                return download(
+                    object_handle, dst_basename=dst_name, info=info, monitor=monitor
+                )
+            except Exception as e:
+                if not monitor.stalled:
+                    raise
+                if attempt > self.stall_retries:
+                    # Give the transfer up so the body releases the file
+                    try:
+                        edsdk.DownloadCancel(object_handle)
+                    except Exception as cancel_error:
+                        self._log(f"DownloadCancel failed: {cancel_error}")
+                    raise TimeoutError(
+                        f"Download of {filename} stalled {attempt} times"
+                    ) from e
+                # attempt is the try that stalled, so also the retry about to run
+                self._log(
+                    f"Retry stalled download of {filename} "
+                    f"(retry {attempt}/{self.stall_retries})"
+                )
+            attempt += 1
+
+    def _report_progress(self, progress: TransferProgress) -> None:
+        if self._progress_cb is not None:
+            try:
+                self._progress_cb(progress)
+            except Exception as e:
+                self._log(f"Progress callback failed: {e}")
+        self._enqueue_async_event(
+            {
+                "kind": "progress",
+                "file": progress.filename,
+                "percent": progress.percent,
+                "bytes": progress.bytes_done,
+                "total": progress.total_bytes,
+                "mb_per_s": progress.mb_per_s,
+            }
+        )
+
+    def _on_transfer_done(self, path: Optional[str]) -> None:
+        """Record a finished transfer; path is None for in-memory downloads."""
+        evt: Dict[str, Union[str, int]] = {
+            "kind": "object",
+            "event": getattr(ObjectEvent, "DirItemRequestTransfer").name,
+        }
+        if path is not None:
+            self._saved_paths.append(path)
+            evt["path"] = path
+        self._transfer_count += 1
+        self._transfer_waiter.notify()
+        if self._transfer_futures:
+            loop, future = self._transfer_futures.popleft()
+            loop.call_soon_threadsafe(_resolve_future, future, path)
+        self._enqueue_async_event(evt)
+
+    def _on_transfer_failed(self, error: Exception) -> None:
+        """Fail the waiting capture (sync or async) with a transfer's error."""
+        self._transfer_error = error
+        self._transfer_waiter.notify()
+        if self._transfer_futures:
+            loop, future = self._transfer_futures.popleft()
+            loop.call_soon_threadsafe(_fail_future, future, error)
 
     def _on_property_event(
         self, event: PropertyEvent, prop_id: PropID, param: int
     ) -> int:
+        if self._prop_cache is not None:
+            self._prop_cache.invalidate(event, prop_id)
         if self._prop_cb:
             try:
                 return int(self._prop_cb(event, prop_id, param))
@@ -420,6 +1484,23 @@ class CameraController:
             pass
         return 0
 
+    def _on_state_event(self, event: StateEvent, event_data: int) -> int:
+        if event == StateEvent.Shutdown:
+            self._log("Camera shut down")
+        self._enqueue_async_event(
+            {
+                "kind": "state",
+                "event": event.name if hasattr(event, "name") else int(event),
+                "data": int(event_data),
+            }
+        )
+        if self._state_cb:
+            try:
+                return int(self._state_cb(event, event_data))
+            except Exception:
+                return 0
+        return 0
+
     # ---------- Properties ----------
     def set_properties(
         self,
@@ -472,9 +1553,11 @@ class CameraController:
 
         # Validate against camera descriptors; optionally tolerate AF/AEMode unsupported
         if validate:
+            # Deliver pending PropertyDescChanged events before trusting the cache
+            _pump_messages_once()
             filtered: List[Tuple[PropID, int]] = []
             for pid, code in to_set:
-                supported = self._get_supported_codes(pid)
+                supported = self._get_supported(pid).members
                 if supported and code not in supported:
                     if tolerate_not_supported and pid in (PropID.AEMode, PropID.AFMode):
                         self._log(
@@ -490,6 +1573,9 @@ class CameraController:
             self._log(f"Set {pid.name} -> {code}")
             try:
                 edsdk.SetPropertyData(self._cam, pid, 0, code)
+                if self._prop_cache is not None and self._prop_cache.cache_values:
+                    # The body may adjust the value; re-read it on next access
+                    self._prop_cache.invalidate(PropertyEvent.PropertyChanged, pid)
             except Exception as e:
                 # Many Canon bodies do not allow changing AEMode via SDK.
                 # Optionally ignore NOT_SUPPORTED for AEMode / AFMode when tolerate flag is set.
@@ -498,51 +1584,88 @@ class CameraController:
                     continue
                 raise
 
+    def get_focus_info(self) -> FocusInfo:
+        """Current AF frames as a compact FocusInfo (decoded lazily, per point)."""
+        if self._cam is None:
+            raise RuntimeError("Camera session not open")
+        return get_focus_info(self._cam)
+
     def get_properties(self) -> Dict[str, Union[str, int]]:
         if self._cam is None:
             raise RuntimeError("Camera session not open")
-        av_code = edsdk.GetPropertyData(self._cam, PropID.Av, 0)
-        tv_code = edsdk.GetPropertyData(self._cam, PropID.Tv, 0)
-        iso_code = edsdk.GetPropertyData(self._cam, PropID.ISOSpeed, 0)
+        values = self._read_properties(_SNAPSHOT_PROPERTIES)
+
+        def value(pid: PropID) -> Any:
+            v = values[pid]
+            if isinstance(v, Exception):
+                raise v
+            return v
+
+        def optional(pid: PropID) -> int:
+            """Value or -1 if unsupported, like _safe_get_property."""
+            v = values[pid]
+            return -1 if isinstance(v, Exception) else int(v)
 
-        # additional
-        def enum_name(enum_cls, code: int) -> str:
-            for name, member in enum_cls.__members__.items():
-                if int(member) == int(code):
-                    return name
-            return str(code)
+        av_code = value(PropID.Av)
+        tv_code = value(PropID.Tv)
+        iso_code = value(PropID.ISOSpeed)
 
         props: Dict[str, Union[str, int]] = {
             "Av": AvTable.get(av_code, str(av_code)),
             "Tv": TvTable.get(tv_code, str(tv_code)),
             "ISO": _iso_code_to_string(int(iso_code)),
-            "SaveTo": str(edsdk.GetPropertyData(self._cam, PropID.SaveTo, 0)),
-            "AEMode": enum_name(
-                AEMode, edsdk.GetPropertyData(self._cam, PropID.AEMode, 0)
-            ),
-            "MeteringMode": enum_name(
-                MeteringMode, edsdk.GetPropertyData(self._cam, PropID.MeteringMode, 0)
-            ),
-            "WhiteBalance": enum_name(
-                WhiteBalance, edsdk.GetPropertyData(self._cam, PropID.WhiteBalance, 0)
-            ),
-            "ImageQuality": enum_name(
-                ImageQuality, edsdk.GetPropertyData(self._cam, PropID.ImageQuality, 0)
-            ),
-            "DriveMode": enum_name(
-                DriveMode, edsdk.GetPropertyData(self._cam, PropID.DriveMode, 0)
-            ),
-            "AFMode": enum_name(
-                AFMode,
-                self._safe_get_property(PropID.AFMode),
-            ),
-            "EvfAFMode": enum_name(
-                EvfAFMode,
-                self._safe_get_property(PropID.Evf_AFMode),
-            ),
+            "SaveTo": str(value(PropID.SaveTo)),
+            "AEMode": _enum_name(AEMode, value(PropID.AEMode)),
+            "MeteringMode": _enum_name(MeteringMode, value(PropID.MeteringMode)),
+            "WhiteBalance": _enum_name(WhiteBalance, value(PropID.WhiteBalance)),
+            "ImageQuality": _enum_name(ImageQuality, value(PropID.ImageQuality)),
+            "DriveMode": _enum_name(DriveMode, value(PropID.DriveMode)),
+            "AFMode": _enum_name(AFMode, optional(PropID.AFMode)),
+            "EvfAFMode": _enum_name(EvfAFMode, optional(PropID.Evf_AFMode)),
         }
         return props
 
+    def _read_properties(self, pids: Tuple[PropID, ...]) -> Dict[PropID, Any]:
+        """Read several properties (param 0), serving cached values if enabled.
+
+        Uncached properties are fetched in one native call; per-property errors
+        come back as EdsError values instead of aborting the batch.
+        """
+        cache = self._prop_cache
+        if cache is None or not cache.cache_values:
+            return dict(zip(pids, edsdk.GetPropertyDataMany(self._cam, pids)))
+        values: Dict[PropID, Any] = {}
+        missing: List[PropID] = []
+        for pid in pids:
+            v = cache.get_value(pid)
+            if v is _MISSING:
+                missing.append(pid)
+            else:
+                values[pid] = v
+        if missing:
+            generation = cache.generation
+            fetched = edsdk.GetPropertyDataMany(self._cam, tuple(missing))
+            for pid, v in zip(missing, fetched):
+                values[pid] = v
+                if not isinstance(v, Exception):
+                    cache.put_value(pid, 0, v, generation)
+        return values
+
+    # ---------- Property cache ----------
+    def property_cache_stats(self) -> Dict[str, int]:
+        """Hit/miss/invalidation counters of the property cache ({} if disabled).
+
+        Descriptor lookups are counted even when value caching is off.
+        """
+        if self._prop_cache is None:
+            return {}
+        return self._prop_cache.stats()
+
+    def invalidate_property_cache(self) -> None:
+        """Drop every cached property value and descriptor."""
+        if self._prop_cache is not None:
+            self._prop_cache.clear()
+
     # ---------- Profiles ----------
     def save_profile(self, path: str) -> None:
         """Save current properties to a JSON file."""
@@ -622,12 +1745,37 @@ class CameraController:
             ),
         }
 
+    def prewarm_supported(self, pids: Optional[Iterable[PropID]] = None) -> None:
+        """Fetch and cache the supported codes of pids up front.
+
+        Defaults to the properties set_properties() validates; pass PropID to
+        prewarm every known property. Properties the body does not describe
+        are skipped.
+        """
+        if self._cam is None:
+            raise RuntimeError("Camera session not open")
+        for pid in _VALIDATED_PROPERTIES if pids is None else pids:
+            self._get_supported(pid)
+
     def _get_supported_codes(self, pid: PropID) -> List[int]:
+        return list(self._get_supported(pid).ordered)
+
+    def _get_supported(self, pid: PropID) -> _SupportedCodes:
+        cache = self._prop_cache
+        if cache is not None:
+            cached = cache.get_desc(pid)
+            if cached is not _MISSING:
+                return cached
+            generation = cache.generation
         try:
             desc = edsdk.GetPropertyDesc(self._cam, pid)
-            return list(desc.get("propDesc", ()))
+            codes = tuple(desc.get("propDesc", ()))
         except Exception:
-            return []
+            return _NO_SUPPORTED_CODES
+        supported = _SupportedCodes(codes, frozenset(codes))
+        if cache is not None:
+            cache.put_desc(pid, supported, generation)
+        return supported
 
     # ---------- Capture ----------
     def capture(
@@ -643,6 +1791,7 @@ class CameraController:
         if self._cam is None:
             raise RuntimeError("Camera session not open")
         self._saved_paths.clear()
+        self._transfer_error = None
         if filename is not None:
             if shots != 1:
                 raise ValueError("filename can be used only when shots=1")
@@ -653,8 +1802,12 @@ class CameraController:
             while True:
                 try:
                     self._log(f"Trigger shot {i + 1}/{shots}")
+                    # Taken before the trigger: the transfer callback may run on an
+                    # SDK thread before SendCommand returns
+                    already = self._transfer_count
                     edsdk.SendCommand(self._cam, CameraCommand.TakePicture, 0)
-                    self._wait_for_transfer(timeout)
+                    with instrumentation.span("capture.wait_transfer"):
+                        self._wait_for_transfer(timeout, already)
                     break
                 except TimeoutError:
                     if attempt >= retry:
@@ -666,15 +1819,140 @@ class CameraController:
                 time.sleep(interval)
         return list(self._saved_paths)
 
-    def _wait_for_transfer(self, timeout: float) -> None:
-        deadline = time.time() + timeout
-        already = len(self._saved_paths)
-        while time.time() < deadline:
-            time.sleep(0.01)
-            _pump_messages_once()
-            if len(self._saved_paths) > already:
+    def _wait_for_transfer(self, timeout: float, already: Optional[int] = None) -> None:
+        if already is None:
+            already = self._transfer_count
+        if not self._transfer_waiter.wait_until(
+            lambda: self._transfer_count > already or self._transfer_error is not None,
+            timeout,
+        ):
+            raise TimeoutError("Timed out waiting for image transfer event")
+        error, self._transfer_error = self._transfer_error, None
+        if error is not None:
+            raise error
+
+    def capture_burst(
+        self,
+        shots: int,
+        timeout: float = 5.0,
+        *,
+        max_in_flight: int = 4,
+        interval: float = 0.0,
+    ) -> List[ShotTiming]:
+        """Capture a burst, triggering new shots while earlier files are downloading.
+
+        Transfers are queued by the object event handler and downloaded by a worker
+        thread. At most max_in_flight shots are triggered but not yet downloaded.
+        TakePicture is retried while the body reports DEVICE_BUSY. timeout bounds the
+        wait for each transfer to make progress. Returns one ShotTiming per shot, in
+        shot order; with a RAW+JPEG ImageQuality a shot is complete once both of
+        its files are downloaded.
+        """
+        if self._cam is None:
+            raise RuntimeError("Camera session not open")
+        if shots < 1:
+            raise ValueError("shots must be >= 1")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        self._saved_paths.clear()
+        quality = self._read_properties((PropID.ImageQuality,))[PropID.ImageQuality]
+        files = _BurstFiles(
+            1 if isinstance(quality, Exception) else _files_per_shot(int(quality))
+        )
+        transfers: queue.Queue = queue.Queue()
+        triggered: List[float] = []
+        errors: List[Exception] = []
+        worker = threading.Thread(
+            target=self._transfer_worker,
+            args=(transfers, files, errors),
+            name="edsdk-transfer",
+            daemon=True,
+        )
+        self._transfer_queue = transfers
+        worker.start()
+        try:
+            for i in range(shots):
+                if not self._transfer_waiter.wait_until(
+                    lambda: bool(errors)
+                    or len(triggered) - files.complete < max_in_flight,
+                    timeout,
+                ):
+                    raise TimeoutError("Timed out waiting for image transfer event")
+                if errors:
+                    raise errors[0]
+                self._log(f"Trigger burst shot {i + 1}/{shots}")
+                self._take_picture(timeout)
+                triggered.append(time.monotonic())
+                if interval > 0 and i < shots - 1:
+                    time.sleep(interval)
+            while files.complete < shots:
+                pending = files.count
+                if not self._transfer_waiter.wait_until(
+                    lambda: bool(errors) or files.count > pending, timeout
+                ):
+                    raise TimeoutError("Timed out waiting for image transfer event")
+                if errors:
+                    raise errors[0]
+        finally:
+            self._transfer_queue = None
+            transfers.put(None)
+            worker.join()
+        return [
+            ShotTiming(
+                i,
+                shot[0][0],
+                triggered[i],
+                min(requested for _path, requested, _started, _finished in shot),
+                min(started for _path, _requested, started, _finished in shot),
+                max(finished for _path, _requested, _started, finished in shot),
+                tuple(path for path, _requested, _started, _finished in shot),
+            )
+            for i, shot in enumerate(files.shots()[:shots])
+        ]
+
+    def _take_picture(self, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                edsdk.SendCommand(self._cam, CameraCommand.TakePicture, 0)
                 return
-        raise TimeoutError("Timed out waiting for image transfer event")
+            except Exception as e:
+                if (
+                    getattr(e, "code", None) != _ERR_DEVICE_BUSY
+                    or time.monotonic() >= deadline
+                ):
+                    raise
+            # Keep pumping so pending transfers can drain the body's buffer
+            self._transfer_waiter.wait_until(lambda: False, _BUSY_RETRY_DELAY)
+
+    def _transfer_worker(
+        self,
+        transfers: queue.Queue,
+        files: "_BurstFiles",
+        errors: List[Exception],
+    ) -> None:
+        with _com_initialized():
+            while True:
+                item = transfers.get()
+                if item is None:
+                    return
+                object_handle, info, directory, dst_name, requested = item
+                started = time.monotonic()
+                try:
+                    path = self._monitored_download(
+                        functools.partial(_save_directory_item, save_dir=directory),
+                        object_handle,
+                        info,
+                        dst_name,
+                    )
+                except Exception as e:
+                    errors.append(e)
+                    self._transfer_waiter.notify()
+                    continue
+                files.add(
+                    _shot_key(info, path), path, requested, started, time.monotonic()
+                )
+                self._on_transfer_done(path)
 
     # ---------- Capture to memory ----------
     def capture_bytes(
@@ -686,29 +1964,36 @@ class CameraController:
         retry: int = 0,
         retry_delay: float = 0.3,
         keep_files: bool = False,
-    ) -> List[bytes]:
-        """Capture and return image bytes in memory.
-        Optionally keeps or removes the saved files from disk (default: remove).
+    ) -> List[bytearray]:
+        """Capture and return image data in memory.
+        Images are downloaded into memory streams sized from the directory item, without
+        a temporary file, and the buffers the SDK wrote into are returned as-is. With
+        keep_files the images are also written where capture() would save them
+        (file_pattern / dir_pattern).
         """
-        paths = self.capture(
-            shots=shots,
-            timeout=timeout,
-            interval=interval,
-            retry=retry,
-            retry_delay=retry_delay,
-        )
-        data_list: List[bytes] = []
-        for p in paths:
-            try:
-                with open(p, "rb") as f:
-                    data_list.append(f.read())
-            finally:
-                if not keep_files:
-                    try:
-                        os.remove(p)
-                    except Exception:
-                        pass
-        return data_list
+        self._captured_data.clear()
+        self._download_to_memory = True
+        try:
+            self.capture(
+                shots=shots,
+                timeout=timeout,
+                interval=interval,
+                retry=retry,
+                retry_delay=retry_delay,
+            )
+        finally:
+            self._download_to_memory = False
+            captured = list(self._captured_data)
+            self._captured_data.clear()
+        if keep_files:
+            for directory, filename, data in captured:
+                # The planner reserved the name and created the directory
+                path = os.path.join(directory, filename)
+                with instrumentation.span("transfer.write", len(data)):
+                    with open(path, "wb") as f:
+                        f.write(data)
+                self._saved_paths.append(path)
+        return [data for _directory, _filename, data in captured]
 
     def capture_pil(
         self,
@@ -797,10 +2082,20 @@ class CameraController:
             edsdk.SetPropertyData(self._cam, PropID.Evf_Mode, 0, int(0))
         except Exception:
             pass
+        self._release_evf_stream()
         self._live_view_on = False
         self._log("Live view stopped")
 
-    def grab_live_view_frame(self, save_path: Optional[str] = None) -> LiveViewData:
+    def grab_live_view_frame(
+        self, save_path: Optional[str] = None, *, copy: bool = True
+    ) -> LiveViewData:
+        """Grab one live-view JPEG frame.
+
+        With save_path the frame is written to that file and the path is returned.
+        Otherwise the frame is downloaded into a reusable in-memory stream (no disk I/O).
+        By default the JPEG bytes are returned; with copy=False a memoryview over the
+        reusable buffer is returned instead, valid only until the next frame is grabbed.
+        """
         if self._cam is None:
             raise RuntimeError("Camera session not open")
         if not self._live_view_on:
@@ -827,19 +2122,8 @@ class CameraController:
                         f"Live view saved: {save_path} (attempt {attempt}/{MAX_ATTEMPTS})"
                     )
                     return save_path
-                # Fallback: save to temp file and read bytes
-                tmp_path = os.path.join(self.save_dir, f"evf_{uuid.uuid4().hex}.jpg")
-                out_stream = edsdk.CreateFileStream(
-                    tmp_path, FileCreateDisposition.CreateAlways, Access.ReadWrite
-                )
-                evf_image = edsdk.CreateEvfImageRef(out_stream)
-                edsdk.DownloadEvfImage(self._cam, evf_image)
-                with open(tmp_path, "rb") as f:
-                    data = f.read()
-                try:
-                    os.remove(tmp_path)
-                except Exception:
-                    pass
+                view = self._download_evf_frame()
+                data = bytes(view) if copy else view
                 self._log(
                     f"Live view grabbed: {len(data)} bytes (attempt {attempt}/{MAX_ATTEMPTS})"
                 )
@@ -867,6 +2151,57 @@ class CameraController:
             raise last_exc
         raise RuntimeError("Unexpected live view failure without exception")
 
+    def _download_evf_frame(self) -> memoryview:
+        """Download one EVF frame into the reusable buffer and return a view of it."""
+        with instrumentation.span("live_view.frame") as frame:
+            while True:
+                self._ensure_evf_stream()
+                buf = self._evf_buffer
+                edsdk.Seek(self._evf_stream, 0, SeekOrigin.Begin)
+                try:
+                    edsdk.DownloadEvfImage(self._cam, self._evf_image)
+                except Exception as e:
+                    # Frame larger than the buffer: grow it and try again
+                    if (
+                        getattr(e, "code", None) not in _ERR_STREAM_FULL
+                        or self._evf_buffer_size >= _EVF_BUFFER_MAX
+                    ):
+                        raise
+                    self._evf_buffer_size = min(
+                        self._evf_buffer_size * 2, _EVF_BUFFER_MAX
+                    )
+                    self._log(
+                        f"Live view buffer grown to {self._evf_buffer_size} bytes"
+                    )
+                    continue
+                size = edsdk.GetPosition(self._evf_stream)
+                frame.nbytes = size
+                return memoryview(buf)[:size]
+
+    def _ensure_evf_stream(self) -> None:
+        if (
+            self._evf_buffer is not None
+            and len(self._evf_buffer) >= self._evf_buffer_size
+        ):
+            return
+        self._release_evf_stream()
+        # The SDK writes straight into this buffer, so it must outlive the stream.
+        buf = bytearray(self._evf_buffer_size)
+        stream = edsdk.CreateMemoryStreamFromPointer(buf)
+        self._evf_image = edsdk.CreateEvfImageRef(stream)
+        self._evf_stream = stream
+        self._evf_buffer = buf
+
+    def _release_evf_stream(self) -> None:
+        # Release the EvfImageRef before its stream, and the stream before its buffer
+        self._evf_image = None
+        self._evf_stream = None
+        self._evf_buffer = None
+
+    def live_view_stream(self, **kwargs: Any) -> "LiveViewStream":
+        """Return a LiveViewStream for this camera (see LiveViewStream for options)."""
+        return LiveViewStream(self, **kwargs)
+
     def grab_live_view_pil(self) -> Image.Image:
         """Grab one live-view frame and return as PIL Image (requires Pillow)."""
         try:
@@ -939,18 +2274,1080 @@ class CameraController:
             return -1
 
 
+class _EvfSlot:
+    """One preallocated live view buffer with its memory stream and EvfImageRef."""
+
+    __slots__ = ("buffer", "stream", "image")
+
+    def __init__(self, size: int) -> None:
+        self.buffer = bytearray(size)
+        self.stream = edsdk.CreateMemoryStreamFromPointer(self.buffer)
+        self.image = edsdk.CreateEvfImageRef(self.stream)
+
+
+class LiveViewStream:
+    """
+    Download live view frames on a producer thread into a ring of preallocated buffers.
+
+    Policies
+    - "latest": consumers get the newest frame; frames never taken are dropped.
+    - "block": consumers get every frame in order; the producer waits for a free slot.
+
+    Frames carry increasing sequence numbers; stats() reports produced, delivered and
+    dropped frames. A frame's data is only valid until the next get()/poll(). An optional
+    decode callable (e.g. a cv2.imdecode or PIL wrapper) runs on the producer thread and
+    its result is returned as LiveViewFrame.image.
+    """
+
+    POLICIES = ("latest", "block")
+
+    def __init__(
+        self,
+        controller: CameraController,
+        *,
+        slots: int = 3,
+        policy: str = "latest",
+        buffer_size: int = _EVF_BUFFER_SIZE,
+        decode: Optional[Callable[[memoryview], Any]] = None,
+        retry_delay: float = 0.03,
+    ) -> None:
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}")
+        # One slot held by the consumer, one published, one being written
+        if slots < (3 if policy == "latest" else 2):
+            raise ValueError("slots too small for policy")
+        self._controller = controller
+        self._nr_slots = slots
+        self._policy = policy
+        self._buffer_size = buffer_size
+        self._decode = decode
+        self._retry_delay = retry_delay
+        self._cond = threading.Condition()
+        self._slots: List[_EvfSlot] = []
+        self._free: List[int] = []
+        self._published: Deque[Tuple[int, int, float, int, Any]] = deque()
+        self._held: Optional[int] = None
+        self._last_frame: Optional[LiveViewFrame] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._error: Optional[BaseException] = None
+        self._seq = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._retries = 0
+
+    # ---------- Lifecycle ----------
+    def __enter__(self) -> "LiveViewStream":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self._running:
+            return
+        cam = self._controller
+        if cam._cam is None:
+            raise RuntimeError("Camera session not open")
+        if not cam._live_view_on:
+            cam.start_live_view()
+        self._slots = [_EvfSlot(self._buffer_size) for _ in range(self._nr_slots)]
+        self._free = list(range(self._nr_slots))
+        self._published.clear()
+        self._held = None
+        self._error = None
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._produce, name="edsdk-liveview", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._published.clear()
+        self._held = None
+        self._last_frame = None
+        self._free = []
+        # Release EvfImageRefs before their streams and buffers
+        self._slots = []
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def last_frame(self) -> Optional[LiveViewFrame]:
+        """The frame returned by the last get()/poll(), while its data is still valid."""
+        return self._last_frame
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "produced": self._seq,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "retries": self._retries,
+                "queued": len(self._published),
+            }
+
+    # ---------- Consumer ----------
+    def get(self, timeout: Optional[float] = None) -> LiveViewFrame:
+        """Return the next frame per policy; raise TimeoutError if none arrives in time."""
+        with self._cond:
+            self._release_held()
+            if not self._cond.wait_for(
+                lambda: self._published or self._error is not None or not self._running,
+                timeout,
+            ):
+                raise TimeoutError("Timed out waiting for a live view frame")
+            return self._take()
+
+    def poll(self) -> Optional[LiveViewFrame]:
+        """Return the next frame if one is ready, else None (for GUI event loops)."""
+        with self._cond:
+            if not self._published and self._error is None and self._running:
+                return None
+            self._release_held()
+            return self._take()
+
+    def __iter__(self) -> Iterator[LiveViewFrame]:
+        while self._running:
+            yield self.get()
+
+    def _release_held(self) -> None:
+        if self._held is not None:
+            self._free.append(self._held)
+            self._held = None
+            self._last_frame = None
+            self._cond.notify_all()
+
+    def _take(self) -> LiveViewFrame:
+        if self._error is not None:
+            raise self._error
+        if not self._published:
+            raise RuntimeError("Live view stream stopped")
+        index, seq, timestamp, size, image = self._published.popleft()
+        self._held = index
+        self._delivered += 1
+        self._cond.notify_all()
+        data = memoryview(self._slots[index].buffer)[:size]
+        self._last_frame = LiveViewFrame(seq, timestamp, data, image)
+        return self._last_frame
+
+    # ---------- Producer ----------
+    def _produce(self) -> None:
+        with _com_initialized():
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._free or not self._running)
+                    if not self._running:
+                        return
+                    index = self._free.pop()
+                try:
+                    size = self._download(index)
+                    view = memoryview(self._slots[index].buffer)[:size]
+                    image = self._decode(view) if self._decode is not None else None
+                except Exception as e:
+                    with self._cond:
+                        self._free.append(index)
+                        if getattr(e, "code", None) not in (
+                            _ERR_OBJECT_NOT_READY,
+                            _ERR_DEVICE_BUSY,
+                        ):
+                            self._error = e
+                            self._running = False
+                            self._cond.notify_all()
+                            return
+                        self._retries += 1
+                    time.sleep(self._retry_delay)
+                    continue
+                timestamp = time.monotonic()
+                with self._cond:
+                    self._seq += 1
+                    if self._policy == "latest":
+                        while self._published:
+                            self._free.append(self._published.popleft()[0])
+                            self._dropped += 1
+                    self._published.append((index, self._seq, timestamp, size, image))
+                    self._cond.notify_all()
+
+    def _download(self, index: int) -> int:
+        cam = self._controller._cam
+        while True:
+            slot = self._slots[index]
+            edsdk.Seek(slot.stream, 0, SeekOrigin.Begin)
+            try:
+                edsdk.DownloadEvfImage(cam, slot.image)
+            except Exception as e:
+                # Frame larger than the slot: grow it and try again
+                size = len(slot.buffer)
+                if (
+                    getattr(e, "code", None) not in _ERR_STREAM_FULL
+                    or size >= _EVF_BUFFER_MAX
+                ):
+                    raise
+                self._slots[index] = _EvfSlot(min(size * 2, _EVF_BUFFER_MAX))
+                continue
+            return edsdk.GetPosition(slot.stream)
+
+
+class SdkExecutor:
+    """A thread that owns the SDK, pumps its events and runs SDK work in order.
+
+    The SDK expects its calls and callbacks on one message-pumping thread. The
+    executor initializes the SDK (through sdk_lifetime) on its own thread and
+    then alternates between submitted operations and event pumping, so
+    callbacks are delivered even when nobody is waiting for them. On Windows it
+    sleeps in MsgWaitForMultipleObjects and wakes as soon as a message is posted
+    or work is submitted; without COM it calls edsdk.GetEvent() every
+    pump_interval seconds. submit() may be called from any thread and returns a
+    concurrent.futures.Future; work must not wait on futures of the same executor.
+    """
+
+    def __init__(
+        self,
+        name: str = "edsdk-sdk",
+        *,
+        own_sdk: bool = True,
+        pump_interval: float = _IDLE_PUMP_INTERVAL,
+    ) -> None:
+        self.pump_interval = pump_interval
+        self._own_sdk = own_sdk
+        self._tasks: queue.Queue = queue.Queue()
+        self._wake = (
+            win32event.CreateEvent(None, False, False, None)
+            if win32event is not None
+            else None
+        )
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        started: concurrent.futures.Future = concurrent.futures.Future()
+        self._thread = threading.Thread(
+            target=self._run, args=(started,), name=name, daemon=True
+        )
+        self._thread.start()
+        try:
+            started.result()
+        except BaseException:
+            self._thread.join()
+            raise
+
+    def __enter__(self) -> "SdkExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future:
+        """Queue fn(*args, **kwargs) to run on the executor thread."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("SdkExecutor is shut down")
+            self._tasks.put((future, fn, args, kwargs))
+        if self._wake is not None:
+            win32event.SetEvent(self._wake)
+        return future
+
+    @contextlib.contextmanager
+    def session(self, camera: "CameraController") -> Iterator["CameraController"]:
+        """Open camera's session on the executor thread for the duration of the block.
+
+        Use submit() to call into the yielded controller from any thread.
+        """
+        self.submit(camera.__enter__).result()
+        try:
+            yield camera
+        finally:
+            self.submit(camera.__exit__, None, None, None).result()
+
+    def shutdown(self) -> None:
+        """Finish the queued work, release the SDK and join the thread."""
+        with self._shutdown_lock:
+            if not self._shutdown:
+                self._shutdown = True
+                self._tasks.put(None)
+        if self._wake is not None:
+            win32event.SetEvent(self._wake)
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _run(self, started: concurrent.futures.Future) -> None:
+        with _com_initialized():
+            if self._own_sdk:
+                try:
+                    sdk_lifetime.acquire()
+                except BaseException as e:
+                    started.set_exception(e)
+                    return
+            started.set_result(None)
+            try:
+                while True:
+                    task = self._next_task()
+                    if task is None:
+                        return
+                    future, fn, args, kwargs = task
+                    if future.set_running_or_notify_cancel():
+                        try:
+                            future.set_result(fn(*args, **kwargs))
+                        except BaseException as e:
+                            future.set_exception(e)
+                    # A busy queue must not starve event delivery
+                    _pump_sdk_events()
+            finally:
+                if self._own_sdk:
+                    sdk_lifetime.release()
+
+    def _next_task(self) -> Optional[Tuple[Any, ...]]:
+        """Next submitted operation (None to stop), pumping events until one arrives."""
+        while True:
+            if self._wake is None:
+                try:
+                    return self._tasks.get(timeout=self.pump_interval)
+                except queue.Empty:
+                    _pump_sdk_events()
+                    continue
+            try:
+                return self._tasks.get_nowait()
+            except queue.Empty:
+                pass
+            win32event.MsgWaitForMultipleObjects(
+                [self._wake],
+                False,
+                int(self.pump_interval * 1000),
+                win32event.QS_ALLINPUT,
+            )
+            _pump_sdk_events()
+
+
+# Worker result of CameraRig.trigger(): (triggered, transfer done, path, error)
+_ShotOutcome = Tuple[
+    Optional[float], Optional[float], Optional[str], Optional[BaseException]
+]
+
+
+class _RigGate:
+    """Start line of CameraRig.trigger(): bodies arm, then all fire on release().
+
+    Unlike a threading.Barrier, a body that is not armed when the gate is
+    released fails on its own instead of breaking the trigger for every body.
+    The gate is released at the latest arm_timeout after it is created.
+    """
+
+    def __init__(self, parties: int, arm_timeout: float) -> None:
+        self.parties = parties
+        self.arm_timeout = arm_timeout
+        self._deadline = time.monotonic() + arm_timeout
+        self._cond = threading.Condition()
+        self._armed: Set[int] = set()
+        self._closed = False
+        self._released = threading.Event()
+
+    def arm(self, index: int) -> None:
+        """Called by a body's worker; returns when the gate is released."""
+        with self._cond:
+            if self._closed:
+                raise TimeoutError(f"Camera {index} was not armed in time")
+            self._armed.add(index)
+            self._cond.notify_all()
+        # The releasing thread gets another arm_timeout past the deadline
+        remaining = self._deadline - time.monotonic()
+        if not self._released.wait(max(remaining, 0.0) + self.arm_timeout):
+            raise TimeoutError(f"Camera {index} was armed but never released")
+
+    def release(self) -> Set[int]:
+        """Release once every body is armed or at the deadline; the armed indices."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: len(self._armed) == self.parties,
+                max(self._deadline - time.monotonic(), 0.0),
+            )
+            self._closed = True
+            armed = set(self._armed)
+        self._released.set()
+        return armed
+
+
+def _wait_all(futures: List[concurrent.futures.Future]) -> List[Any]:
+    """Results of all futures; the first error is raised once all have finished."""
+    results: List[Any] = []
+    error: Optional[BaseException] = None
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(None)
+            if error is None:
+                error = e
+    if error is not None:
+        raise error
+    return results
+
+
+class CameraRig:
+    """Several bodies shooting together, e.g. for photogrammetry.
+
+    The rig holds the SDK (through sdk_lifetime) once for all bodies. Every
+    camera gets a CameraController whose session is opened, used and closed on
+    its own worker thread, so sessions open in parallel and each body collects
+    its own transfers concurrently. trigger() arms all workers at a start line
+    and releases them at once to keep the skew between bodies small.
+
+    Bodies number their files independently, so each one saves into
+    save_dir/subdir (formatted with the camera index).
+    """
+
+    def __init__(
+        self,
+        indices: Optional[Iterable[int]] = None,
+        save_dir: str = ".",
+        *,
+        subdir: str = "cam{index:02d}",
+        verbose: bool = False,
+        logger: Optional[Callable[[str], None]] = None,
+        **controller_options: Any,
+    ) -> None:
+        self.indices = None if indices is None else list(indices)
+        self.save_dir = save_dir
+        self.subdir = subdir
+        self.verbose = verbose
+        self._log = logger or (print if verbose else (lambda *_args, **_kw: None))
+        self._controller_options = controller_options
+        self._cameras: List[CameraController] = []
+        self._threads: List[SdkExecutor] = []
+        self._sdk_acquired = False
+        self.last_shots: List[RigShot] = []
+
+    def __enter__(self) -> "CameraRig":
+        sdk_lifetime.acquire()
+        self._sdk_acquired = True
+        try:
+            self._open()
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        closing = [
+            thread.submit(cam._close_session)
+            for cam, thread in zip(self._cameras, self._threads)
+        ]
+        try:
+            _wait_all(closing)
+        except Exception as e:
+            self._log(f"Rig close error: {e}")
+        for thread in self._threads:
+            thread.shutdown()
+        self._cameras.clear()
+        self._threads.clear()
+        if self._sdk_acquired:
+            self._sdk_acquired = False
+            sdk_lifetime.release()
+        self._log("Rig closed")
+
+    def _open(self) -> None:
+        cam_list = edsdk.GetCameraList()
+        nr_cameras = edsdk.GetChildCount(cam_list)
+        indices = list(range(nr_cameras)) if self.indices is None else self.indices
+        if not indices:
+            raise RuntimeError("No cameras connected")
+        for index in indices:
+            if not 0 <= index < nr_cameras:
+                raise RuntimeError(
+                    f"Camera index {index} out of range (found {nr_cameras})"
+                )
+        opening = []
+        for index in indices:
+            save_dir = os.path.join(self.save_dir, self.subdir.format(index=index))
+            os.makedirs(save_dir, exist_ok=True)
+            cam = CameraController(
+                index=index,
+                save_dir=save_dir,
+                verbose=self.verbose,
+                logger=lambda msg, i=index: self._log(f"[cam{i}] {msg}"),
+                **self._controller_options,
+            )
+            thread = SdkExecutor(f"edsdk-rig-{index}", own_sdk=False)
+            self._cameras.append(cam)
+            self._threads.append(thread)
+            opening.append(
+                thread.submit(cam._open_session, edsdk.GetChildAtIndex(cam_list, index))
+            )
+        _wait_all(opening)
+        self._log(f"Rig opened with {len(self._cameras)} cameras")
+
+    @property
+    def cameras(self) -> List[CameraController]:
+        """Controllers of the bodies, in rig order. Use run() to call into them."""
+        return list(self._cameras)
+
+    def run(self, fn: Callable[[CameraController], Any]) -> List[Any]:
+        """Call fn(camera) for every body on its worker thread, in parallel.
+
+        Returns the results in rig order; the first error is raised once every
+        call has finished.
+        """
+        return _wait_all(
+            [
+                thread.submit(fn, cam)
+                for cam, thread in zip(self._cameras, self._threads)
+            ]
+        )
+
+    def trigger(
+        self, timeout: float = 5.0, *, arm_timeout: float = 5.0
+    ) -> List[RigShot]:
+        """Fire every body at once and wait for all transfers.
+
+        Workers arm at a start line that this thread releases once every body
+        is armed, or after arm_timeout with the bodies armed by then. A body
+        failing to arm in time, shoot or transfer within timeout is reported
+        in its RigShot.error instead of raising; the others still shoot.
+        """
+        if not self._cameras:
+            raise RuntimeError("Camera rig not open")
+        gate = _RigGate(len(self._cameras), arm_timeout)
+        shooting = [
+            thread.submit(self._shoot, cam, gate, timeout)
+            for cam, thread in zip(self._cameras, self._threads)
+        ]
+        armed = gate.release()
+        late = [cam.index for cam in self._cameras if cam.index not in armed]
+        if late:
+            self._log(
+                "Rig trigger: cameras not armed in time: "
+                + ", ".join(str(index) for index in late)
+            )
+        outcomes = [future.result() for future in shooting]
+
+        fired = [outcome[0] for outcome in outcomes if outcome[0] is not None]
+        first = min(fired) if fired else None
+        shots: List[RigShot] = []
+        for cam, (triggered, done, path, error) in zip(self._cameras, outcomes):
+            shots.append(
+                RigShot(
+                    camera=cam.index,
+                    path=path,
+                    triggered=triggered,
+                    skew=None if triggered is None else triggered - first,
+                    transfer_time=None if done is None else done - triggered,
+                    error=error,
+                )
+            )
+        if fired:
+            self._log(f"Rig trigger: max skew {(max(fired) - first) * 1000:.3f} ms")
+        self.last_shots = shots
+        return shots
+
+    @staticmethod
+    def _shoot(cam: CameraController, gate: _RigGate, timeout: float) -> _ShotOutcome:
+        """Worker side of trigger(): (triggered, transfer done, path, error).
+
+        triggered is taken once the body has accepted TakePicture, so busy
+        retries count as skew rather than transfer time.
+        """
+        cam._saved_paths.clear()
+        already = cam._transfer_count
+        triggered: Optional[float] = None
+        try:
+            gate.arm(cam.index)
+            cam._take_picture(timeout)
+            triggered = time.perf_counter()
+            cam._wait_for_transfer(timeout, already)
+            done = time.perf_counter()
+        except Exception as e:
+            return triggered, None, None, e
+        path = cam._saved_paths[0] if cam._saved_paths else None
+        return triggered, done, path, None
+
+
+class _PoolEntry:
+    """Registry state of one body in a CameraPool, keyed by its port name.
+
+    state is "connecting", "ready" or "down". retry_at is when a down body
+    present in the camera list may be reopened; None waits for the SDK to
+    report the body again (after an unplug or shutdown).
+    """
+
+    __slots__ = (
+        "port",
+        "description",
+        "camera",
+        "thread",
+        "state",
+        "leased",
+        "failures",
+        "retry_at",
+    )
+
+    def __init__(self, port: str, description: str) -> None:
+        self.port = port
+        self.description = description
+        self.camera: Optional[CameraController] = None
+        self.thread: Optional[SdkExecutor] = None
+        self.state = "down"
+        self.leased = False
+        self.failures = 0
+        self.retry_at: Optional[float] = 0.0
+
+
+class CameraPool:
+    """Live registry of connected bodies that survives unplugging and replugging.
+
+    Bodies are keyed by GetDeviceInfo()["szPortName"]. A supervisor thread
+    rescans the camera list whenever the SDK reports an added camera (and when
+    a retry is due), opens a CameraController for each new body on that body's
+    own worker thread, and closes it again on StateEvent.Shutdown. Failed
+    opens are retried with exponential backoff. Workers borrow open cameras
+    with lease(); leased controllers must not replace their on_state handler.
+
+    Each body saves into save_dir/subdir, formatted with its sanitized port
+    name and current camera list index.
+    """
+
+    def __init__(
+        self,
+        save_dir: str = ".",
+        *,
+        subdir: str = "{port}",
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0,
+        verbose: bool = False,
+        logger: Optional[Callable[[str], None]] = None,
+        **controller_options: Any,
+    ) -> None:
+        self.save_dir = save_dir
+        self.subdir = subdir
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.verbose = verbose
+        self._log = logger or (print if verbose else (lambda *_args, **_kw: None))
+        self._controller_options = controller_options
+        self._entries: Dict[str, _PoolEntry] = {}
+        self._cond = threading.Condition()
+        self._rescan_requested = False
+        self._stopping = False
+        self._supervisor: Optional[threading.Thread] = None
+        self._sdk_acquired = False
+
+    # ---------- Lifecycle ----------
+    def __enter__(self) -> "CameraPool":
+        sdk_lifetime.acquire()
+        self._sdk_acquired = True
+        self._stopping = False
+        self._rescan_requested = True
+        self._supervisor = threading.Thread(
+            target=self._supervise, name="edsdk-pool", daemon=True
+        )
+        self._supervisor.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._supervisor is not None:
+            self._supervisor.join()
+            self._supervisor = None
+        closing = [
+            entry.thread.submit(entry.camera._close_session)
+            for entry in self._entries.values()
+            if entry.camera is not None and entry.thread is not None
+        ]
+        try:
+            _wait_all(closing)
+        except Exception as e:
+            self._log(f"Pool close error: {e}")
+        for entry in self._entries.values():
+            if entry.thread is not None:
+                entry.thread.shutdown()
+        self._entries.clear()
+        if self._sdk_acquired:
+            self._sdk_acquired = False
+            sdk_lifetime.release()
+        self._log("Pool closed")
+
+    # ---------- Leasing ----------
+    @contextlib.contextmanager
+    def lease(
+        self, port: Optional[str] = None, timeout: Optional[float] = None
+    ) -> Iterator[CameraController]:
+        """Borrow an open camera (a given port, or any) for exclusive use.
+
+        Waits until one is ready; raises TimeoutError if none is within timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                entry = self._free_entry(port)
+                if entry is not None:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"No camera available{f' on {port}' if port else ''}"
+                    )
+                self._cond.wait(remaining)
+            entry.leased = True
+            camera = entry.camera
+        try:
+            yield camera
+        finally:
+            with self._cond:
+                entry.leased = False
+                self._cond.notify_all()
+
+    def _free_entry(self, port: Optional[str]) -> Optional[_PoolEntry]:
+        for entry in self._entries.values():
+            if port is not None and entry.port != port:
+                continue
+            if entry.state == "ready" and not entry.leased:
+                return entry
+        return None
+
+    def wait_ready(self, count: int, timeout: float) -> bool:
+        """Return True once at least count bodies are open, False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._count_ready() < count:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def _count_ready(self) -> int:
+        return sum(1 for entry in self._entries.values() if entry.state == "ready")
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of the registry: state, lease and failure count per port."""
+        with self._cond:
+            return {
+                port: {
+                    "description": entry.description,
+                    "state": entry.state,
+                    "leased": entry.leased,
+                    "failures": entry.failures,
+                }
+                for port, entry in self._entries.items()
+            }
+
+    # ---------- Supervisor ----------
+    def _on_camera_added(self) -> int:
+        with self._cond:
+            self._rescan_requested = True
+            self._cond.notify_all()
+        return 0
+
+    def _on_state_event(
+        self, entry: _PoolEntry, camera: CameraController, event: StateEvent
+    ) -> int:
+        if event == StateEvent.Shutdown:
+            self._drop(entry, camera, "shut down")
+        return 0
+
+    def _drop(self, entry: _PoolEntry, camera: CameraController, reason: str) -> None:
+        """Close a body that went away; it is reopened once the SDK reports it."""
+        with self._cond:
+            if entry.camera is not camera:
+                return
+            entry.camera = None
+            entry.state = "down"
+            entry.retry_at = None
+            self._cond.notify_all()
+        self._log(f"[{entry.port}] {reason}")
+        if entry.thread is not None:
+            entry.thread.submit(camera._close_session)
+
+    def _supervise(self) -> None:
+        with _com_initialized():
+            try:
+                edsdk.SetCameraAddedHandler(self._on_camera_added)
+            except Exception as e:
+                self._log(f"Skip camera added events: {e}")
+            while True:
+                # Camera added events are delivered to this thread: by the
+                # message loop on Windows, by GetEvent() elsewhere
+                _pump_sdk_events()
+                with self._cond:
+                    if self._stopping:
+                        break
+                    now = time.monotonic()
+                    if not self._rescan_requested and not self._retry_due(now):
+                        self._cond.wait(self._idle_wait(now))
+                        continue
+                    self._rescan_requested = False
+                try:
+                    self._rescan()
+                except Exception as e:
+                    self._log(f"Camera rescan failed: {e}")
+            try:
+                edsdk.SetCameraAddedHandler(None)
+            except Exception:
+                pass
+
+    def _retry_due(self, now: float) -> bool:
+        return any(
+            entry.state == "down"
+            and entry.retry_at is not None
+            and entry.retry_at <= now
+            for entry in self._entries.values()
+        )
+
+    def _idle_wait(self, now: float) -> float:
+        wait = _IDLE_PUMP_INTERVAL
+        for entry in self._entries.values():
+            if entry.state == "down" and entry.retry_at is not None:
+                wait = min(wait, max(0.0, entry.retry_at - now))
+        return wait
+
+    def _rescan(self) -> None:
+        cam_list = edsdk.GetCameraList()
+        found: Dict[str, Tuple[int, EdsObject]] = {}
+        for index in range(edsdk.GetChildCount(cam_list)):
+            ref = edsdk.GetChildAtIndex(cam_list, index)
+            try:
+                info = edsdk.GetDeviceInfo(ref)
+            except Exception:
+                continue
+            port = info.get("szPortName") or f"index{index}"
+            found[port] = (index, ref)
+            with self._cond:
+                if port not in self._entries:
+                    self._entries[port] = _PoolEntry(
+                        port, info.get("szDeviceDescription", "")
+                    )
+
+        now = time.monotonic()
+        to_open: List[Tuple[_PoolEntry, int, EdsObject]] = []
+        gone: List[Tuple[_PoolEntry, CameraController]] = []
+        with self._cond:
+            for port, entry in self._entries.items():
+                if port not in found:
+                    if entry.state == "ready" and entry.camera is not None:
+                        # Unplugged without a shutdown event
+                        gone.append((entry, entry.camera))
+                    elif entry.state == "down" and entry.retry_at is not None:
+                        # Gone before it could be reopened: wait for it to return
+                        entry.retry_at = None
+                    continue
+                if entry.state != "down":
+                    continue
+                if entry.retry_at is not None and entry.retry_at > now:
+                    continue
+                entry.state = "connecting"
+                to_open.append((entry, *found[port]))
+        for entry, camera in gone:
+            self._drop(entry, camera, "disconnected")
+        for entry, index, ref in to_open:
+            self._open(entry, index, ref)
+
+    def _open(self, entry: _PoolEntry, index: int, ref: EdsObject) -> None:
+        port_dir = _UNSAFE_PATH_CHARS_RE.sub("_", entry.port).strip("_") or "camera"
+        save_dir = os.path.join(
+            self.save_dir, self.subdir.format(port=port_dir, index=index)
+        )
+        os.makedirs(save_dir, exist_ok=True)
+        camera = CameraController(
+            index=index,
+            save_dir=save_dir,
+            verbose=self.verbose,
+            logger=lambda msg, p=entry.port: self._log(f"[{p}] {msg}"),
+            **self._controller_options,
+        )
+        camera.on_state(lambda event, _data: self._on_state_event(entry, camera, event))
+        if entry.thread is None:
+            entry.thread = SdkExecutor(f"edsdk-pool-{port_dir}", own_sdk=False)
+        future = entry.thread.submit(camera._open_session, ref)
+        future.add_done_callback(lambda f: self._opened(entry, camera, f))
+
+    def _opened(
+        self,
+        entry: _PoolEntry,
+        camera: CameraController,
+        future: concurrent.futures.Future,
+    ) -> None:
+        error = future.exception()
+        with self._cond:
+            if error is None:
+                entry.camera = camera
+                entry.state = "ready"
+                entry.failures = 0
+                entry.retry_at = 0.0
+            else:
+                entry.state = "down"
+                entry.failures += 1
+                entry.retry_at = time.monotonic() + min(
+                    self.backoff_initial * 2 ** (entry.failures - 1), self.backoff_max
+                )
+            self._cond.notify_all()
+        if error is None:
+            self._log(f"[{entry.port}] session opened")
+        else:
+            self._log(
+                f"[{entry.port}] open failed ({error}); "
+                f"retry {entry.failures} in {entry.retry_at - time.monotonic():.1f}s"
+            )
+
+
+class AsyncCameraController:
+    """asyncio front end of CameraController.
+
+    Every SDK call runs on a dedicated thread that owns the camera session and
+    pumps its messages; coroutines only await futures. capture() is resolved by
+    the object event handler through call_soon_threadsafe, so no thread blocks
+    while the file is transferred.
+    """
+
+    def __init__(self, index: int = 0, save_dir: str = ".", **options: Any) -> None:
+        self._controller = CameraController(index=index, save_dir=save_dir, **options)
+        self._thread: Optional[SdkExecutor] = None
+
+    @property
+    def controller(self) -> CameraController:
+        """The wrapped controller; call into it only through run()."""
+        return self._controller
+
+    async def __aenter__(self) -> "AsyncCameraController":
+        self._thread = SdkExecutor(
+            f"edsdk-async-{self._controller.index}", own_sdk=False
+        )
+        try:
+            await self.run(CameraController.__enter__)
+        except BaseException:
+            await self._stop_thread()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            await self.run(CameraController.__exit__, exc_type, exc, tb)
+        finally:
+            await self._stop_thread()
+
+    async def _stop_thread(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            await asyncio.get_running_loop().run_in_executor(None, thread.shutdown)
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> asyncio.Future:
+        """Run fn(controller, *args, **kwargs) on the camera thread; await the result."""
+        if self._thread is None:
+            raise RuntimeError("Camera session not open")
+        call = functools.partial(fn, self._controller, *args, **kwargs)
+        return asyncio.wrap_future(self._thread.submit(call))
+
+    async def capture(
+        self, timeout: float = 5.0, *, filename: Optional[str] = None
+    ) -> Optional[str]:
+        """Take one picture and return the saved path once it has been transferred.
+
+        Raises the download's error if the transfer fails (e.g. it kept stalling),
+        and TransferSkipped if enable_previews() skipped the file.
+        """
+        loop = asyncio.get_running_loop()
+        pending = (loop, loop.create_future())
+        # Registered before the trigger: the transfer may arrive before it returns
+        self._controller._transfer_futures.append(pending)
+        try:
+            await self.run(self._trigger, filename, timeout)
+            # Not wait_for(): a failed transfer's own TimeoutError (a stalled
+            # download) must not be reported as a missing transfer event
+            done, _pending = await asyncio.wait((pending[1],), timeout=timeout)
+            if not done:
+                raise TimeoutError("Timed out waiting for image transfer event")
+            return pending[1].result()
+        finally:
+            with contextlib.suppress(ValueError):
+                self._controller._transfer_futures.remove(pending)
+
+    @staticmethod
+    def _trigger(
+        camera: CameraController, filename: Optional[str], timeout: float
+    ) -> None:
+        if camera._cam is None:
+            raise RuntimeError("Camera session not open")
+        if filename is not None:
+            camera._next_filename = filename
+        camera._take_picture(timeout)
+
+    async def set_properties(self, **properties: Any) -> None:
+        await self.run(CameraController.set_properties, **properties)
+
+    async def get_properties(self) -> Dict[str, Union[str, int]]:
+        return await self.run(CameraController.get_properties)
+
+    async def list_supported(self) -> Dict[str, List[str]]:
+        return await self.run(CameraController.list_supported)
+
+    async def live_view(
+        self, *, interval: float = 0.0, copy: bool = True
+    ) -> AsyncIterator[LiveViewData]:
+        """Yield live-view JPEG frames; live view is stopped again on exit if started here.
+
+        With copy=False each frame is a memoryview valid until the next one is requested.
+        """
+        started = not self._controller._live_view_on
+        if started:
+            await self.run(CameraController.start_live_view)
+        try:
+            while True:
+                yield await self.run(CameraController.grab_live_view_frame, copy=copy)
+                if interval > 0:
+                    await asyncio.sleep(interval)
+        finally:
+            if started and self._thread is not None:
+                await self.run(CameraController.stop_live_view)
+
+
+def _files_per_shot(image_quality: int) -> int:
+    """Files one shot produces with this ImageQuality: 2 for RAW+JPEG, else 1."""
+    return 1 if image_quality & 0xFFFF == _QUALITY_NO_SECONDARY else 2
+
+
 def _iso_code_to_string(code: int) -> str:
     try:
         if code == int(ISOSpeedCamera.ISOAuto):
             return "Auto"
-        for name in ISOSpeedCamera.__members__:
-            if int(getattr(ISOSpeedCamera, name)) == code:
-                return name.replace("ISO", "")
+        name = _enum_names(ISOSpeedCamera).get(int(code))
+        if name is not None:
+            return name.replace("ISO", "")
     except Exception:
         pass
     return str(code)
 
 
+@functools.lru_cache(maxsize=None)
+def _enum_names(enum_cls: Type[object]) -> Dict[int, str]:
+    """Code -> member name of an enum (first name wins for aliases)."""
+    names: Dict[int, str] = {}
+    for name, member in enum_cls.__members__.items():
+        names.setdefault(int(member), name)
+    return names
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_codes_by_lower_name(enum_cls: Type[object]) -> Dict[str, int]:
+    """Lower-cased member name -> code of an enum."""
+    codes: Dict[str, int] = {}
+    for name, member in enum_cls.__members__.items():
+        codes.setdefault(name.lower(), int(member))
+    return codes
+
+
+def _enum_name(enum_cls: Type[object], code: int) -> str:
+    return _enum_names(enum_cls).get(int(code), str(code))
+
+
 def classify_error(exc: Exception) -> Dict[str, Union[int, str, None]]:
     """Return a structured error info for EdsError exceptions.
     Includes SDK error code and human-readable message from edsdk_utils.
@@ -990,9 +3387,9 @@ def _enum_code(enum_cls: Type[object], value: Union[str, int]) -> int:
         if alias_key in aliases:
             key = aliases[alias_key]
     # Accept case-insensitive and some friendly aliases
-    for name, member in enum_cls.__members__.items():
-        if name.lower() == key.lower():
-            return int(member)
+    code = _enum_codes_by_lower_name(enum_cls).get(key.lower())
+    if code is not None:
+        return code
     # Also accept numeric string
     if key.isdigit():
         return int(key)
@@ -1007,12 +3404,5 @@ def _enum_supported_names(
         # if descriptors not available, return all enum names as hint
         return list(enum_cls.__members__.keys())
     for code in codes:
-        matched = False
-        for name, member in enum_cls.__members__.items():
-            if int(member) == int(code):
-                names.append(name)
-                matched = True
-                break
-        if not matched:
-            names.append(str(code))
+        names.append(_enum_name(enum_cls, code))
     return names
@@ -91,6 +91,12 @@ class FileCreateDisposition(IntEnum):
     TruncateExisting = 4
 
 
+class SeekOrigin(IntEnum):
+    Cur = 0
+    Begin = 1
+    End = 2
+
+
 class ImageSource(IntEnum):
     FullView = 0
     Thumbnail = 1
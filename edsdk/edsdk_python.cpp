@@ -6,23 +6,209 @@
 
 #include <cassert>
 #include <cstring>
+#include <initializer_list>
 #include <iostream>
 #include <map>
+#include <vector>
 
 
 typedef struct {
     PyObject_HEAD
     EdsBaseRef edsObj;
+    // Number of buffer views exported over the stream memory
+    Py_ssize_t exports;
+    // The stream an EvfImageRef writes to (see PyEds_CreateEvfImageRef)
+    PyObject *stream;
 } PyEdsObject;
 
 
+// Python callables registered as SDK event handlers.
+// Each EdsBaseRef gets its own set of slots, so handlers installed on one
+// camera (or stream) never replace the ones installed on another.
+// The SDK receives a pointer to the slot as the handler context, hence the
+// slots are heap allocated and only freed once the SDK object is destroyed.
+// The registry and the slots are only accessed with the GIL held.
+enum CallbackKind {
+    kCallback_Progress,
+    kCallback_PropertyEvent,
+    kCallback_ObjectEvent,
+    kCallback_StateEvent,
+    kCallback_Count
+};
+
+
+struct CallbackSlot {
+    PyObject* callable;
+    PyObject* context;
+};
+
+
+struct CallbackSlots {
+    CallbackSlot slots[kCallback_Count];
+};
+
+
+static std::map<EdsBaseRef, CallbackSlots*> callbackRegistry;
+
+
+static CallbackSlot* CallbackSlot_Get(EdsBaseRef ref, const CallbackKind kind) {
+    auto it = callbackRegistry.find(ref);
+    if (it == callbackRegistry.end()) {
+        it = callbackRegistry.emplace(ref, new CallbackSlots{}).first;
+    }
+    return &it->second->slots[kind];
+}
+
+
+static void CallbackSlot_Set(CallbackSlot* slot, PyObject* callable, PyObject* context) {
+    PyObject* oldCallable = slot->callable;
+    PyObject* oldContext = slot->context;
+    Py_XINCREF(callable);
+    Py_XINCREF(context);
+    slot->callable = callable;
+    slot->context = context;
+    // Released after the swap, a handler running concurrently holds its own
+    // references (see CallbackSlot_Call)
+    Py_XDECREF(oldCallable);
+    Py_XDECREF(oldContext);
+}
+
+
+static void CallbackSlot_Clear(EdsBaseRef ref, const CallbackKind kind) {
+    auto it = callbackRegistry.find(ref);
+    if (it != callbackRegistry.end()) {
+        CallbackSlot_Set(&it->second->slots[kind], nullptr, nullptr);
+    }
+}
+
+
+static void CallbackRegistry_Remove(EdsBaseRef ref) {
+    auto it = callbackRegistry.find(ref);
+    if (it == callbackRegistry.end()) {
+        return;
+    }
+    CallbackSlots* slots = it->second;
+    callbackRegistry.erase(it);
+    for (int i = 0; i < kCallback_Count; i++) {
+        CallbackSlot_Set(&slots->slots[i], nullptr, nullptr);
+    }
+    delete slots;
+}
+
+
+// Calls the callable in the slot with args, followed by the context if one
+// was registered. Returns the callback return value as an EdsError.
+// An exception raised by the callback is reported through
+// PyErr_WriteUnraisable, so none is left set when the SDK thread continues.
+// Must be called with the GIL held.
+static EdsError CallbackSlot_Call(CallbackSlot* slot, std::initializer_list<PyObject*> args) {
+    PyObject* callable = slot->callable;
+    PyObject* context = slot->context;
+    if (callable == nullptr) {
+        return EDS_ERR_OK;
+    }
+    Py_INCREF(callable);
+    Py_XINCREF(context);
+
+    const Py_ssize_t nArgs = args.size() + (context != nullptr ? 1 : 0);
+    PyObject* pyArgs = PyTuple_New(nArgs);
+    Py_ssize_t i = 0;
+    for (PyObject* arg: args) {
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(pyArgs, i++, arg);
+    }
+    if (context != nullptr) {
+        Py_INCREF(context);
+        PyTuple_SET_ITEM(pyArgs, i, context);
+    }
+
+    PyObject* pyRetVal = PyObject_Call(callable, pyArgs, nullptr);
+    Py_DECREF(pyArgs);
+    Py_XDECREF(context);
+    if (pyRetVal == nullptr) {
+        PyErr_WriteUnraisable(callable);
+        Py_DECREF(callable);
+        return EDS_ERR_INVALID_FN_POINTER;
+    }
+
+    EdsError retVal(EDS_ERR_OK);
+    if (PyLong_Check(pyRetVal)) {
+        retVal = PyLong_AsUnsignedLong(pyRetVal);
+        if (PyErr_Occurred()) {
+            // Negative or too large for an EdsError
+            PyErr_WriteUnraisable(callable);
+            retVal = EDS_ERR_INVALID_FN_POINTER;
+        }
+    }
+    Py_DECREF(pyRetVal);
+    Py_DECREF(callable);
+    return retVal;
+}
+
+
 static void PyEdsObject_dealloc(PyEdsObject* self)
 {
-	EdsRelease(self->edsObj);
+	if (self->edsObj != nullptr && EdsRelease(self->edsObj) == 0) {
+		CallbackRegistry_Remove(self->edsObj);
+	}
+	// Released after the EvfImageRef that writes to it
+	Py_XDECREF(self->stream);
 	Py_TYPE(self)->tp_free((PyObject*) self);
 }
 
 
+// Buffer protocol: memory streams expose their backing storage (EdsGetPointer)
+// sized by EdsGetLength, so the data can be read without copying.
+// Other objects (file streams, cameras, ...) raise BufferError.
+static int PyEdsObject_getbuffer(PyEdsObject* self, Py_buffer* view, int flags)
+{
+    EdsVoid* pointer = nullptr;
+    EdsUInt64 length = 0;
+    EdsError retVal = EdsGetPointer(self->edsObj, &pointer);
+    if (retVal == EDS_ERR_OK) {
+        retVal = EdsGetLength(self->edsObj, &length);
+    }
+    if (retVal != EDS_ERR_OK || (pointer == nullptr && length > 0)) {
+        PyErr_Format(PyExc_BufferError,
+                     "EdsObject does not expose memory (error %lu)",
+                     static_cast<unsigned long>(retVal));
+        view->obj = nullptr;
+        return -1;
+    }
+    if (PyBuffer_FillInfo(view, (PyObject*) self, pointer,
+                          static_cast<Py_ssize_t>(length), 0, flags) < 0) {
+        return -1;
+    }
+    self->exports++;
+    return 0;
+}
+
+
+static void PyEdsObject_releasebuffer(PyEdsObject* self, Py_buffer* Py_UNUSED(view))
+{
+    self->exports--;
+}
+
+
+// Writing to a memory stream may reallocate its memory under exported views,
+// so SDK calls writing to a stream are refused while views exist.
+// Returns false with BufferError set.
+static bool PyEdsObject_CheckWritable(PyEdsObject* stream)
+{
+    if (stream->exports > 0) {
+        PyErr_SetString(PyExc_BufferError, "Existing exports of data: stream cannot be written");
+        return false;
+    }
+    return true;
+}
+
+
+static PyBufferProcs PyEdsObject_as_buffer = {
+    (getbufferproc) PyEdsObject_getbuffer,
+    (releasebufferproc) PyEdsObject_releasebuffer,
+};
+
+
 static PyTypeObject PyEdsObjectType = {
     PyVarObject_HEAD_INIT(NULL, 0)
     "edsdk.api.EdsObject",        /* tp_name */
@@ -42,7 +228,7 @@ static PyTypeObject PyEdsObjectType = {
     0,                              /* tp_str */
     0,                              /* tp_getattro */
     0,                              /* tp_setattro */
-    0,                              /* tp_as_buffer */
+    &PyEdsObject_as_buffer,         /* tp_as_buffer */
     Py_TPFLAGS_DEFAULT,             /* tp_flags */
     PyDoc_STR("EdsObject object"),/* tp_doc */
 };
@@ -131,6 +317,8 @@ inline PyObject* PyEdsObject_New(EdsBaseRef inObject) {
         return nullptr;
     }
     pyObj->edsObj = inObject;
+    pyObj->exports = 0;
+    pyObj->stream = nullptr;
     return (PyObject*)pyObj;
 }
 
@@ -144,29 +332,81 @@ inline PyEdsObject* PyToEds(PyObject* inObject) {
 }
 
 
-template<typename T>
-inline PyObject* GetEnum(const char* moduleName, const char* enumClassName, const T enumValue){
-    PyObject* module = PyImport_AddModule(moduleName);
-    if (!module) {
-        std::cout << "failed to import module " << moduleName << std::endl;
-        PyErr_Format(PyExc_ValueError, "failed to import module %s", moduleName);
-        return nullptr;
+// Enum classes from edsdk.constants used to convert SDK values.
+// The classes are resolved once in PyInit_api, and the members are cached
+// per value on first use so the event callbacks never do a lookup.
+enum EnumClass {
+    kEnum_DataType,
+    kEnum_BatteryQuality,
+    kEnum_DeviceSubType,
+    kEnum_StorageType,
+    kEnum_Access,
+    kEnum_ObjectFormat,
+    kEnum_PropertyEvent,
+    kEnum_PropID,
+    kEnum_ObjectEvent,
+    kEnum_StateEvent,
+    kEnum_Count
+};
+
+
+struct EnumCache {
+    const char* name;
+    PyObject* enumClass;
+    // value -> enum member (strong reference), or nullptr for values
+    // that are not part of the enum
+    std::map<long long, PyObject*> members;
+};
+
+
+static EnumCache enumCache[kEnum_Count] = {
+    {"DataType", nullptr, {}},
+    {"BatteryQuality", nullptr, {}},
+    {"DeviceSubType", nullptr, {}},
+    {"StorageType", nullptr, {}},
+    {"Access", nullptr, {}},
+    {"ObjectFormat", nullptr, {}},
+    {"PropertyEvent", nullptr, {}},
+    {"PropID", nullptr, {}},
+    {"ObjectEvent", nullptr, {}},
+    {"StateEvent", nullptr, {}},
+};
+
+
+bool InitEnumCache(PyObject* constants) {
+    for (int i = 0; i < kEnum_Count; i++) {
+        PyObject* enumClass = PyObject_GetAttrString(constants, enumCache[i].name);
+        if (!enumClass) {
+            return false;
+        }
+        enumCache[i].enumClass = enumClass;
     }
-    PyObject* enumClass = PyObject_GetAttrString(module, enumClassName);
-    if (!enumClass) {
-        std::cout << "failed to get enum class " << enumClassName << std::endl;
-        PyErr_Format(PyExc_ValueError, "failed to get enum class %s", enumClassName);
-        return nullptr;
+    return true;
+}
+
+
+template<typename T>
+inline PyObject* GetEnum(const EnumClass enumClass, const T enumValue){
+    EnumCache &cache = enumCache[enumClass];
+    const long long key = static_cast<long long>(enumValue);
+    auto it = cache.members.find(key);
+    if (it != cache.members.end()) {
+        if (it->second == nullptr) {
+            PyErr_Format(PyExc_ValueError, "failed to get enum value %lld", key);
+            return nullptr;
+        }
+        Py_INCREF(it->second);
+        return it->second;
     }
-    PyObject* enumValueObj = PyObject_CallFunction(enumClass, "(i)", enumValue);
+
+    PyObject* enumValueObj = PyObject_CallFunction(cache.enumClass, "(L)", key);
     if (!enumValueObj) {
-        std::cout << "failed to call enum class " << enumClassName << std::endl;
-        PyErr_Format(PyExc_ValueError, "failed to get enum value %d", (int)enumValue);
-        Py_DECREF(enumClass);
+        PyErr_Format(PyExc_ValueError, "failed to get enum value %lld", key);
+        cache.members[key] = nullptr;
         return nullptr;
     }
-
-    Py_DECREF(enumClass);
+    Py_INCREF(enumValueObj);
+    cache.members[key] = enumValueObj;
     return enumValueObj;
 }
 
@@ -178,7 +418,10 @@ PyDoc_STRVAR(PyEds_InitializeSDK__doc__,
 ":raises EdsError: Any of the sdk errors.");
 
 static PyObject* PyEds_InitializeSDK(PyObject *Py_UNUSED(self)) {
-    unsigned long retVal(EdsInitializeSDK());
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsInitializeSDK();
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     Py_RETURN_NONE;
 }
@@ -191,7 +434,10 @@ PyDoc_STRVAR(PyEds_TerminateSDK__doc__,
 ":raises EdsError: Any of the sdk errors.");
 
 static PyObject* PyEds_TerminateSDK(PyObject *Py_UNUSED(self)) {
-    unsigned long retVal(EdsTerminateSDK());
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsTerminateSDK();
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     Py_RETURN_NONE;
 }
@@ -302,10 +548,13 @@ static PyObject* PyEds_GetPropertySize(PyObject *Py_UNUSED(self), PyObject *args
     EdsDataType dataType;
     unsigned long dataSize;
 
-    unsigned long retVal(EdsGetPropertySize(edsObj->edsObj, propertyID, param, &dataType, &dataSize));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetPropertySize(edsObj->edsObj, propertyID, param, &dataType, &dataSize);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
-    PyObject *pyEnumVal = GetEnum("edsdk.constants", "DataType", dataType);
+    PyObject *pyEnumVal = GetEnum(kEnum_DataType, dataType);
     if (pyEnumVal == nullptr) {
         PyErr_Clear();
         std::cout << "Unknown Data Type: " << dataType  << std::endl;
@@ -319,41 +568,11 @@ static PyObject* PyEds_GetPropertySize(PyObject *Py_UNUSED(self), PyObject *args
 }
 
 
-PyDoc_STRVAR(PyEds_GetPropertyData__doc__,
-"Gets property information from the designated object.\n\n"
-":param EdsObject camera_or_image: The reference of the item.\n"
-":param PropID property_id: The PropertyID.\n"
-":param int param: Specify an index in case there are two or\n"
-"\tmore values over the same ID, defaults to 0.\n"
-":raises EdsError: Any of the sdk errors.\n"
-":return Any: The property value.");
-
-static PyObject* PyEds_GetPropertyData(PyObject *Py_UNUSED(self), PyObject *args) {
-    PyObject* pyObj;
-    unsigned long propertyID;
-    long param = 0;
-    if (!PyArg_ParseTuple(args, "Okl:EdsGetPropertyData", &pyObj, &propertyID, &param)) {
-        return nullptr;
-    }
-    PyEdsObject* edsObj = PyToEds(pyObj);
-    if (!edsObj) {
-        return nullptr;
-    }
-
-    EdsDataType dataType;
-    unsigned long dataSize;
-
-    unsigned long retVal(EdsGetPropertySize(edsObj->edsObj, propertyID, param, &dataType, &dataSize));
-    PyCheck_EDSERROR(retVal);
-
+// Converts a raw property value, as filled in by EdsGetPropertyData, to a
+// Python object. Returns nullptr with an exception set on failure.
+static PyObject* PyEds_PropertyDataToPy(
+    EdsPropertyID propertyID, EdsDataType dataType, void *propertyData, EdsUInt32 dataSize) {
     PyObject *pyPropertyData = nullptr;
-    void *propertyData = new (std::nothrow) uint8_t[dataSize];
-    if (propertyData == nullptr) {
-        PyErr_NoMemory();
-        return nullptr;
-    }
-    retVal = EdsGetPropertyData(edsObj->edsObj, propertyID, param, dataSize, propertyData);
-    PyCheck_EDSERROR(retVal);
     switch (dataType){
         case kEdsDataType_Bool: {
             pyPropertyData = PyBool_FromLong(*static_cast<int *>(propertyData));
@@ -367,7 +586,7 @@ static PyObject* PyEds_GetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
         case kEdsDataType_UInt16:
         case kEdsDataType_UInt32: {
             if (propertyID == kEdsPropID_BatteryQuality) {
-                pyPropertyData = GetEnum("edsdk.constants", "BatteryQuality", *static_cast<int *>(propertyData));
+                pyPropertyData = GetEnum(kEnum_BatteryQuality, *static_cast<int *>(propertyData));
                 if (pyPropertyData == nullptr) {
                     PyErr_Clear();
                     std::cout << "Unknown Battery Quality: " << *static_cast<int *>(propertyData) << std::endl;
@@ -448,9 +667,15 @@ static PyObject* PyEds_GetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
             PyObject *pyFocusPointTuple = PyTuple_New(1053);
             for (int i = 0; i < 1053; i++) {
                 PyObject *pyFocusPoint = PyDict_New();
-                PyDict_SetItemString(pyFocusPoint, "valid", PyLong_FromUnsignedLong(focusInfo->focusPoint[i].valid));
-                PyDict_SetItemString(pyFocusPoint, "selected", PyLong_FromUnsignedLong(focusInfo->focusPoint[i].selected));
-                PyDict_SetItemString(pyFocusPoint, "justFocus", PyLong_FromUnsignedLong(focusInfo->focusPoint[i].justFocus));
+                PyObject *pyValid = PyLong_FromUnsignedLong(focusInfo->focusPoint[i].valid);
+                PyObject *pySelected = PyLong_FromUnsignedLong(focusInfo->focusPoint[i].selected);
+                PyObject *pyJustFocus = PyLong_FromUnsignedLong(focusInfo->focusPoint[i].justFocus);
+                PyDict_SetItemString(pyFocusPoint, "valid", pyValid);
+                PyDict_SetItemString(pyFocusPoint, "selected", pySelected);
+                PyDict_SetItemString(pyFocusPoint, "justFocus", pyJustFocus);
+                Py_DECREF(pyValid);
+                Py_DECREF(pySelected);
+                Py_DECREF(pyJustFocus);
 
                 PyObject *pyRect = PyTuple_New(4);
                 PyTuple_SetItem(pyRect, 0, PyLong_FromLong(focusInfo->focusPoint[i].rect.point.x));
@@ -519,17 +744,257 @@ static PyObject* PyEds_GetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
         case kEdsDataType_UInt8_Array:
         case kEdsDataType_UInt16_Array:
         case kEdsDataType_UInt32_Array:
-        case kEdsDataType_Rational_Array:{
-            PyErr_Format(PyExc_NotImplementedError, "unable to get the property %ls", propertyID);
-            delete propertyData;
+        case kEdsDataType_Rational_Array:
+        default: {
+            PyErr_Format(PyExc_NotImplementedError, "unable to get the property %lu", propertyID);
             return nullptr;
         }
     }
-    delete propertyData;
     return pyPropertyData;
 }
 
 
+PyDoc_STRVAR(PyEds_GetPropertyData__doc__,
+"Gets property information from the designated object.\n\n"
+":param EdsObject camera_or_image: The reference of the item.\n"
+":param PropID property_id: The PropertyID.\n"
+":param int param: Specify an index in case there are two or\n"
+"\tmore values over the same ID, defaults to 0.\n"
+":raises EdsError: Any of the sdk errors.\n"
+":return Any: The property value.");
+
+static PyObject* PyEds_GetPropertyData(PyObject *Py_UNUSED(self), PyObject *args) {
+    PyObject* pyObj;
+    unsigned long propertyID;
+    long param = 0;
+    if (!PyArg_ParseTuple(args, "Okl:EdsGetPropertyData", &pyObj, &propertyID, &param)) {
+        return nullptr;
+    }
+    PyEdsObject* edsObj = PyToEds(pyObj);
+    if (!edsObj) {
+        return nullptr;
+    }
+
+    EdsDataType dataType;
+    unsigned long dataSize;
+
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetPropertySize(edsObj->edsObj, propertyID, param, &dataType, &dataSize);
+    Py_END_ALLOW_THREADS
+    PyCheck_EDSERROR(retVal);
+
+    void *propertyData = new (std::nothrow) uint8_t[dataSize];
+    if (propertyData == nullptr) {
+        PyErr_NoMemory();
+        return nullptr;
+    }
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetPropertyData(edsObj->edsObj, propertyID, param, dataSize, propertyData);
+    Py_END_ALLOW_THREADS
+    if (retVal != EDS_ERR_OK) {
+        delete[] static_cast<uint8_t *>(propertyData);
+        PyCheck_EDSERROR(retVal);
+    }
+    PyObject *pyPropertyData = PyEds_PropertyDataToPy(propertyID, dataType, propertyData, dataSize);
+    delete[] static_cast<uint8_t *>(propertyData);
+    return pyPropertyData;
+}
+
+
+PyDoc_STRVAR(PyEds_GetPropertyDataBytes__doc__,
+"Gets the raw, undecoded property data from the designated object.\n\n"
+"The data is read straight into the returned bytes with the GIL released.\n"
+"\tUse it for large structures such as FocusInfo, see edsdk.focus_info.\n\n"
+":param EdsObject camera_or_image: The reference of the item.\n"
+":param PropID property_id: The PropertyID.\n"
+":param int param: Specify an index in case there are two or\n"
+"\tmore values over the same ID, defaults to 0.\n"
+":raises EdsError: Any of the sdk errors.\n"
+":return bytes: The property data, laid out as the EDSDK structure.");
+
+static PyObject* PyEds_GetPropertyDataBytes(PyObject *Py_UNUSED(self), PyObject *args) {
+    PyObject* pyObj;
+    unsigned long propertyID;
+    long param = 0;
+    if (!PyArg_ParseTuple(args, "Ok|l:EdsGetPropertyDataBytes", &pyObj, &propertyID, &param)) {
+        return nullptr;
+    }
+    PyEdsObject* edsObj = PyToEds(pyObj);
+    if (!edsObj) {
+        return nullptr;
+    }
+
+    EdsDataType dataType;
+    unsigned long dataSize;
+
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetPropertySize(edsObj->edsObj, propertyID, param, &dataType, &dataSize);
+    Py_END_ALLOW_THREADS
+    PyCheck_EDSERROR(retVal);
+
+    PyObject *pyData = PyBytes_FromStringAndSize(nullptr, dataSize);
+    if (pyData == nullptr) {
+        return nullptr;
+    }
+    char *buffer = PyBytes_AS_STRING(pyData);
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetPropertyData(edsObj->edsObj, propertyID, param, dataSize, buffer);
+    Py_END_ALLOW_THREADS
+    if (retVal != EDS_ERR_OK) {
+        Py_DECREF(pyData);
+        PyCheck_EDSERROR(retVal);
+    }
+    return pyData;
+}
+
+
+// Builds an EdsError instance (not raised) for the given error code.
+static PyObject* PyEdsError_FromCode(EdsError err) {
+    PyObject *exc_args = Py_BuildValue("(sl)", EDS::errorMessage(err), static_cast<long>(err));
+    if (exc_args == nullptr) {
+        return nullptr;
+    }
+    PyObject *pyErr = PyObject_CallObject(PyEdsError, exc_args);
+    Py_DECREF(exc_args);
+    return pyErr;
+}
+
+
+// Takes the currently raised exception and returns its instance.
+static PyObject* PyErr_FetchInstance() {
+    PyObject *type, *value, *traceback;
+    PyErr_Fetch(&type, &value, &traceback);
+    PyErr_NormalizeException(&type, &value, &traceback);
+    if (traceback != nullptr) {
+        PyException_SetTraceback(value, traceback);
+    }
+    Py_XDECREF(type);
+    Py_XDECREF(traceback);
+    return value;
+}
+
+
+struct PropertyRequest {
+    EdsPropertyID propertyID;
+    EdsInt32 param;
+    EdsDataType dataType;
+    EdsUInt32 dataSize;
+    EdsUInt32 offset;
+    EdsError error;
+};
+
+
+PyDoc_STRVAR(PyEds_GetPropertyDataMany__doc__,
+"Gets several properties from the designated object in one call.\n\n"
+"All the size and data requests are made with the GIL released,\n"
+"\tinto a single buffer shared by the whole batch.\n\n"
+":param EdsObject camera_or_image: The reference of the item.\n"
+":param Iterable[Union[PropID, Tuple[PropID, int]]] properties: The\n"
+"\tPropertyIDs to get, optionally paired with the param index.\n"
+":raises EdsError: Only for errors that are not specific to a property.\n"
+":return Tuple[Any, ...]: The property values, in request order.\n"
+"\tA property that could not be read is returned as the exception\n"
+"\tinstance (usually an EdsError) instead of being raised.");
+
+static PyObject* PyEds_GetPropertyDataMany(PyObject *Py_UNUSED(self), PyObject *args) {
+    PyObject *pyObj;
+    PyObject *pyProperties;
+    if (!PyArg_ParseTuple(args, "OO:EdsGetPropertyDataMany", &pyObj, &pyProperties)) {
+        return nullptr;
+    }
+    PyEdsObject* edsObj = PyToEds(pyObj);
+    if (!edsObj) {
+        return nullptr;
+    }
+    PyObject *pySeq = PySequence_Fast(pyProperties, "properties must be iterable");
+    if (pySeq == nullptr) {
+        return nullptr;
+    }
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(pySeq);
+    std::vector<PropertyRequest> requests(count);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *pyItem = PySequence_Fast_GET_ITEM(pySeq, i);
+        unsigned long propertyID;
+        long param = 0;
+        if (PyTuple_Check(pyItem)) {
+            if (!PyArg_ParseTuple(pyItem, "k|l:EdsGetPropertyDataMany", &propertyID, &param)) {
+                Py_DECREF(pySeq);
+                return nullptr;
+            }
+        }
+        else {
+            propertyID = PyLong_AsUnsignedLong(pyItem);
+            if (PyErr_Occurred()) {
+                Py_DECREF(pySeq);
+                return nullptr;
+            }
+        }
+        requests[i].propertyID = propertyID;
+        requests[i].param = param;
+    }
+    Py_DECREF(pySeq);
+
+    // Small batches (the usual scalar properties) fit in the stack buffer,
+    // larger ones (e.g. FocusInfo) get one heap allocation for the batch.
+    alignas(8) uint8_t stackBuffer[1024];
+    uint8_t *buffer = stackBuffer;
+    Py_BEGIN_ALLOW_THREADS
+    EdsUInt32 total = 0;
+    for (PropertyRequest &request : requests) {
+        request.error = EdsGetPropertySize(
+            edsObj->edsObj, request.propertyID, request.param, &request.dataType, &request.dataSize);
+        if (request.error == EDS_ERR_OK) {
+            request.offset = total;
+            total += (request.dataSize + 7) & ~static_cast<EdsUInt32>(7);
+        }
+    }
+    if (total > sizeof(stackBuffer)) {
+        buffer = new (std::nothrow) uint8_t[total];
+    }
+    if (buffer != nullptr) {
+        for (PropertyRequest &request : requests) {
+            if (request.error == EDS_ERR_OK) {
+                request.error = EdsGetPropertyData(
+                    edsObj->edsObj, request.propertyID, request.param,
+                    request.dataSize, buffer + request.offset);
+            }
+        }
+    }
+    Py_END_ALLOW_THREADS
+    if (buffer == nullptr) {
+        PyErr_NoMemory();
+        return nullptr;
+    }
+
+    PyObject *result = PyTuple_New(count);
+    for (Py_ssize_t i = 0; result != nullptr && i < count; i++) {
+        const PropertyRequest &request = requests[i];
+        PyObject *pyValue;
+        if (request.error != EDS_ERR_OK) {
+            pyValue = PyEdsError_FromCode(request.error);
+        }
+        else {
+            pyValue = PyEds_PropertyDataToPy(
+                request.propertyID, request.dataType, buffer + request.offset, request.dataSize);
+            if (pyValue == nullptr) {
+                pyValue = PyErr_FetchInstance();
+            }
+        }
+        if (pyValue == nullptr) {
+            Py_CLEAR(result);
+            break;
+        }
+        PyTuple_SET_ITEM(result, i, pyValue);
+    }
+    if (buffer != stackBuffer) {
+        delete[] buffer;
+    }
+    return result;
+}
+
+
 PyDoc_STRVAR(PyEds_SetPropertyData__doc__,
 "Sets property data for the designated object.\n\n"
 ":param EdsObject camera_or_image: The item object.\n"
@@ -555,7 +1020,10 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
 
     EdsDataType dataType;
     unsigned long dataSize;
-    unsigned long retVal(EdsGetPropertySize(edsObj->edsObj, propertyID, param, &dataType, &dataSize));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetPropertySize(edsObj->edsObj, propertyID, param, &dataType, &dataSize);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     uint8_t *propertyData = nullptr;
@@ -567,7 +1035,7 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
             if (!PyBool_Check(pyPropertyData))
             {
                 PyErr_Format(PyExc_TypeError, "Properppty %lu expects boolean", propertyID);
-                delete propertyData;
+                delete[] propertyData;
                 return nullptr;
             }
             *propertyData = PyObject_IsTrue(pyPropertyData) ? true : false;
@@ -588,11 +1056,18 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
             if (!pyString) {
                 return nullptr;
             }
-            propertyData = reinterpret_cast<uint8_t *>(strdup(PyBytes_AsString(pyString)));
+            // Allocated with new[] like the fixed-size types, so the delete[] below matches.
+            // Zero-filled and at least dataSize bytes, as the SDK reads dataSize bytes.
+            unsigned long length = static_cast<unsigned long>(PyBytes_GET_SIZE(pyString));
+            if (length + 1 > dataSize) {
+                dataSize = length + 1;
+            }
+            propertyData = new (std::nothrow) uint8_t[dataSize]();
             if (!propertyData) {
                 Py_DECREF(pyString);
-                return nullptr;
+                return PyErr_NoMemory();
             }
+            memcpy(propertyData, PyBytes_AS_STRING(pyString), length);
             Py_DECREF(pyString);
             break;
         }
@@ -601,7 +1076,7 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
     case kEdsDataType_UInt32: {
         if (!PyLong_Check(pyPropertyData)) {
             PyErr_Format(PyExc_TypeError, "Property %lu expects unsigned int", propertyID);
-            delete propertyData;
+            delete[] propertyData;
             return nullptr;
         }
         unsigned long uLongVal = PyLong_AsUnsignedLong(pyPropertyData);
@@ -611,7 +1086,7 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
     case kEdsDataType_UInt64: {
         if (!PyLong_Check(pyPropertyData)) {
             PyErr_Format(PyExc_TypeError, "Property %lu expects unsigned int", propertyID);
-            delete propertyData;
+            delete[] propertyData;
             return nullptr;
         }
         unsigned long long uLongLongVal = PyLong_AsUnsignedLongLong(pyPropertyData);
@@ -623,7 +1098,7 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
     case kEdsDataType_Int32: {
         if (!PyLong_Check(pyPropertyData)) {
             PyErr_Format(PyExc_TypeError, "Property %lu expects int", propertyID);
-            delete propertyData;
+            delete[] propertyData;
             return nullptr;
         }
         long longVal = PyLong_AsLong(pyPropertyData);
@@ -633,7 +1108,7 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
     case kEdsDataType_Int64: {
         if (!PyLong_Check(pyPropertyData)) {
             PyErr_Format(PyExc_TypeError, "Property %lu expects int", propertyID);
-            delete propertyData;
+            delete[] propertyData;
             return nullptr;
         }
         long long longLongVal = PyLong_AsLongLong(pyPropertyData);
@@ -644,7 +1119,7 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
     case kEdsDataType_Double: {
         if (!PyFloat_Check(pyPropertyData)) {
             PyErr_Format(PyExc_TypeError, "Property %lu expects float", propertyID);
-            delete propertyData;
+            delete[] propertyData;
             return nullptr;
         }
         double doubleVal = PyFloat_AsDouble(pyPropertyData);
@@ -679,7 +1154,7 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
         if (error) {
             PyErr_Format(PyExc_TypeError, "Property %lu expects a sequence of two ints", propertyID);
             PyErr_Format(PyExc_TypeError, "Property %lu expects a sequence of two ints", propertyID);
-            delete propertyData;
+            delete[] propertyData;
             return nullptr;
         }
         break;
@@ -700,7 +1175,7 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
     case kEdsDataType_UInt32_Array:
     case kEdsDataType_Rational_Array:{
         PyErr_Format(PyExc_NotImplementedError, "unable to get the property %ls", propertyID);
-        delete propertyData;
+        delete[] propertyData;
         return nullptr;
     }
     }
@@ -708,7 +1183,10 @@ static PyObject* PyEds_SetPropertyData(PyObject *Py_UNUSED(self), PyObject *args
         PyErr_Format(PyExc_MemoryError, "failed to allocate memory");
         return nullptr;
     }
+    Py_BEGIN_ALLOW_THREADS
     retVal = EdsSetPropertyData(edsObj->edsObj, propertyID, param, dataSize, propertyData);
+    Py_END_ALLOW_THREADS
+    delete[] propertyData;
     PyCheck_EDSERROR(retVal);
 
     Py_RETURN_NONE;
@@ -737,7 +1215,10 @@ static PyObject* PyEds_GetPropertyDesc(PyObject *Py_UNUSED(self), PyObject *args
     }
 
     EdsPropertyDesc propertyDesc;
-    EdsError retVal = EdsGetPropertyDesc(edsObj->edsObj, propertyID, &propertyDesc);
+    EdsError retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetPropertyDesc(edsObj->edsObj, propertyID, &propertyDesc);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     PyObject *pyForm = PyLong_FromLong(propertyDesc.form);
@@ -774,7 +1255,10 @@ PyDoc_STRVAR(PyEds_GetCameraList__doc__,
 
 static PyObject* PyEds_GetCameraList(PyObject *Py_UNUSED(self)) {
     EdsCameraListRef cameraList;
-    unsigned long retVal(EdsGetCameraList(&cameraList));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetCameraList(&cameraList);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     return PyEdsObject_New(cameraList);
 }
@@ -804,10 +1288,13 @@ static PyObject* PyEds_GetDeviceInfo(PyObject *Py_UNUSED(self), PyObject *cam){
         return nullptr;
     }
     EdsDeviceInfo deviceInfo;
-    unsigned long retVal(EdsGetDeviceInfo(pyEdsCam->edsObj, &deviceInfo));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetDeviceInfo(pyEdsCam->edsObj, &deviceInfo);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
-    PyObject* pyDeviceSubtype = GetEnum("edsdk.constants", "DeviceSubType", deviceInfo.deviceSubType);
+    PyObject* pyDeviceSubtype = GetEnum(kEnum_DeviceSubType, deviceInfo.deviceSubType);
     if (pyDeviceSubtype == nullptr) {
         PyErr_Clear();
         std::cout << "Unknown device subtype: " << deviceInfo.deviceSubType << std::endl;
@@ -844,7 +1331,10 @@ static PyObject* PyEds_OpenSession(PyObject *Py_UNUSED(self), PyObject *args) {
     if (!edsObj) {
         return nullptr;
     }
-    unsigned long retVal(EdsOpenSession(edsObj->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsOpenSession(edsObj->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     Py_RETURN_NONE;
 }
@@ -864,7 +1354,10 @@ static PyObject* PyEds_CloseSession(PyObject *Py_UNUSED(self), PyObject *args) {
     if (!edsObj) {
         return nullptr;
     }
-    unsigned long retVal(EdsCloseSession(edsObj->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsCloseSession(edsObj->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     Py_RETURN_NONE;
 }
@@ -889,7 +1382,10 @@ static PyObject* PyEds_SendCommand(PyObject *Py_UNUSED(self), PyObject *args){
     if (cam == nullptr) {
         return nullptr;
     }
-    unsigned long retVal(EdsSendCommand(cam->edsObj, command, param));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsSendCommand(cam->edsObj, command, param);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     Py_RETURN_NONE;
 }
@@ -914,7 +1410,10 @@ static PyObject* PyEds_SendStatusCommand(PyObject *Py_UNUSED(self), PyObject *ar
     if (cam == nullptr) {
         return nullptr;
     }
-    unsigned long retVal(EdsSendStatusCommand(cam->edsObj, command, param));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsSendStatusCommand(cam->edsObj, command, param);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     Py_RETURN_NONE;
 }
@@ -960,7 +1459,10 @@ static PyObject* PyEds_SetCapacity(PyObject *Py_UNUSED(self), PyObject *args){
         PyLong_AsLong(pyBytesPerSector),
         PyObject_IsTrue(pyReset),
     };
-    unsigned long retVal(EdsSetCapacity(cam->edsObj, capacity));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsSetCapacity(cam->edsObj, capacity);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     Py_RETURN_NONE;
 }
@@ -978,16 +1480,19 @@ static PyObject* PyEds_GetVolumeInfo(PyObject *Py_UNUSED(self), PyObject *pyVolu
         return nullptr;
     }
     EdsVolumeInfo volumeInfo;
-    unsigned long retVal(EdsGetVolumeInfo(volume->edsObj, &volumeInfo));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetVolumeInfo(volume->edsObj, &volumeInfo);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
-    PyObject *pyStorageType = GetEnum("edsdk.constants", "StorageType", volumeInfo.storageType);
+    PyObject *pyStorageType = GetEnum(kEnum_StorageType, volumeInfo.storageType);
     if (pyStorageType == nullptr) {
         PyErr_Clear();
         std::cout << "Unknown StorageType: " << volumeInfo.storageType << std::endl;
         pyStorageType = PyLong_FromUnsignedLong(volumeInfo.storageType);
     }
-    PyObject *pyAccess = GetEnum("constants", "Access", volumeInfo.access);
+    PyObject *pyAccess = GetEnum(kEnum_Access, volumeInfo.access);
     if (pyAccess == nullptr) {
         PyErr_Clear();
         std::cout << "Unknown Access: " << volumeInfo.access << std::endl;
@@ -1024,7 +1529,10 @@ static PyObject* PyEds_FormatVolume(PyObject *Py_UNUSED(self), PyObject *pyVolum
     if (volume == nullptr) {
         return nullptr;
     }
-    unsigned long retVal(EdsFormatVolume(volume->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsFormatVolume(volume->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     Py_RETURN_NONE;
@@ -1052,7 +1560,10 @@ static PyObject* PyEds_GetDirectoryItemInfo(PyObject *Py_UNUSED(self), PyObject
         return nullptr;
     }
     EdsDirectoryItemInfo dirItemInfo;
-    unsigned long retVal(EdsGetDirectoryItemInfo(dirItem->edsObj, &dirItemInfo));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetDirectoryItemInfo(dirItem->edsObj, &dirItemInfo);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     PyObject *pySize = PyLong_FromUnsignedLongLong(dirItemInfo.size);
@@ -1060,7 +1571,7 @@ static PyObject* PyEds_GetDirectoryItemInfo(PyObject *Py_UNUSED(self), PyObject
     PyObject *pyGroupID = PyLong_FromUnsignedLong(dirItemInfo.groupID);
     PyObject *pyOption = PyLong_FromUnsignedLong(dirItemInfo.option);
     PyObject *pySzFileName = PyUnicode_DecodeFSDefault(dirItemInfo.szFileName);
-    PyObject *pyFormat = GetEnum("edsdk.constants", "ObjectFormat", dirItemInfo.format);
+    PyObject *pyFormat = GetEnum(kEnum_ObjectFormat, dirItemInfo.format);
     if (pyFormat == nullptr) {
         PyErr_Clear();
         std::cout << "Unknown ObjectFormat: " << dirItemInfo.format << std::endl;
@@ -1101,7 +1612,10 @@ static PyObject* PyEds_DeleteDirectoryItem(PyObject *Py_UNUSED(self), PyObject *
     if (dirItem == nullptr) {
         return nullptr;
     }
-    unsigned long retVal(EdsDeleteDirectoryItem(dirItem->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsDeleteDirectoryItem(dirItem->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     Py_RETURN_NONE;
@@ -1118,6 +1632,7 @@ PyDoc_STRVAR(PyEds_Download__doc__,
 ":param EdsObject dir_item: The directory item.\n"
 ":param int size: The number of bytes to be retrieved.\n"
 ":param EdsObject stream: The stream.\n"
+":raises BufferError: The stream memory is exported through a memoryview.\n"
 ":raises EdsError: Any of the sdk errors.");
 
 
@@ -1133,10 +1648,13 @@ static PyObject* PyEds_Download(PyObject *Py_UNUSED(self), PyObject *args) {
         return nullptr;
     }
     PyEdsObject* fileStream(PyToEds(pyFileStream));
-    if (fileStream == nullptr) {
+    if (fileStream == nullptr || !PyEdsObject_CheckWritable(fileStream)) {
         return nullptr;
     }
-    unsigned long retVal(EdsDownload(dirItem->edsObj, readSize, fileStream->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsDownload(dirItem->edsObj, readSize, fileStream->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     Py_RETURN_NONE;
@@ -1156,7 +1674,10 @@ static PyObject* PyEds_DownloadCancel(PyObject *Py_UNUSED(self), PyObject *pyDir
     if (dirItem == nullptr) {
         return nullptr;
     }
-    unsigned long retVal(EdsDownloadCancel(dirItem->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsDownloadCancel(dirItem->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     Py_RETURN_NONE;
@@ -1176,7 +1697,10 @@ static PyObject* PyEds_DownloadComplete(PyObject *Py_UNUSED(self), PyObject *pyD
     if (dirItem == nullptr) {
         return nullptr;
     }
-    unsigned long retVal(EdsDownloadComplete(dirItem->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsDownloadComplete(dirItem->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     Py_RETURN_NONE;
@@ -1189,13 +1713,14 @@ PyDoc_STRVAR(PyEds_DownloadThumbnail__doc__,
 "\tto the host computer.\n"
 "Downloaded thumbnails are sent directly to a file stream created in advance.\n\n"
 ":param EdsObject dir_item: The directory item.\n"
-":raises EdsError: Any of the sdk errors.\n"
-":return EdsObject: The stream.\n");
+":param EdsObject stream: The file or memory stream receiving the thumbnail.\n"
+":raises BufferError: The stream memory is exported through a memoryview.\n"
+":raises EdsError: Any of the sdk errors.");
 
 static PyObject* PyEds_DownloadThumbnail(PyObject *Py_UNUSED(self), PyObject *args) {
     PyObject *pyDirItemRef;
     PyObject *pyFileStream;
-    if (!PyArg_ParseTuple(args, "OkO:EdsDownloadThumbnail", &pyDirItemRef, &pyFileStream)) {
+    if (!PyArg_ParseTuple(args, "OO:EdsDownloadThumbnail", &pyDirItemRef, &pyFileStream)) {
         return nullptr;
     }
     PyEdsObject* dirItem(PyToEds(pyDirItemRef));
@@ -1203,10 +1728,13 @@ static PyObject* PyEds_DownloadThumbnail(PyObject *Py_UNUSED(self), PyObject *ar
         return nullptr;
     }
     PyEdsObject* fileStream(PyToEds(pyFileStream));
-    if (fileStream == nullptr) {
+    if (fileStream == nullptr || !PyEdsObject_CheckWritable(fileStream)) {
         return nullptr;
     }
-    unsigned long retVal(EdsDownloadThumbnail(dirItem->edsObj, fileStream->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsDownloadThumbnail(dirItem->edsObj, fileStream->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     Py_RETURN_NONE;
@@ -1230,7 +1758,10 @@ static PyObject* PyEds_GetAttribute(PyObject *Py_UNUSED(self), PyObject *pyDirIt
     }
     EdsFileAttributes attr;
 
-    EdsError retVal = EdsGetAttribute(dirItem->edsObj, &attr);
+    EdsError retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetAttribute(dirItem->edsObj, &attr);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     return PyLong_FromUnsignedLong(attr);
@@ -1258,8 +1789,11 @@ static PyObject* PyEds_SetAttribute(PyObject *Py_UNUSED(self), PyObject *args){
         return nullptr;
     }
 
-    EdsError retVal(EdsSetAttribute(
-        dirItem->edsObj, static_cast<EdsFileAttributes>(fileAttribute)));
+    EdsError retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsSetAttribute(
+        dirItem->edsObj, static_cast<EdsFileAttributes>(fileAttribute));
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     Py_RETURN_NONE;
@@ -1425,25 +1959,20 @@ static PyObject* PyEds_CreateMemoryStreamFromPointer(PyObject *Py_UNUSED(self),
     void * bufferPtr = nullptr;
     Py_ssize_t bufferLen = 0;
 
-    std::cout << "PyEds_CreateMemoryStreamFromPointer" << std::endl;
     if (PyMemoryView_Check(pyBufferLike)) {
-        std::cout << "PyMemoryView_Check" << std::endl;
         Py_buffer *pyBuffer = PyMemoryView_GET_BUFFER(pyBufferLike);
         if (pyBuffer->readonly) {
             PyErr_SetString(PyExc_ValueError, "Buffer is read-only");
             return nullptr;
         }
-        std::cout << "PyMemoryView_GET_BUFFER" << std::endl;
         bufferPtr = pyBuffer->buf;
         bufferLen = pyBuffer->len;
     }
     else if (PyBytes_Check(pyBufferLike)) {
-        std::cout << "PyBytes_Check" << std::endl;
         bufferPtr = PyBytes_AS_STRING(pyBufferLike);
         bufferLen = PyBytes_GET_SIZE(pyBufferLike);
     }
     else if (PyByteArray_Check(pyBufferLike)) {
-        std::cout << "PyByteArray_Check" << std::endl;
         bufferPtr = PyByteArray_AS_STRING(pyBufferLike);
         bufferLen = PyByteArray_GET_SIZE(pyBufferLike);
     }
@@ -1451,12 +1980,10 @@ static PyObject* PyEds_CreateMemoryStreamFromPointer(PyObject *Py_UNUSED(self),
         PyErr_SetString(PyExc_TypeError, "buffer parameter must be a bytes, bytearray, or memoryview");
         return nullptr;
     }
-    std::cout << "Py_buffer" << std::endl;
     EdsStreamRef fileStream;
 
     unsigned long retVal(EdsCreateMemoryStreamFromPointer(
         bufferPtr, bufferLen, &fileStream));
-    std::cout << "EdsCreateMemoryStreamFromPointer" << std::endl;
     PyCheck_EDSERROR(retVal);
 
     PyObject *pyFileStream = PyEdsObject_New(fileStream);
@@ -1465,6 +1992,144 @@ static PyObject* PyEds_CreateMemoryStreamFromPointer(PyObject *Py_UNUSED(self),
 }
 
 
+PyDoc_STRVAR(PyEds_GetPointer__doc__,
+"Gets the memory of a stream created in host memory,\n"
+"\tsuch as by CreateMemoryStream.\n"
+"The returned memoryview shares the stream memory (no copy is made)\n"
+"\tand keeps the stream alive. It covers GetLength(stream) bytes.\n"
+"Writing past the end of a stream created with CreateMemoryStream\n"
+"\treallocates its memory, so take the view after the stream is filled;\n"
+"\tWrite, Download, CopyData, etc. raise BufferError while views exist.\n\n"
+":param EdsObject stream: The stream.\n"
+":raises BufferError: The stream has no host memory (e.g. file streams).\n"
+":return memoryview: The stream memory.");
+
+static PyObject* PyEds_GetPointer(PyObject *Py_UNUSED(self), PyObject *pyStream){
+    if (PyToEds(pyStream) == nullptr) {
+        return nullptr;
+    }
+    return PyMemoryView_FromObject(pyStream);
+}
+
+
+PyDoc_STRVAR(PyEds_Read__doc__,
+"Reads data the size of read_size into the buffer,\n"
+"\tstarting at the current read or write position of the stream.\n"
+"The size of data actually read can be designated in the return value.\n\n"
+":param EdsObject stream: The stream or image.\n"
+":param int read_size: The number of bytes to read.\n"
+":raises EdsError: Any of the sdk errors.\n"
+":return bytes: The data read.");
+
+static PyObject* PyEds_Read(PyObject *Py_UNUSED(self), PyObject *args){
+    PyObject *pyStream;
+    unsigned long long readSize;
+    if (!PyArg_ParseTuple(args, "OK:Read", &pyStream, &readSize)) {
+        return nullptr;
+    }
+    PyEdsObject *pyEdsObject(PyToEds(pyStream));
+    if (pyEdsObject == nullptr) {
+        return nullptr;
+    }
+    if (readSize > static_cast<unsigned long long>(PY_SSIZE_T_MAX)) {
+        PyErr_SetString(PyExc_OverflowError, "read_size is too large");
+        return nullptr;
+    }
+    PyObject *pyData = PyBytes_FromStringAndSize(nullptr, static_cast<Py_ssize_t>(readSize));
+    if (pyData == nullptr) {
+        return nullptr;
+    }
+    char *buffer = PyBytes_AS_STRING(pyData);
+    EdsUInt64 bytesRead = 0;
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsRead(pyEdsObject->edsObj, readSize, buffer, &bytesRead);
+    Py_END_ALLOW_THREADS
+    if (retVal != EDS_ERR_OK) {
+        Py_DECREF(pyData);
+        PyCheck_EDSERROR(retVal);
+    }
+    if (bytesRead != readSize && _PyBytes_Resize(&pyData, static_cast<Py_ssize_t>(bytesRead)) < 0) {
+        return nullptr;
+    }
+    return pyData;
+}
+
+
+PyDoc_STRVAR(PyEds_Write__doc__,
+"Writes data of a designated buffer\n"
+"\tto the current read or write position of the stream.\n\n"
+":param EdsObject stream: The stream or image.\n"
+":param Buffer data: The data to write (any bytes-like object).\n"
+":raises BufferError: The stream memory is exported through a memoryview.\n"
+":raises EdsError: Any of the sdk errors.\n"
+":return int: The number of bytes written.");
+
+static PyObject* PyEds_Write(PyObject *Py_UNUSED(self), PyObject *args){
+    PyObject *pyStream;
+    Py_buffer data;
+    if (!PyArg_ParseTuple(args, "Oy*:Write", &pyStream, &data)) {
+        return nullptr;
+    }
+    PyEdsObject *pyEdsObject(PyToEds(pyStream));
+    if (pyEdsObject == nullptr) {
+        PyBuffer_Release(&data);
+        return nullptr;
+    }
+    if (!PyEdsObject_CheckWritable(pyEdsObject)) {
+        PyBuffer_Release(&data);
+        return nullptr;
+    }
+    EdsUInt64 bytesWritten = 0;
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsWrite(pyEdsObject->edsObj, data.len, data.buf, &bytesWritten);
+    Py_END_ALLOW_THREADS
+    PyBuffer_Release(&data);
+    PyCheck_EDSERROR(retVal);
+
+    return PyLong_FromUnsignedLongLong(bytesWritten);
+}
+
+
+PyDoc_STRVAR(PyEds_Seek__doc__,
+"Moves the read or write position of the stream\n"
+"\t(that is, the file position indicator).\n\n"
+":param EdsObject stream: The stream or image.\n"
+":param int offset: Number of bytes to move the pointer.\n"
+":param SeekOrigin origin: Pointer movement mode.\n"
+"\tMust be one of the following values.\n"
+"\t\tSeekOrigin.Cur\n"
+"\t\t\tMove the stream pointer offset bytes from the current position.\n"
+"\t\tSeekOrigin.Begin\n"
+"\t\t\tMove the stream pointer offset bytes from the beginning of the stream.\n"
+"\t\tSeekOrigin.End\n"
+"\t\t\tMove the stream pointer offset bytes from the end of the stream.\n"
+":raises EdsError: Any of the sdk errors.");
+
+static PyObject* PyEds_Seek(PyObject *Py_UNUSED(self), PyObject *args){
+    PyObject *pyStream;
+    long long seekOffset;
+    unsigned long seekOrigin;
+
+    if (!PyArg_ParseTuple(args, "OLk:Seek", &pyStream, &seekOffset, &seekOrigin)) {
+        return nullptr;
+    }
+    PyEdsObject *pyEdsObject(PyToEds(pyStream));
+    if (pyEdsObject == nullptr) {
+        return nullptr;
+    }
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsSeek(
+        pyEdsObject->edsObj, seekOffset, static_cast<EdsSeekOrigin>(seekOrigin));
+    Py_END_ALLOW_THREADS
+    PyCheck_EDSERROR(retVal);
+
+    Py_RETURN_NONE;
+}
+
+
 PyDoc_STRVAR(PyEds_GetPosition__doc__,
 "Gets the current read or write position of the stream\n"
 "\t(that is, the file position indicator).\n\n"
@@ -1478,7 +2143,10 @@ static PyObject* PyEds_GetPosition(PyObject *Py_UNUSED(self), PyObject *pyStream
         return nullptr;
     }
     EdsUInt64 position;
-    unsigned long retVal(EdsGetPosition(pyEdsObject->edsObj, &position));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetPosition(pyEdsObject->edsObj, &position);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     return PyLong_FromUnsignedLongLong(position);
@@ -1498,7 +2166,10 @@ static PyObject* PyEds_GetLength(PyObject *Py_UNUSED(self), PyObject *pyStream){
         return nullptr;
     }
     EdsUInt64 length;
-    unsigned long retVal(EdsGetLength(pyEdsObject->edsObj, &length));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetLength(pyEdsObject->edsObj, &length);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     return PyLong_FromUnsignedLongLong(length);
@@ -1514,7 +2185,9 @@ PyDoc_STRVAR(PyEds_CopyData__doc__,
 "\tinWriteSize in the positive direction.\n\n"
 ":param EdsObject in_stream_or_image: The input stream or image.\n"
 ":param int write_size: The number of bytes to copy.\n"
-":param EdsObject out_stream_or_image: The output stream or image.");
+":param EdsObject out_stream_or_image: The output stream or image.\n"
+":raises BufferError: The output stream memory is exported through a memoryview.\n"
+":raises EdsError: Any of the sdk errors.");
 
 static PyObject* PyEds_CopyData(PyObject *Py_UNUSED(self), PyObject *args){
     PyObject *pyInStream;
@@ -1526,18 +2199,20 @@ static PyObject* PyEds_CopyData(PyObject *Py_UNUSED(self), PyObject *args){
     }
     PyEdsObject *pyInEdsObject(PyToEds(pyInStream));
     PyEdsObject *pyOutEdsObject(PyToEds(pyOutStream));
-    if (pyInEdsObject == nullptr || pyOutEdsObject == nullptr) {
+    if (pyInEdsObject == nullptr || pyOutEdsObject == nullptr
+        || !PyEdsObject_CheckWritable(pyOutEdsObject)) {
         return nullptr;
     }
-    unsigned long retVal(EdsCopyData(
-        pyInEdsObject->edsObj, writeSize, pyOutEdsObject->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsCopyData(
+        pyInEdsObject->edsObj, writeSize, pyOutEdsObject->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     Py_RETURN_NONE;
 }
 
 
-static PyObject *pyProgressCallback[2] = {nullptr, nullptr};
-
 PyDoc_STRVAR(PyEds_SetProgressCallback__doc__,
 "Register a progress callback function.\n"
 "An event is received as notification of progress during processing that\n"
@@ -1547,9 +2222,11 @@ PyDoc_STRVAR(PyEds_SetProgressCallback__doc__,
 "\tfunction during execution or on completion of the following APIs.\n"
 "This timing can be used in updating on-screen progress bars, for example.\n\n"
 ":param EdsObject stream_or_image: the stream or image object.\n"
-":param Callable callback: the callback function.\n"
+":param Optional[Callable] callback: the callback function,\n"
+"\tor None to unregister the current one.\n"
 "\tExpected signature:\n"
 "\t\t(percent: int, cancel: bool, context: Optional[Any] = None) -> int.\n"
+"\tReturn EDS_ERR_OPERATION_CANCELLED (0x05) to cancel the operation.\n"
 ":param ProgressOption option: The option about progress is specified.\n"
 "\tMust be one of the following values.\n"
 "\t\tProgressOption.Done\n"
@@ -1574,7 +2251,15 @@ static PyObject* PyEds_SetProgressCallback(PyObject *Py_UNUSED(self), PyObject *
         return nullptr;
     }
 
-    if (pyCallable == Py_None || !PyCallable_Check(pyCallable)){
+    if (pyCallable == Py_None) {
+        unsigned long retVal(EdsSetProgressCallback(
+            edsObj->edsObj, nullptr, static_cast<EdsProgressOption>(progressOption), nullptr));
+        PyCheck_EDSERROR(retVal);
+        CallbackSlot_Clear(edsObj->edsObj, kCallback_Progress);
+        Py_RETURN_NONE;
+    }
+
+    if (!PyCallable_Check(pyCallable)){
         PyErr_Format(PyExc_ValueError, "expected a callable object");
         return nullptr;
     }
@@ -1588,59 +2273,35 @@ static PyObject* PyEds_SetProgressCallback(PyObject *Py_UNUSED(self), PyObject *
         return nullptr;
     }
 
-    Py_XDECREF(pyProgressCallback[0]);
-    Py_XDECREF(pyProgressCallback[1]);
-
-    pyProgressCallback[0] = pyCallable;
-    pyProgressCallback[1] = pyContext;
-
-    Py_INCREF(pyCallable);
-    Py_XINCREF(pyContext);
-
     auto callbackWrapper = [](EdsUInt32 inPercent, EdsVoid *inContext, EdsBool *outCancel) -> EdsError {
         PyGILState_STATE gstate;
         gstate = PyGILState_Ensure();
 
-        PyObject** pyContext(static_cast<PyObject **>(inContext));
         PyObject* pyPercent(PyLong_FromUnsignedLong(inPercent));
         PyObject* pyCancel(PyBool_FromLong(*outCancel));
-        PyObject* pyRetVal(nullptr);
-        if (pyContext[1] == nullptr) {
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], pyPercent, pyCancel, nullptr);
-        }
-        else {
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], pyPercent, pyCancel, pyContext[1], nullptr);
-        }
-        if (pyRetVal == nullptr) {
-            PyErr_Format(PyExc_ValueError, "unable to call the callback");
-            Py_DECREF(pyPercent);
-            Py_DECREF(pyCancel);
-            return EDS_ERR_INVALID_FN_POINTER;
-        }
-
-        unsigned long retVal(EDS_ERR_OK);
-        if (PyLong_Check(pyRetVal)) {
-            retVal = PyLong_AsUnsignedLong(pyRetVal);
-        }
-        Py_DECREF(pyRetVal);
+        EdsError retVal = CallbackSlot_Call(
+            static_cast<CallbackSlot *>(inContext), {pyPercent, pyCancel});
         Py_DECREF(pyPercent);
         Py_DECREF(pyCancel);
+        // Returning EDS_ERR_OPERATION_CANCELLED asks the SDK to cancel the operation
+        if (retVal == EDS_ERR_OPERATION_CANCELLED) {
+            *outCancel = true;
+            retVal = EDS_ERR_OK;
+        }
 
         PyGILState_Release(gstate);
         return retVal;
     };
 
+    CallbackSlot* slot = CallbackSlot_Get(edsObj->edsObj, kCallback_Progress);
     unsigned long retVal(EdsSetProgressCallback(
         edsObj->edsObj,
         callbackWrapper,
         static_cast<EdsProgressOption>(progressOption),
-        pyProgressCallback));
+        slot));
+    PyCheck_EDSERROR(retVal);
 
-    if (retVal != EDS_ERR_OK) {
-        Py_DECREF(pyCallable);
-        Py_XDECREF(pyContext);
-        PyCheck_EDSERROR(retVal);
-    }
+    CallbackSlot_Set(slot, pyCallable, pyContext);
     Py_RETURN_NONE;
 }
 
@@ -1663,7 +2324,10 @@ static PyObject* PyEds_CreateImageRef(PyObject *Py_UNUSED(self), PyObject *pyStr
         return nullptr;
     }
     EdsImageRef outImage;
-    unsigned long retVal(EdsCreateImageRef(pyEdsObject->edsObj, &outImage));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsCreateImageRef(pyEdsObject->edsObj, &outImage);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     PyObject *pyImage = PyEdsObject_New(outImage);
@@ -1704,8 +2368,11 @@ static PyObject* PyEds_GetImageInfo(PyObject *Py_UNUSED(self), PyObject *args){
     }
 
     EdsImageInfo imageInfo;
-    unsigned long retVal(EdsGetImageInfo(
-        pyEdsObject->edsObj, static_cast<EdsImageSource>(imageSource), &imageInfo));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetImageInfo(
+        pyEdsObject->edsObj, static_cast<EdsImageSource>(imageSource), &imageInfo);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     PyObject *pyDirItemInfo = EDS::PyDict_FromEdsImageInfo(imageInfo);
@@ -1764,11 +2431,14 @@ static PyObject* PyEds_GetImage(PyObject *Py_UNUSED(self), PyObject *args){
         return nullptr;
     }
 
-    unsigned long retVal(EdsGetImage(
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetImage(
         pyEdsObject->edsObj,
         static_cast<EdsImageSource>(imageSource),
         static_cast<EdsTargetImageType>(imageType),
-        sourceRect, destSize, streamRef));
+        sourceRect, destSize, streamRef);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     PyObject *pyStream = PyEdsObject_New(streamRef);
@@ -1794,6 +2464,9 @@ static PyObject* PyEds_CreateEvfImageRef(PyObject *Py_UNUSED(self), PyObject *py
 
     PyObject *pyImage = PyEdsObject_New(outImage);
     assert(pyImage);
+    // Kept so DownloadEvfImage can check the stream for exported views
+    Py_INCREF(pyStream);
+    reinterpret_cast<PyEdsObject*>(pyImage)->stream = pyStream;
     return pyImage;
 }
 
@@ -1809,6 +2482,7 @@ PyDoc_STRVAR(PyEds_DownloadEvfImage__doc__,
 "settings are applied to EdsCameraRef.\n\n"
 ":param EdsObject camera: The camera.\n"
 ":param EdsObject evf_image: The EVFData.\n"
+":raises BufferError: The stream memory is exported through a memoryview.\n"
 ":raises EdsError: Any of the sdk errors.");
 
 static PyObject* PyEds_DownloadEvfImage(PyObject *Py_UNUSED(self), PyObject *args){
@@ -1822,20 +2496,29 @@ static PyObject* PyEds_DownloadEvfImage(PyObject *Py_UNUSED(self), PyObject *arg
     if (pyEdsCamera == nullptr || pyEdsEvfImage == nullptr) {
         return nullptr;
     }
+    if (pyEdsEvfImage->stream != nullptr
+        && !PyEdsObject_CheckWritable(reinterpret_cast<PyEdsObject*>(pyEdsEvfImage->stream))) {
+        return nullptr;
+    }
 
-    unsigned long retVal(EdsDownloadEvfImage(
-        pyEdsCamera->edsObj, pyEdsEvfImage->edsObj));
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsDownloadEvfImage(
+        pyEdsCamera->edsObj, pyEdsEvfImage->edsObj);
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
 
     Py_RETURN_NONE;
 }
 
 
-static PyObject *pyCameraAddedCallback[2] = {nullptr, nullptr};
+// The camera added handler is process wide in the SDK
+static CallbackSlot pyCameraAddedCallback = {nullptr, nullptr};
 
 PyDoc_STRVAR(PyEds_SetCameraAddedHandler__doc__,
 "Registers a callback function for when a camera is detected.\n\n"
-":param Callable callback: the callback called when a camera is connected.\n"
+":param Optional[Callable] callback: the callback called when a camera\n"
+"\tis connected, or None to unregister the current one.\n"
 "\tExpected signature (context: Any = None) -> int.\n"
 ":raises EdsError: Any of the sdk errors.");
 
@@ -1847,12 +2530,19 @@ static PyObject* PyEds_SetCameraAddedHandler(PyObject *Py_UNUSED(self), PyObject
         return nullptr;
     }
 
-    if (pyCallable == Py_None || !PyCallable_Check(pyCallable)){
+    if (pyCallable == Py_None) {
+        unsigned long retVal(EdsSetCameraAddedHandler(nullptr, nullptr));
+        PyCheck_EDSERROR(retVal);
+        CallbackSlot_Set(&pyCameraAddedCallback, nullptr, nullptr);
+        Py_RETURN_NONE;
+    }
+
+    if (!PyCallable_Check(pyCallable)){
         PyErr_Format(PyExc_ValueError, "expected a callable object");
         return nullptr;
     }
 
-    if (!PyCallable_CheckNumberOfParameters(pyCallable, 0) ||
+    if (!PyCallable_CheckNumberOfParameters(pyCallable, 0) &&
             !PyCallable_CheckNumberOfParameters(pyCallable, 1)) {
         PyErr_Format(PyExc_ValueError,
                      "expected a callable object with 0 or 1 parameters"
@@ -1860,36 +2550,11 @@ static PyObject* PyEds_SetCameraAddedHandler(PyObject *Py_UNUSED(self), PyObject
         return nullptr;
     }
 
-    Py_XDECREF(pyCameraAddedCallback[0]);
-    Py_XDECREF(pyCameraAddedCallback[1]);
-
-    pyCameraAddedCallback[0] = pyCallable;
-    pyCameraAddedCallback[1] = pyContext;
-
-    Py_INCREF(pyCallable);
-    Py_XINCREF(pyContext);
-
     auto callbackWrapper = [](EdsVoid* inContext) -> EdsError {
         PyGILState_STATE gstate;
         gstate = PyGILState_Ensure();
 
-        PyObject** pyContext = static_cast<PyObject **>(inContext);
-        PyObject* pyRetVal{nullptr};
-        if (pyContext[1] == nullptr) {
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], nullptr);
-        }
-        else {
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], pyContext[1], nullptr);
-        }
-        if (pyRetVal == nullptr) {
-            PyErr_Format(PyExc_ValueError, "unable to call the callback");
-            return EDS_ERR_INVALID_FN_POINTER;
-        }
-        unsigned long retVal(EDS_ERR_OK);
-        if (PyLong_Check(pyRetVal)) {
-            retVal = PyLong_AsUnsignedLong(pyRetVal);
-        }
-        Py_DECREF(pyRetVal);
+        EdsError retVal = CallbackSlot_Call(static_cast<CallbackSlot *>(inContext), {});
 
         PyGILState_Release(gstate);
         return retVal;
@@ -1898,26 +2563,22 @@ static PyObject* PyEds_SetCameraAddedHandler(PyObject *Py_UNUSED(self), PyObject
     unsigned long retVal(
         EdsSetCameraAddedHandler(
             callbackWrapper,
-            pyCameraAddedCallback));
+            &pyCameraAddedCallback));
+    PyCheck_EDSERROR(retVal);
 
-    if (retVal != EDS_ERR_OK) {
-        Py_DECREF(pyCallable);
-        Py_XDECREF(pyContext);
-        PyCheck_EDSERROR(retVal);
-    }
+    CallbackSlot_Set(&pyCameraAddedCallback, pyCallable, pyContext);
     Py_RETURN_NONE;
 }
 
 
-static PyObject *pySetPropertyCallback[2] = {nullptr, nullptr};
-
 PyDoc_STRVAR(PyEds_SetPropertyEventHandler__doc__,
 "Registers a callback function for receiving status\n"
 "\tchange notification events for property states on a camera.\n\n"
 ":param EdsObject camera: the camera object.\n"
 ":param PropertyEvent event: the event to be supplemented.\n"
 "\tTo designate all events, use PropertyEvent.All.\n"
-":param Callable callback: the callback for receiving events.\n"
+":param Optional[Callable] callback: the callback for receiving events,\n"
+"\tor None to unregister the current one.\n"
 "\tExpected signature\n"
 "\t\t(event: StateEvent, prop_id: PropID, param: int, context: Any = None) -> int.\n"
 ":raises EdsError: Any of the sdk errors.");
@@ -1937,7 +2598,14 @@ static PyObject* PyEds_SetPropertyEventHandler(PyObject *Py_UNUSED(self), PyObje
         return nullptr;
     }
 
-    if (pyCallable == Py_None || !PyCallable_Check(pyCallable)){
+    if (pyCallable == Py_None) {
+        unsigned long retVal(EdsSetPropertyEventHandler(edsObj->edsObj, event, nullptr, nullptr));
+        PyCheck_EDSERROR(retVal);
+        CallbackSlot_Clear(edsObj->edsObj, kCallback_PropertyEvent);
+        Py_RETURN_NONE;
+    }
+
+    if (!PyCallable_Check(pyCallable)){
         PyErr_Format(PyExc_ValueError, "expected a callable object");
         return nullptr;
     }
@@ -1950,28 +2618,18 @@ static PyObject* PyEds_SetPropertyEventHandler(PyObject *Py_UNUSED(self), PyObje
         return nullptr;
     }
 
-    Py_XDECREF(pySetPropertyCallback[0]);
-    Py_XDECREF(pySetPropertyCallback[1]);
-
-    pySetPropertyCallback[0] = pyCallable;
-    pySetPropertyCallback[1] = pyContext;
-
-    Py_INCREF(pyCallable);
-    Py_XINCREF(pyContext);
-
     auto callbackWrapper = [](EdsPropertyEvent inEvent, EdsPropertyID inPropertyID, EdsUInt32 inParam, EdsVoid* inContext) -> EdsError {
 
         PyGILState_STATE gstate;
         gstate = PyGILState_Ensure();
 
-        PyObject **pyContext = static_cast<PyObject **>(inContext);
-        PyObject *pyEvent = GetEnum("edsdk.constants", "PropertyEvent", inEvent);
+        PyObject *pyEvent = GetEnum(kEnum_PropertyEvent, inEvent);
         if (pyEvent == nullptr) {
             PyErr_Clear();
             std::cout << "Unknown Property Event: " << inEvent  << std::endl;
             pyEvent = PyLong_FromUnsignedLong(inEvent);
         }
-        PyObject *pyPropertyID = GetEnum("edsdk.constants", "PropID", inPropertyID);
+        PyObject *pyPropertyID = GetEnum(kEnum_PropID, inPropertyID);
         if (pyPropertyID == nullptr) {
             PyErr_Clear();
             std::cout << "Unknown Property ID: " << inPropertyID  << std::endl;
@@ -1979,26 +2637,8 @@ static PyObject* PyEds_SetPropertyEventHandler(PyObject *Py_UNUSED(self), PyObje
         }
         PyObject *pyParam = PyLong_FromUnsignedLong(inParam);
 
-        PyObject *pyRetVal{nullptr};
-        if (pyContext[1] == nullptr){
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], pyEvent, pyPropertyID, pyParam, nullptr);
-        }
-        else {
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], pyEvent, pyPropertyID, pyParam, pyContext[1], nullptr);
-        }
-        if (pyRetVal == nullptr) {
-            PyErr_Format(PyExc_ValueError, "unable to call the callback");
-            Py_DECREF(pyEvent);
-            Py_DECREF(pyPropertyID);
-            Py_DECREF(pyParam);
-            return EDS_ERR_INVALID_FN_POINTER;
-        }
-
-        unsigned long retVal(EDS_ERR_OK);
-        if (PyLong_Check(pyRetVal)) {
-            retVal = PyLong_AsUnsignedLong(pyRetVal);
-        }
-        Py_DECREF(pyRetVal);
+        EdsError retVal = CallbackSlot_Call(
+            static_cast<CallbackSlot *>(inContext), {pyEvent, pyPropertyID, pyParam});
         Py_DECREF(pyEvent);
         Py_DECREF(pyParam);
         Py_DECREF(pyPropertyID);
@@ -2007,21 +2647,17 @@ static PyObject* PyEds_SetPropertyEventHandler(PyObject *Py_UNUSED(self), PyObje
         return retVal;
     };
 
+    CallbackSlot* slot = CallbackSlot_Get(edsObj->edsObj, kCallback_PropertyEvent);
     unsigned long retVal(EdsSetPropertyEventHandler(
-        edsObj->edsObj, event, callbackWrapper, pySetPropertyCallback));
+        edsObj->edsObj, event, callbackWrapper, slot));
+    PyCheck_EDSERROR(retVal);
 
-    if (retVal != EDS_ERR_OK) {
-        Py_DECREF(pyCallable);
-        Py_XDECREF(pyContext);
-        PyCheck_EDSERROR(retVal);
-    }
+    CallbackSlot_Set(slot, pyCallable, pyContext);
     Py_RETURN_NONE;
 
 }
 
 
-static PyObject *pySetObjectCallback[2] = {nullptr, nullptr};
-
 PyDoc_STRVAR(PyEds_SetObjectEventHandler__doc__,
 "Registers a callback function for receiving status\n"
 "\tchange notification events for objects on a remote camera\n"
@@ -2030,7 +2666,8 @@ PyDoc_STRVAR(PyEds_SetObjectEventHandler__doc__,
 ":param EdsObject camera: the camera object.\n"
 ":param ObjectEvent event: the event to be supplemented.\n"
 "\tTo designate all events, use ObjectEvent.All.\n"
-":param Callable callback: the callback for receiving events.\n"
+":param Optional[Callable] callback: the callback for receiving events,\n"
+"\tor None to unregister the current one.\n"
 "\tExpected signature (event: ObjectEvent, obj_ref: PyEdsObject, context: Any = None) -> int.\n"
 ":raises EdsError: Any of the sdk errors.");
 
@@ -2048,7 +2685,14 @@ static PyObject* PyEds_SetObjectEventHandler(PyObject *Py_UNUSED(self), PyObject
         return nullptr;
     }
 
-    if (pyCallable == Py_None || !PyCallable_Check(pyCallable)){
+    if (pyCallable == Py_None) {
+        unsigned long retVal(EdsSetObjectEventHandler(edsObj->edsObj, event, nullptr, nullptr));
+        PyCheck_EDSERROR(retVal);
+        CallbackSlot_Clear(edsObj->edsObj, kCallback_ObjectEvent);
+        Py_RETURN_NONE;
+    }
+
+    if (!PyCallable_Check(pyCallable)){
         PyErr_Format(PyExc_ValueError, "expected a callable object");
         return nullptr;
     }
@@ -2061,22 +2705,12 @@ static PyObject* PyEds_SetObjectEventHandler(PyObject *Py_UNUSED(self), PyObject
         return nullptr;
     }
 
-    Py_XDECREF(pySetObjectCallback[0]);
-    Py_XDECREF(pySetObjectCallback[1]);
-
-    pySetObjectCallback[0] = pyCallable;
-    pySetObjectCallback[1] = pyContext;
-
-    Py_INCREF(pyCallable);
-    Py_XINCREF(pyContext);
-
     auto callbackWrapper = [](EdsStateEvent inEvent, EdsBaseRef inRef, EdsVoid* inContext) -> EdsError {
 
         PyGILState_STATE gstate;
         gstate = PyGILState_Ensure();
 
-        PyObject **pyContext = static_cast<PyObject **>(inContext);
-        PyObject *pyEvent = GetEnum("edsdk.constants", "ObjectEvent", inEvent);
+        PyObject *pyEvent = GetEnum(kEnum_ObjectEvent, inEvent);
         if (pyEvent == nullptr) {
             PyErr_Clear();
             std::cout << "Unknown Object Event: " << inEvent  << std::endl;
@@ -2084,52 +2718,33 @@ static PyObject* PyEds_SetObjectEventHandler(PyObject *Py_UNUSED(self), PyObject
         }
         PyObject* pyInRef = PyEdsObject_New(inRef);
 
-        PyObject* pyRetVal(nullptr);
-        if (pyContext[1] == nullptr){
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], pyEvent, pyInRef, nullptr);
-        }
-        else {
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], pyEvent, pyInRef, pyContext[1], nullptr);
-        }
-        if (pyRetVal == nullptr) {
-            PyErr_Format(PyExc_ValueError, "unable to call the callback");
-            Py_DECREF(pyEvent);
-            Py_DECREF(pyInRef);
-            return EDS_ERR_INVALID_FN_POINTER;
-        }
-        unsigned long retVal(EDS_ERR_OK);
-        if (PyLong_Check(pyRetVal)) {
-            retVal = PyLong_AsUnsignedLong(pyRetVal);
-        }
+        EdsError retVal = CallbackSlot_Call(
+            static_cast<CallbackSlot *>(inContext), {pyEvent, pyInRef});
         Py_DECREF(pyEvent);
         Py_DECREF(pyInRef);
-        Py_DECREF(pyRetVal);
 
         PyGILState_Release(gstate);
         return retVal;
     };
 
+    CallbackSlot* slot = CallbackSlot_Get(edsObj->edsObj, kCallback_ObjectEvent);
     unsigned long retVal(EdsSetObjectEventHandler(
-        edsObj->edsObj, event, callbackWrapper, pySetObjectCallback));
+        edsObj->edsObj, event, callbackWrapper, slot));
+    PyCheck_EDSERROR(retVal);
 
-    if (retVal != EDS_ERR_OK) {
-        Py_DECREF(pyCallable);
-        Py_XDECREF(pyContext);
-        PyCheck_EDSERROR(retVal);
-    }
+    CallbackSlot_Set(slot, pyCallable, pyContext);
     Py_RETURN_NONE;
 }
 
 
-PyObject *pySetCameraStateCallback[2] = {nullptr, nullptr};
-
 PyDoc_STRVAR(PyEds_SetCameraStateEventHandler__doc__,
 "Registers a callback function for receiving status\n"
 "\tchange notification events for property states on a camera\n\n"
 ":param EdsObject camera: the camera object.\n"
 ":param StateEvent event: the event to be supplemented.\n"
 "\tTo designate all events, use StateEvent.All.\n"
-":param Callable callback: the callback for receiving the events.\n"
+":param Optional[Callable] callback: the callback for receiving the events,\n"
+"\tor None to unregister the current one.\n"
 "\tExpected signature\n"
 "\t\t(event: StateEvent, event_data: int, context: Any = None) -> int.\n"
 ":raises EdsError: Any of the sdk errors.");
@@ -2147,8 +2762,14 @@ static PyObject *PyEds_SetCameraStateEventHandler(PyObject *Py_UNUSED(self), PyO
         return nullptr;
     }
 
-    if (pyCallable == Py_None || !PyCallable_Check(pyCallable)){
+    if (pyCallable == Py_None) {
+        unsigned long retVal(EdsSetCameraStateEventHandler(edsObj->edsObj, event, nullptr, nullptr));
+        PyCheck_EDSERROR(retVal);
+        CallbackSlot_Clear(edsObj->edsObj, kCallback_StateEvent);
+        Py_RETURN_NONE;
+    }
 
+    if (!PyCallable_Check(pyCallable)){
         PyErr_Format(PyExc_ValueError, "expected a callable object");
         return nullptr;
     }
@@ -2161,64 +2782,36 @@ static PyObject *PyEds_SetCameraStateEventHandler(PyObject *Py_UNUSED(self), PyO
         return nullptr;
     }
 
-    Py_XDECREF(pySetCameraStateCallback[0]);
-    Py_XDECREF(pySetCameraStateCallback[1]);
-
-    pySetCameraStateCallback[0] = pyCallable;
-    pySetCameraStateCallback[1] = pyContext;
-
-    Py_INCREF(pyCallable);
-    Py_XINCREF(pyContext);
-
     auto callbackWrapper = [](EdsStateEvent inEvent, EdsUInt32 inEventData, EdsVoid* inContext) -> EdsError {
         PyGILState_STATE gstate;
         gstate = PyGILState_Ensure();
 
-        PyObject *pyEvent = GetEnum("edsdk.constants", "StateEvent", inEvent);
+        PyObject *pyEvent = GetEnum(kEnum_StateEvent, inEvent);
         if (pyEvent == nullptr) {
             PyErr_Clear();
             std::cout << "Unknown State Event: " << inEvent << std::endl;
             pyEvent = PyLong_FromUnsignedLong(inEvent);
         }
         PyObject *pyEventData = PyLong_FromUnsignedLong(inEventData);
-        PyObject **pyContext = static_cast<PyObject **>(inContext);
-        PyObject *pyRetVal(nullptr);
-        if (pyContext[1] == nullptr) {
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], pyEvent, pyEventData, nullptr);
-        }
-        else {
-            pyRetVal = PyObject_CallFunctionObjArgs(pyContext[0], pyEvent, pyEventData, pyContext[1], nullptr);
-        }
-        if (pyRetVal == nullptr) {
-            PyErr_Format(PyExc_ValueError, "unable to call the callback");
-            Py_DECREF(pyEvent);
-            Py_DECREF(pyEventData);
-            return EDS_ERR_INVALID_FN_POINTER;
-        }
 
-        unsigned long retVal(EDS_ERR_OK);
-        if (PyLong_Check(pyRetVal)) {
-            retVal = PyLong_AsUnsignedLong(pyRetVal);
-        }
+        EdsError retVal = CallbackSlot_Call(
+            static_cast<CallbackSlot *>(inContext), {pyEvent, pyEventData});
         Py_DECREF(pyEvent);
         Py_DECREF(pyEventData);
-        Py_DECREF(pyRetVal);
 
         PyGILState_Release(gstate);
         return retVal;
     };
 
+    CallbackSlot* slot = CallbackSlot_Get(edsObj->edsObj, kCallback_StateEvent);
     unsigned long retVal(
         EdsSetCameraStateEventHandler(
             edsObj->edsObj, event,
             callbackWrapper,
-            pySetCameraStateCallback));
+            slot));
+    PyCheck_EDSERROR(retVal);
 
-    if (retVal != EDS_ERR_OK) {
-        Py_DECREF(pyCallable);
-        Py_XDECREF(pyContext);
-        PyCheck_EDSERROR(retVal);
-    }
+    CallbackSlot_Set(slot, pyCallable, pyContext);
     Py_RETURN_NONE;
 }
 
@@ -2230,7 +2823,10 @@ PyDoc_STRVAR(PyEds_GetEvent__doc__,
 ":raises EdsError: Any of the sdk errors.");
 
 static PyObject* PyEds_GetEvent(PyObject *Py_UNUSED(self)) {
-    unsigned long retVal(EdsGetEvent());
+    unsigned long retVal;
+    Py_BEGIN_ALLOW_THREADS
+    retVal = EdsGetEvent();
+    Py_END_ALLOW_THREADS
     PyCheck_EDSERROR(retVal);
     Py_RETURN_NONE;
 }
@@ -2249,6 +2845,8 @@ PyMethodDef methodTable[] = {
     // Property operating functions
     {"GetPropertySize", (PyCFunction) PyEds_GetPropertySize, METH_VARARGS, PyEds_GetPropertySize__doc__},
     {"GetPropertyData", (PyCFunction) PyEds_GetPropertyData, METH_VARARGS, PyEds_GetPropertyData__doc__},
+    {"GetPropertyDataBytes", (PyCFunction) PyEds_GetPropertyDataBytes, METH_VARARGS, PyEds_GetPropertyDataBytes__doc__},
+    {"GetPropertyDataMany", (PyCFunction) PyEds_GetPropertyDataMany, METH_VARARGS, PyEds_GetPropertyDataMany__doc__},
     {"SetPropertyData", (PyCFunction) PyEds_SetPropertyData, METH_VARARGS, PyEds_SetPropertyData__doc__},
     {"GetPropertyDesc", (PyCFunction) PyEds_GetPropertyDesc, METH_VARARGS, PyEds_GetPropertyDesc__doc__},
 
@@ -2282,10 +2880,10 @@ PyMethodDef methodTable[] = {
     {"CreateMemoryStream", (PyCFunction) PyEds_CreateMemoryStream, METH_O, PyEds_CreateMemoryStream__doc__},
     {"CreateFileStreamEx", (PyCFunction) PyEds_CreateFileStreamEx, METH_VARARGS, PyEds_CreateFileStreamEx__doc__},
     {"CreateMemoryStreamFromPointer", (PyCFunction) PyEds_CreateMemoryStreamFromPointer, METH_O, PyEds_CreateMemoryStreamFromPointer__doc__},
-    // {"GetPointer", (PyCFunction) PyEds_GetPointer, METH_O, PyEds_GetPointer__doc__},
-    // {"Read", (PyCFunction) PyEds_Read, METH_VARARGS, PyEds_Read__doc__},
-    // {"Write", (PyCFunction) PyEds_Write, METH_VARARGS, PyEds_Write__doc__},
-    // {"Seek", (PyCFunction) PyEds_Seek, METH_VARARGS, PyEds_Seek__doc__},
+    {"GetPointer", (PyCFunction) PyEds_GetPointer, METH_O, PyEds_GetPointer__doc__},
+    {"Read", (PyCFunction) PyEds_Read, METH_VARARGS, PyEds_Read__doc__},
+    {"Write", (PyCFunction) PyEds_Write, METH_VARARGS, PyEds_Write__doc__},
+    {"Seek", (PyCFunction) PyEds_Seek, METH_VARARGS, PyEds_Seek__doc__},
     {"GetPosition", (PyCFunction) PyEds_GetPosition, METH_O, PyEds_GetPosition__doc__},
     {"GetLength", (PyCFunction) PyEds_GetLength, METH_O, PyEds_GetLength__doc__},
     {"CopyData", (PyCFunction) PyEds_CopyData, METH_VARARGS, PyEds_CopyData__doc__},
@@ -2346,6 +2944,11 @@ PyMODINIT_FUNC PyInit_api(void) {
         Py_DECREF(module);
         return nullptr;
     }
+    if (!InitEnumCache(constants)) {
+        Py_DECREF(constants);
+        Py_DECREF(module);
+        return nullptr;
+    }
     Py_DECREF(constants);
 
     PyEdsError = PyErr_NewException("edsdk.EdsError", NULL, NULL);
@@ -0,0 +1,138 @@
+"""Compact, lazily decoded PropID.FocusInfo.
+
+GetPropertyData() decodes FocusInfo into a dict holding one dict per focus
+point: over 7,000 Python objects per call, although only the first
+pointNumber points are meaningful and few of them are valid. FocusInfo wraps
+the raw structure returned by GetPropertyDataBytes() instead and decodes a
+point only when it is asked for.
+"""
+
+import struct
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Tuple
+
+import edsdk
+from edsdk.constants import PropID
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from edsdk import EdsObject
+
+
+# EdsFocusInfo: EdsRect imageRect; EdsUInt32 pointNumber;
+#               EdsFocusPoint focusPoint[1053]; EdsUInt32 executeMode
+# EdsFocusPoint: EdsUInt32 valid, selected, justFocus; EdsRect rect;
+#                EdsUInt32 reserved
+FOCUS_POINT_CAPACITY = 1053
+_HEADER = struct.Struct("=4iI")
+_POINT = struct.Struct("=3I4iI")
+_EXECUTE_MODE = struct.Struct("=I")
+_POINTS_OFFSET = _HEADER.size
+_EXECUTE_MODE_OFFSET = _POINTS_OFFSET + FOCUS_POINT_CAPACITY * _POINT.size
+FOCUS_INFO_SIZE = _EXECUTE_MODE_OFFSET + _EXECUTE_MODE.size
+# Position of the first "valid" flag and the point stride, in 32-bit words
+_VALID_WORD = _POINTS_OFFSET // 4
+_POINT_WORDS = _POINT.size // 4
+
+# (x, y, width, height)
+Rect = Tuple[int, int, int, int]
+
+
+class FocusPoint(NamedTuple):
+    index: int
+    valid: bool
+    selected: bool
+    # AFFrameJustFocus value
+    just_focus: int
+    rect: Rect
+
+
+class FocusInfo:
+    """Read-only view over a raw EdsFocusInfo structure.
+
+    Only the header is decoded up front. valid_points() scans the valid flags
+    without decoding the other points; to_numpy() exposes all points as a
+    structured array without copying.
+    """
+
+    __slots__ = ("data", "image_rect", "point_number", "execute_mode", "_words")
+
+    def __init__(self, data: bytes) -> None:
+        if len(data) < FOCUS_INFO_SIZE:
+            raise ValueError(
+                f"FocusInfo needs {FOCUS_INFO_SIZE} bytes, got {len(data)}"
+            )
+        x, y, width, height, point_number = _HEADER.unpack_from(data)
+        self.data = data
+        self.image_rect: Rect = (x, y, width, height)
+        self.point_number: int = min(point_number, FOCUS_POINT_CAPACITY)
+        (self.execute_mode,) = _EXECUTE_MODE.unpack_from(data, _EXECUTE_MODE_OFFSET)
+        self._words = memoryview(data)[:FOCUS_INFO_SIZE].cast("I")
+
+    def __len__(self) -> int:
+        return self.point_number
+
+    def __getitem__(self, index: int) -> FocusPoint:
+        if index < 0:
+            index += self.point_number
+        if not 0 <= index < self.point_number:
+            raise IndexError("focus point index out of range")
+        return self._point(index)
+
+    def __iter__(self) -> Iterator[FocusPoint]:
+        for index in range(self.point_number):
+            yield self._point(index)
+
+    def __repr__(self) -> str:
+        return (
+            f"FocusInfo(image_rect={self.image_rect}, "
+            f"point_number={self.point_number}, execute_mode={self.execute_mode})"
+        )
+
+    def _point(self, index: int) -> FocusPoint:
+        valid, selected, just_focus, x, y, width, height, _reserved = (
+            _POINT.unpack_from(self.data, _POINTS_OFFSET + index * _POINT.size)
+        )
+        return FocusPoint(
+            index, bool(valid), bool(selected), just_focus, (x, y, width, height)
+        )
+
+    def _flagged(self, field: int) -> List[FocusPoint]:
+        start = _VALID_WORD + field
+        stop = start + self.point_number * _POINT_WORDS
+        flags = self._words[start:stop:_POINT_WORDS].tolist()
+        return [self._point(index) for index, flag in enumerate(flags) if flag]
+
+    def valid_points(self) -> List[FocusPoint]:
+        """The valid points only."""
+        return self._flagged(0)
+
+    def selected_points(self) -> List[FocusPoint]:
+        """The selected points only."""
+        return self._flagged(1)
+
+    def to_numpy(self) -> "np.ndarray":
+        """The point_number points as a structured array over data (requires numpy)."""
+        try:
+            import numpy as np  # type: ignore
+        except Exception as e:
+            raise RuntimeError("numpy is required for FocusInfo.to_numpy()") from e
+        dtype = np.dtype(
+            [
+                ("valid", "=u4"),
+                ("selected", "=u4"),
+                ("just_focus", "=u4"),
+                ("x", "=i4"),
+                ("y", "=i4"),
+                ("width", "=i4"),
+                ("height", "=i4"),
+                ("reserved", "=u4"),
+            ]
+        )
+        return np.frombuffer(
+            self.data, dtype, count=self.point_number, offset=_POINTS_OFFSET
+        )
+
+
+def get_focus_info(camera: "EdsObject", param: int = 0) -> FocusInfo:
+    """Read PropID.FocusInfo without decoding every focus point."""
+    return FocusInfo(edsdk.GetPropertyDataBytes(camera, PropID.FocusInfo, param))
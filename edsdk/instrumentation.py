@@ -0,0 +1,364 @@
+"""Per-operation timing of SDK calls and CameraController phases.
+
+install() wraps every API function of the active backend on the edsdk module,
+so each call through ``edsdk.<Name>`` is recorded as "sdk.<Name>" with its
+duration, byte count (where the call moves data) and EdsError code.
+CameraController also reports its own phases ("capture.wait_transfer",
+"transfer.plan", "transfer.thumbnail", "transfer.download", "transfer.write",
+"live_view.frame").
+Records feed in-process histograms (stats(), prometheus_text()) and any
+hooks, e.g. otel_hook() for OpenTelemetry spans::
+
+    from edsdk import instrumentation
+
+    inst = instrumentation.install()
+    inst.add_hook(lambda record: print(record.name, record.duration))
+    ...
+    print(inst.stats()["sdk.Download"]["p95_ms"])
+    instrumentation.uninstall()
+
+Without install() the edsdk functions are not wrapped and span() returns a
+shared no-op, so the cost is one function call per controller phase.
+"""
+
+import bisect
+import functools
+import math
+import threading
+import time
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import edsdk
+
+
+class OperationRecord(NamedTuple):
+    # "sdk.<Function>" or a controller phase such as "transfer.download"
+    name: str
+    # time.perf_counter() at the start, and the duration, in seconds
+    start: float
+    duration: float
+    # EdsError code, or the exception type name for other errors; None on success
+    error: Optional[Union[int, str]]
+    # Bytes moved by the operation, when known
+    nbytes: Optional[int]
+
+
+Hook = Callable[[OperationRecord], None]
+
+# Histogram bucket upper bounds: 1 us to ~110 s, four buckets per doubling
+_BUCKET_BOUNDS = tuple(1e-6 * 2 ** (k / 4) for k in range(108))
+# Functions that are called in a tight loop and would only add noise
+_DEFAULT_EXCLUDE = ("GetEvent",)
+
+
+def _download_bytes(args: Tuple[Any, ...], result: Any) -> Optional[int]:
+    return args[1] if len(args) > 1 else None
+
+
+def _result_length(args: Tuple[Any, ...], result: Any) -> Optional[int]:
+    return len(result)
+
+
+def _written_bytes(args: Tuple[Any, ...], result: Any) -> Optional[int]:
+    return int(result)
+
+
+# Byte count of the SDK calls that move data, from (args, result)
+_BYTE_COUNTS: Dict[str, Callable[[Tuple[Any, ...], Any], Optional[int]]] = {
+    "Download": _download_bytes,
+    "CopyData": _download_bytes,
+    "Read": _result_length,
+    "Write": _written_bytes,
+    "GetPropertyDataBytes": _result_length,
+}
+
+
+def _error_of(exc: BaseException) -> Union[int, str]:
+    code = getattr(exc, "code", None)
+    return int(code) if code is not None else type(exc).__name__
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "total", "maximum", "errors", "nbytes")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.errors: Dict[Union[int, str], int] = {}
+        self.nbytes = 0
+
+    def observe(self, record: OperationRecord) -> None:
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, record.duration)] += 1
+        self.count += 1
+        self.total += record.duration
+        self.maximum = max(self.maximum, record.duration)
+        if record.error is not None:
+            self.errors[record.error] = self.errors.get(record.error, 0) + 1
+        if record.nbytes:
+            self.nbytes += record.nbytes
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (at most the maximum)."""
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                if index == len(_BUCKET_BOUNDS):
+                    return self.maximum
+                return min(_BUCKET_BOUNDS[index], self.maximum)
+        return self.maximum
+
+
+class Instrumentation:
+    """Collects OperationRecords into per-operation histograms and passes them to hooks.
+
+    Hooks run synchronously on the thread that made the call (often the SDK
+    callback thread), so they should be quick; exceptions raised by hooks are
+    counted in hook_errors and otherwise ignored.
+    """
+
+    def __init__(self, hooks: Iterable[Hook] = ()) -> None:
+        self._hooks: Tuple[Hook, ...] = tuple(hooks)
+        self._histograms: Dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+        self.hook_errors = 0
+
+    def add_hook(self, hook: Hook) -> None:
+        self._hooks = self._hooks + (hook,)
+
+    def remove_hook(self, hook: Hook) -> None:
+        self._hooks = tuple(h for h in self._hooks if h is not hook)
+
+    def record(self, record: OperationRecord) -> None:
+        with self._lock:
+            histogram = self._histograms.get(record.name)
+            if histogram is None:
+                histogram = self._histograms[record.name] = _Histogram()
+            histogram.observe(record)
+        for hook in self._hooks:
+            try:
+                hook(record)
+            except Exception:
+                self.hook_errors += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Count, errors by code, bytes and latency percentiles per operation."""
+        with self._lock:
+            return {
+                name: {
+                    "count": h.count,
+                    "errors": dict(h.errors),
+                    "bytes": h.nbytes,
+                    "mean_ms": h.total / h.count * 1000,
+                    "p50_ms": h.quantile(0.50) * 1000,
+                    "p95_ms": h.quantile(0.95) * 1000,
+                    "p99_ms": h.quantile(0.99) * 1000,
+                    "max_ms": h.maximum * 1000,
+                }
+                for name, h in sorted(self._histograms.items())
+            }
+
+    def prometheus_text(self, prefix: str = "edsdk") -> str:
+        """The statistics in the Prometheus text exposition format."""
+        seconds = [f"# TYPE {prefix}_operation_seconds summary"]
+        errors = [f"# TYPE {prefix}_operation_errors_total counter"]
+        nbytes = [f"# TYPE {prefix}_operation_bytes_total counter"]
+        with self._lock:
+            for name, h in sorted(self._histograms.items()):
+                label = f'op="{name}"'
+                for q in (0.5, 0.95, 0.99):
+                    seconds.append(
+                        f'{prefix}_operation_seconds{{{label},quantile="{q}"}} '
+                        f"{h.quantile(q):.9g}"
+                    )
+                seconds.append(f"{prefix}_operation_seconds_count{{{label}}} {h.count}")
+                seconds.append(
+                    f"{prefix}_operation_seconds_sum{{{label}}} {h.total:.9g}"
+                )
+                for code, count in sorted(h.errors.items(), key=str):
+                    code_label = f"0x{code:08X}" if isinstance(code, int) else code
+                    errors.append(
+                        f'{prefix}_operation_errors_total{{{label},code="{code_label}"}}'
+                        f" {count}"
+                    )
+                if h.nbytes:
+                    nbytes.append(
+                        f"{prefix}_operation_bytes_total{{{label}}} {h.nbytes}"
+                    )
+        return "\n".join(seconds + errors + nbytes) + "\n"
+
+
+class _Span:
+    __slots__ = ("_instrumentation", "name", "nbytes", "_start")
+
+    def __init__(
+        self, instrumentation: Instrumentation, name: str, nbytes: Optional[int]
+    ) -> None:
+        self._instrumentation = instrumentation
+        self.name = name
+        self.nbytes = nbytes
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration = time.perf_counter() - self._start
+        error = _error_of(exc) if exc is not None else None
+        self._instrumentation.record(
+            OperationRecord(self.name, self._start, duration, error, self.nbytes)
+        )
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+_active: Optional[Instrumentation] = None
+_originals: Dict[str, Callable[..., Any]] = {}
+_install_lock = threading.Lock()
+
+
+def span(name: str, nbytes: Optional[int] = None) -> Union[_Span, _NoopSpan]:
+    """Context manager timing a controller phase; set .nbytes inside if known late."""
+    instrumentation = _active
+    if instrumentation is None:
+        return _NOOP_SPAN
+    return _Span(instrumentation, name, nbytes)
+
+
+def current() -> Optional[Instrumentation]:
+    """The installed Instrumentation, or None."""
+    return _active
+
+
+def _wrap(
+    name: str, fn: Callable[..., Any], instrumentation: Instrumentation
+) -> Callable[..., Any]:
+    label = f"sdk.{name}"
+    byte_count = _BYTE_COUNTS.get(name)
+    record = instrumentation.record
+    perf_counter = time.perf_counter
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            record(
+                OperationRecord(
+                    label, start, perf_counter() - start, _error_of(e), None
+                )
+            )
+            raise
+        duration = perf_counter() - start
+        nbytes = byte_count(args, result) if byte_count is not None else None
+        record(OperationRecord(label, start, duration, None, nbytes))
+        return result
+
+    return wrapper
+
+
+def _api_functions() -> List[str]:
+    return [
+        name
+        for name, value in vars(edsdk).items()
+        if name[:1].isupper()
+        and isinstance(value, (types.BuiltinFunctionType, types.FunctionType))
+    ]
+
+
+def install(
+    instrumentation: Optional[Instrumentation] = None,
+    *,
+    exclude: Iterable[str] = _DEFAULT_EXCLUDE,
+) -> Instrumentation:
+    """Start recording SDK calls and controller phases; returns the Instrumentation.
+
+    Functions named in exclude are left unwrapped. Installing again replaces
+    the previous Instrumentation.
+    """
+    global _active
+    instrumentation = instrumentation or Instrumentation()
+    skipped = set(exclude)
+    with _install_lock:
+        _restore()
+        for name in _api_functions():
+            if name in skipped:
+                continue
+            fn = getattr(edsdk, name)
+            _originals[name] = fn
+            setattr(edsdk, name, _wrap(name, fn, instrumentation))
+        _active = instrumentation
+    return instrumentation
+
+
+def uninstall() -> Optional[Instrumentation]:
+    """Stop recording and restore the original edsdk functions."""
+    global _active
+    with _install_lock:
+        _restore()
+        instrumentation, _active = _active, None
+    return instrumentation
+
+
+def _restore() -> None:
+    for name, fn in _originals.items():
+        setattr(edsdk, name, fn)
+    _originals.clear()
+
+
+def otel_hook(tracer: Any) -> Hook:
+    """A hook that turns records into OpenTelemetry spans from tracer.
+
+    Span times are converted from time.perf_counter() to epoch nanoseconds
+    with the offset between the two clocks when the hook is created.
+    """
+    offset = time.time() - time.perf_counter()
+
+    def hook(record: OperationRecord) -> None:
+        start_ns = int((record.start + offset) * 1e9)
+        attributes: Dict[str, Any] = {}
+        if record.nbytes is not None:
+            attributes["edsdk.bytes"] = record.nbytes
+        if record.error is not None:
+            attributes["edsdk.error"] = (
+                f"0x{record.error:08X}"
+                if isinstance(record.error, int)
+                else record.error
+            )
+        otel_span = tracer.start_span(
+            record.name, start_time=start_ns, attributes=attributes
+        )
+        otel_span.end(end_time=start_ns + int(record.duration * 1e9))
+
+    return hook
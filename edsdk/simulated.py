@@ -0,0 +1,1277 @@
+"""Pure-Python simulated EDSDK backend.
+
+Implements the surface of edsdk.api (see api.pyi) without the Canon EDSDK or a
+camera, so CameraController and friends can be imported, tested and
+benchmarked on any platform. Select it before edsdk is first imported::
+
+    os.environ["EDSDK_BACKEND"] = "simulated"
+    import edsdk
+    from edsdk import simulated
+
+    cam = simulated.configure(1, transfer_delay=0.02, payload="raw+jpeg")[0]
+    cam.fail("SendCommand", code=0x81, times=2)  # two DEVICE_BUSY replies
+
+Simulated cameras have sessions, properties with descriptors, TakePicture with
+synthetic JPEG and/or CR3 payloads, live view frames, configurable latencies
+and failure injection. Events are delivered in time order from a single
+dispatcher thread (like the SDK's callback thread on macOS), so callbacks
+arrive without message pumping and GetEvent() is a no-op. After
+set_event_delivery("get_event") due events are instead held until a thread
+calls GetEvent(), as with the SDK when no message loop is pumped. Jitter and
+payload contents come from a seeded generator so runs are repeatable.
+
+Image decoding (CreateImageRef, GetImageInfo, GetImage) and volumes are not
+simulated and raise EdsError (EDS_ERR_NOT_SUPPORTED).
+"""
+
+import datetime
+import heapq
+import itertools
+import os
+import random
+import struct
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from edsdk.constants import (
+    Access,
+    AEMode,
+    AFMode,
+    Av,
+    CameraCommand,
+    DataType,
+    DriveMode,
+    EvfAFMode,
+    EvfOutputDevice,
+    FileCreateDisposition,
+    ImageQuality,
+    ISOSpeedCamera,
+    MeteringMode,
+    ObjectEvent,
+    PropertyEvent,
+    PropID,
+    SaveTo,
+    SeekOrigin,
+    StateEvent,
+    Tv,
+    WhiteBalance,
+)
+
+__all__ = [
+    "EdsError",
+    "EdsObject",
+    "InitializeSDK",
+    "TerminateSDK",
+    "GetChildCount",
+    "GetChildAtIndex",
+    "GetParent",
+    "GetPropertySize",
+    "GetPropertyData",
+    "GetPropertyDataBytes",
+    "GetPropertyDataMany",
+    "SetPropertyData",
+    "GetPropertyDesc",
+    "GetCameraList",
+    "GetDeviceInfo",
+    "OpenSession",
+    "CloseSession",
+    "SendCommand",
+    "SendStatusCommand",
+    "SetCapacity",
+    "GetVolumeInfo",
+    "FormatVolume",
+    "GetDirectoryItemInfo",
+    "DeleteDirectoryItem",
+    "Download",
+    "DownloadCancel",
+    "DownloadComplete",
+    "DownloadThumbnail",
+    "GetAttribute",
+    "SetAttribute",
+    "CreateFileStream",
+    "CreateMemoryStream",
+    "CreateMemoryStreamFromPointer",
+    "GetPointer",
+    "Read",
+    "Write",
+    "Seek",
+    "GetPosition",
+    "GetLength",
+    "CopyData",
+    "SetProgressCallback",
+    "CreateImageRef",
+    "GetImageInfo",
+    "GetImage",
+    "CreateEvfImageRef",
+    "DownloadEvfImage",
+    "SetCameraAddedHandler",
+    "SetPropertyEventHandler",
+    "SetObjectEventHandler",
+    "SetCameraStateEventHandler",
+    "GetEvent",
+]
+
+# EDSDK error codes raised by the simulation
+EDS_ERR_INTERNAL_ERROR = 0x00000002
+EDS_ERR_OPERATION_CANCELLED = 0x00000005
+EDS_ERR_NOT_SUPPORTED = 0x00000007
+EDS_ERR_PROPERTIES_UNAVAILABLE = 0x00000050
+EDS_ERR_INVALID_PARAMETER = 0x00000060
+EDS_ERR_INVALID_HANDLE = 0x00000061
+EDS_ERR_INVALID_INDEX = 0x00000063
+EDS_ERR_DEVICE_BUSY = 0x00000081
+EDS_ERR_STREAM_NOT_OPEN = 0x000000A1
+EDS_ERR_STREAM_OPEN_ERROR = 0x000000A3
+EDS_ERR_STREAM_END_OF_STREAM = 0x000000AC
+EDS_ERR_COMM_DISCONNECTED = 0x000000C1
+EDS_ERR_SESSION_NOT_OPEN = 0x00002003
+EDS_ERR_SESSION_ALREADY_OPEN = 0x0000201E
+EDS_ERR_OBJECT_NOTREADY = 0x0000A102
+
+_ERROR_NAMES = {
+    EDS_ERR_INTERNAL_ERROR: "EDS_ERR_INTERNAL_ERROR",
+    EDS_ERR_OPERATION_CANCELLED: "EDS_ERR_OPERATION_CANCELLED",
+    EDS_ERR_NOT_SUPPORTED: "EDS_ERR_NOT_SUPPORTED",
+    EDS_ERR_PROPERTIES_UNAVAILABLE: "EDS_ERR_PROPERTIES_UNAVAILABLE",
+    EDS_ERR_INVALID_PARAMETER: "EDS_ERR_INVALID_PARAMETER",
+    EDS_ERR_INVALID_HANDLE: "EDS_ERR_INVALID_HANDLE",
+    EDS_ERR_INVALID_INDEX: "EDS_ERR_INVALID_INDEX",
+    EDS_ERR_DEVICE_BUSY: "EDS_ERR_DEVICE_BUSY",
+    EDS_ERR_STREAM_NOT_OPEN: "EDS_ERR_STREAM_NOT_OPEN",
+    EDS_ERR_STREAM_OPEN_ERROR: "EDS_ERR_STREAM_OPEN_ERROR",
+    EDS_ERR_STREAM_END_OF_STREAM: "EDS_ERR_STREAM_END_OF_STREAM",
+    EDS_ERR_COMM_DISCONNECTED: "EDS_ERR_COMM_DISCONNECTED",
+    EDS_ERR_SESSION_NOT_OPEN: "EDS_ERR_SESSION_NOT_OPEN",
+    EDS_ERR_SESSION_ALREADY_OPEN: "EDS_ERR_SESSION_ALREADY_OPEN",
+    EDS_ERR_OBJECT_NOTREADY: "EDS_ERR_OBJECT_NOTREADY",
+}
+
+# kEdsObjectFormat_* reported by GetDirectoryItemInfo
+_FORMAT_JPEG = 0x3801
+_FORMAT_CR3 = 0xB108
+# Seconds between the progress callbacks of a stalled download
+_STALL_PROGRESS_INTERVAL = 0.05
+# ImageQuality reported for each payload; setting ImageQuality changes the payload
+_PAYLOAD_QUALITY = {
+    "jpeg": ImageQuality.LJ,
+    "raw": ImageQuality.LR,
+    "raw+jpeg": ImageQuality.LRLJF,
+}
+# Primary image format (bits 20-23 of ImageQuality) of RAW
+_QUALITY_FORMAT_RAW = 0x6
+
+# A 16x16 grey baseline JPEG; payloads pad it with COM segments to their size
+_TINY_JPEG = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb004300100b0c0e0c0a100e0d0e"
+    "1211101318281a181616183123251d283a333d3c3933383740485c4e404457453738506d"
+    "51575f626768673e4d71797064785c656763ffdb0043011112121815182f1a1a2f634238"
+    "426363636363636363636363636363636363636363636363636363636363636363636363"
+    "636363636363636363636363636363ffc00011080010001003012200021101031101ffc4"
+    "0014000100000000000000000000000000000000ffc40014100100000000000000000000"
+    "000000000000ffc40014010100000000000000000000000000000000ffc4001411010000"
+    "0000000000000000000000000000ffda000c03010002110311003f00000fffd9"
+)
+_MAX_COM_SEGMENT = 4 + 0xFFFF - 2
+
+
+class EdsError(Exception):
+    @property
+    def code(self) -> Optional[int]:
+        return self.args[1] if len(self.args) > 1 else None
+
+
+def _error(code: int) -> EdsError:
+    return EdsError(_ERROR_NAMES.get(code, f"EDS error 0x{code:08X}"), code)
+
+
+class EdsObject:
+    """Base of every simulated SDK reference."""
+
+
+def _filler(size: int, tag: str) -> bytes:
+    if size <= 0:
+        return b""
+    pattern = f"edsdk-sim {tag} ".encode()
+    return (pattern * (size // len(pattern) + 1))[:size]
+
+
+def _jpeg_payload(size: int, tag: str) -> bytes:
+    """A decodable JPEG of exactly max(size, len(_TINY_JPEG) + 4) bytes."""
+    padding = max(size - len(_TINY_JPEG), 0)
+    if 0 < padding < 4:
+        padding = 4
+    segments = []
+    while padding:
+        segment = min(padding, _MAX_COM_SEGMENT)
+        if 0 < padding - segment < 4:
+            segment -= 4
+        body = _filler(segment - 4, tag)
+        segments.append(b"\xff\xfe" + struct.pack(">H", segment - 2) + body)
+        padding -= segment
+    return _TINY_JPEG[:2] + b"".join(segments) + _TINY_JPEG[2:]
+
+
+def _cr3_payload(size: int, tag: str) -> bytes:
+    """An ISO-BMFF file with a CR3 'ftyp' box, padded by an 'mdat' box."""
+    ftyp = struct.pack(">I", 24) + b"ftypcrx " + struct.pack(">I", 1) + b"crx isom"
+    mdat_size = max(size - len(ftyp), 8)
+    return ftyp + struct.pack(">I", mdat_size) + b"mdat" + _filler(mdat_size - 8, tag)
+
+
+class _Dispatcher:
+    """Delivers scheduled events in time order from one daemon thread.
+
+    With on_get_event set, due events are held until drain() runs them on the
+    thread that calls GetEvent().
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[float, int, Callable[..., Any], tuple]] = []
+        self._order = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self.on_get_event = False
+        self._due: List[Tuple[Callable[..., Any], tuple]] = []
+
+    def schedule(self, delay: float, fn: Callable[..., Any], *args: Any) -> None:
+        with self._cond:
+            due = time.perf_counter() + max(delay, 0.0)
+            heapq.heappush(self._queue, (due, next(self._order), fn, args))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="edsdk-sim-events", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    now = time.perf_counter()
+                    if self._queue and self._queue[0][0] <= now:
+                        break
+                    timeout = self._queue[0][0] - now if self._queue else None
+                    self._cond.wait(timeout)
+                _due, _order, fn, args = heapq.heappop(self._queue)
+                if self.on_get_event:
+                    self._due.append((fn, args))
+                    continue
+            self._call(fn, args)
+
+    def drain(self) -> None:
+        """Run the events held for GetEvent() on the calling thread."""
+        with self._cond:
+            due, self._due = self._due, []
+        for fn, args in due:
+            self._call(fn, args)
+
+    def set_on_get_event(self, enabled: bool) -> None:
+        with self._cond:
+            self.on_get_event = enabled
+            due = [] if enabled else self._due
+            if not enabled:
+                self._due = []
+        # Held events go back to the dispatcher thread, in order
+        for fn, args in due:
+            self.schedule(0.0, fn, *args)
+
+    @staticmethod
+    def _call(fn: Callable[..., Any], args: tuple) -> None:
+        try:
+            fn(*args)
+        except Exception:
+            traceback.print_exc()
+
+
+_dispatcher = _Dispatcher()
+
+
+class _Handler:
+    __slots__ = ("event", "callback", "context")
+
+    def __init__(self, event: int, callback: Callable, context: Any) -> None:
+        self.event = event
+        self.callback = callback
+        self.context = context
+
+    def __call__(self, event: int, *args: Any) -> None:
+        if self.event not in (event, _ALL_EVENTS.get(type(event))):
+            return
+        if self.context is not None:
+            self.callback(event, *args, self.context)
+        else:
+            self.callback(event, *args)
+
+
+_ALL_EVENTS = {
+    ObjectEvent: ObjectEvent.All,
+    PropertyEvent: PropertyEvent.All,
+    StateEvent: StateEvent.All,
+}
+
+
+class _Faults:
+    """Latencies and injected errors, keyed by API function name."""
+
+    def __init__(self, latencies: Optional[Dict[str, float]] = None) -> None:
+        self.latencies: Dict[str, float] = dict(latencies or {})
+        self._failures: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def fail(self, api: str, code: int = EDS_ERR_DEVICE_BUSY, times: int = 1) -> None:
+        """Make the next `times` calls of `api` raise EdsError(code)."""
+        with self._lock:
+            self._failures.setdefault(api, []).extend([code] * times)
+
+    def enter(self, api: str) -> None:
+        delay = self.latencies.get(api)
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            pending = self._failures.get(api)
+            code = pending.pop(0) if pending else None
+        if code is not None:
+            raise _error(code)
+
+
+def _table_code(table: Dict[int, str], display: str) -> int:
+    return next(code for code, text in table.items() if text == display)
+
+
+class SimulatedCamera(EdsObject):
+    """A simulated camera body and its settings.
+
+    payload is "jpeg", "raw" or "raw+jpeg" (one transfer per file) and
+    follows the ImageQuality property.
+    transfer_delay (+ up to transfer_jitter) is the time from TakePicture to
+    the DirItemRequestTransfer event; download_rate (bytes/s, None for
+    instant) paces Download. buffer_size is the number of shots the body
+    holds before TakePicture reports DEVICE_BUSY until files are downloaded
+    (None: unlimited). evf_fps paces live view frames (None: always ready).
+    latencies maps API names to a fixed extra delay per call, fail()
+    injects errors into the next calls of an API and stall() freezes
+    downloads midway.
+    """
+
+    def __init__(
+        self,
+        *,
+        port: str = "sim0",
+        product_name: str = "Canon EOS Simulated",
+        payload: str = "jpeg",
+        image_size: int = 256 * 1024,
+        raw_size: int = 1024 * 1024,
+        evf_size: int = 32 * 1024,
+        thumbnail_size: int = 16 * 1024,
+        evf_fps: Optional[float] = 30.0,
+        transfer_delay: float = 0.05,
+        transfer_jitter: float = 0.0,
+        download_rate: Optional[float] = None,
+        buffer_size: Optional[int] = None,
+        focus_points: int = 61,
+        latencies: Optional[Dict[str, float]] = None,
+        seed: int = 0,
+    ) -> None:
+        if payload not in _PAYLOAD_QUALITY:
+            raise ValueError("payload must be 'jpeg', 'raw' or 'raw+jpeg'")
+        self.port = port
+        self.product_name = product_name
+        self.image_size = image_size
+        self.raw_size = raw_size
+        self.evf_size = evf_size
+        self.thumbnail_size = thumbnail_size
+        self.evf_fps = evf_fps
+        self.transfer_delay = transfer_delay
+        self.transfer_jitter = transfer_jitter
+        self.download_rate = download_rate
+        self.buffer_size = buffer_size
+        self.focus_points = focus_points
+        self.faults = _Faults(latencies)
+        self.connected = True
+        self.session_open = False
+        # Number of shots taken, and perf_counter() of each transfer event
+        self.shots = 0
+        self.fired_at: List[float] = []
+        self.capacity: Optional[Dict[str, Any]] = None
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._evf_frames = 0
+        self._evf_next = 0.0
+        self._stalls: List[float] = []
+        self._object_handler: Optional[_Handler] = None
+        self._property_handler: Optional[_Handler] = None
+        self._state_handler: Optional[_Handler] = None
+        self.properties: Dict[int, Tuple[DataType, Any]] = {
+            PropID.ProductName: (DataType.String, product_name),
+            PropID.BodyIDEx: (DataType.String, f"SIM{seed:09d}"),
+            PropID.FirmwareVersion: (DataType.String, "1.0.0"),
+            PropID.BatteryLevel: (DataType.UInt32, 100),
+            PropID.DateTime: (DataType.Time, None),
+            PropID.SaveTo: (DataType.UInt32, int(SaveTo.Camera)),
+            PropID.Av: (DataType.UInt32, _table_code(Av, "5.6")),
+            PropID.Tv: (DataType.UInt32, _table_code(Tv, "1/125")),
+            PropID.ISOSpeed: (DataType.UInt32, int(ISOSpeedCamera.ISO400)),
+            PropID.AEMode: (DataType.UInt32, int(AEMode.Manual)),
+            PropID.MeteringMode: (DataType.UInt32, int(next(iter(MeteringMode)))),
+            PropID.WhiteBalance: (DataType.UInt32, int(WhiteBalance.Auto)),
+            PropID.ImageQuality: (DataType.UInt32, int(_PAYLOAD_QUALITY[payload])),
+            PropID.DriveMode: (DataType.UInt32, int(next(iter(DriveMode)))),
+            PropID.AFMode: (DataType.UInt32, int(next(iter(AFMode)))),
+            PropID.Evf_AFMode: (DataType.UInt32, int(next(iter(EvfAFMode)))),
+            PropID.Evf_Mode: (DataType.UInt32, 0),
+            PropID.Evf_OutputDevice: (DataType.UInt32, int(EvfOutputDevice.TFT)),
+            PropID.FocusInfo: (DataType.FocusInfo, None),
+        }
+        self.descriptors: Dict[int, Tuple[int, ...]] = {
+            PropID.Av: tuple(Av),
+            PropID.Tv: tuple(Tv),
+            PropID.ISOSpeed: tuple(int(v) for v in ISOSpeedCamera),
+            PropID.AEMode: tuple(int(v) for v in AEMode),
+            PropID.MeteringMode: tuple(int(v) for v in MeteringMode),
+            PropID.WhiteBalance: tuple(int(v) for v in WhiteBalance),
+            PropID.ImageQuality: tuple(int(v) for v in ImageQuality),
+            PropID.DriveMode: tuple(int(v) for v in DriveMode),
+            PropID.AFMode: tuple(int(v) for v in AFMode),
+            PropID.Evf_AFMode: tuple(int(v) for v in EvfAFMode),
+        }
+        self.read_only = {
+            PropID.ProductName,
+            PropID.BodyIDEx,
+            PropID.FirmwareVersion,
+            PropID.BatteryLevel,
+            PropID.FocusInfo,
+        }
+
+    def __repr__(self) -> str:
+        return f"SimulatedCamera(port={self.port!r}, shots={self.shots})"
+
+    @property
+    def payload(self) -> str:
+        code = int(self.properties[PropID.ImageQuality][1])
+        if (code >> 20) & 0xF != _QUALITY_FORMAT_RAW:
+            return "jpeg"
+        return "raw" if code & 0xFFFF == 0xFF0F else "raw+jpeg"
+
+    @payload.setter
+    def payload(self, payload: str) -> None:
+        if payload not in _PAYLOAD_QUALITY:
+            raise ValueError("payload must be 'jpeg', 'raw' or 'raw+jpeg'")
+        self.properties[PropID.ImageQuality] = (
+            DataType.UInt32,
+            int(_PAYLOAD_QUALITY[payload]),
+        )
+
+    def fail(self, api: str, code: int = EDS_ERR_DEVICE_BUSY, times: int = 1) -> None:
+        """Make the next `times` calls of `api` on this camera raise EdsError(code)."""
+        self.faults.fail(api, code, times)
+
+    def stall(self, times: int = 1, at: float = 0.5) -> None:
+        """Make the next `times` downloads stop delivering data at fraction `at`.
+
+        A stalled Download delivers no more data but keeps calling the
+        progress callback with the same percentage, as the Periodically option
+        does. It fails with the callback's non-zero return value (or with
+        EDS_ERR_OPERATION_CANCELLED after DownloadCancel() for the item).
+        Downloading the item again starts over.
+        """
+        with self._lock:
+            self._stalls.extend([at] * times)
+
+    def fire_property_changed(self, prop_id: int, param: int = 0) -> None:
+        """Deliver a PropertyChanged event, as when a dial is turned on the body."""
+        _dispatcher.schedule(
+            0.0, self._emit_property, PropertyEvent.PropertyChanged, prop_id, param
+        )
+
+    # ---------- internals ----------
+    def _enter(self, api: str, session: bool = True) -> None:
+        if not self.connected:
+            raise _error(EDS_ERR_COMM_DISCONNECTED)
+        if session and not self.session_open:
+            raise _error(EDS_ERR_SESSION_NOT_OPEN)
+        self.faults.enter(api)
+
+    def _emit_object(self, event: ObjectEvent, item: EdsObject) -> None:
+        if event == ObjectEvent.DirItemRequestTransfer:
+            self.fired_at.append(time.perf_counter())
+        handler = self._object_handler
+        if handler is not None and self.session_open:
+            handler(event, item)
+
+    def _emit_property(self, event: PropertyEvent, prop_id: int, param: int) -> None:
+        handler = self._property_handler
+        if handler is not None and self.session_open:
+            try:
+                prop_id = PropID(prop_id)
+            except ValueError:
+                pass
+            handler(event, prop_id, param)
+
+    def _emit_state(self, event: StateEvent, data: int) -> None:
+        handler = self._state_handler
+        if handler is not None:
+            handler(event, data)
+
+    def _shoot(self) -> None:
+        with self._lock:
+            if self.buffer_size is not None and self._in_flight >= self.buffer_size:
+                raise _error(EDS_ERR_DEVICE_BUSY)
+            self.shots += 1
+            shot = self.shots
+            files = (
+                [("CR3", self.raw_size), ("JPG", self.image_size)]
+                if self.payload == "raw+jpeg"
+                else (
+                    [("CR3", self.raw_size)]
+                    if self.payload == "raw"
+                    else [("JPG", self.image_size)]
+                )
+            )
+            self._in_flight += len(files)
+            delay = self.transfer_delay + self._rng.uniform(0.0, self.transfer_jitter)
+        # Files stay on the card (and are not counted in flight) unless the
+        # host is a destination, as with the real SaveTo setting
+        to_host = int(self.properties[PropID.SaveTo][1]) & int(SaveTo.Host)
+        event = (
+            ObjectEvent.DirItemRequestTransfer
+            if to_host
+            else ObjectEvent.DirItemCreated
+        )
+        for ext, size in files:
+            item = _DirectoryItem(self, f"IMG_{shot:04d}.{ext}", size, shot)
+            if not to_host:
+                item.finish()
+            _dispatcher.schedule(delay, self._emit_object, event, item)
+
+    def _release_item(self) -> None:
+        with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+
+    def _focus_info_bytes(self) -> bytes:
+        from edsdk.focus_info import FOCUS_INFO_SIZE, _POINT, _POINTS_OFFSET
+
+        data = bytearray(FOCUS_INFO_SIZE)
+        struct.pack_into("=4iI", data, 0, 0, 0, 6000, 4000, self.focus_points)
+        for i in range(self.focus_points):
+            x, y = 600 + (i % 9) * 540, 500 + (i // 9) * 420
+            selected = i == self.focus_points // 2
+            _POINT.pack_into(
+                data,
+                _POINTS_OFFSET + i * _POINT.size,
+                1,
+                selected,
+                0,
+                x,
+                y,
+                200,
+                200,
+                0,
+            )
+        return bytes(data)
+
+    def _property(self, prop_id: int) -> Tuple[DataType, Any]:
+        try:
+            data_type, value = self.properties[prop_id]
+        except KeyError:
+            raise _error(EDS_ERR_PROPERTIES_UNAVAILABLE) from None
+        if prop_id == PropID.DateTime:
+            value = datetime.datetime.now().replace(microsecond=0)
+        return data_type, value
+
+
+class _CameraList(EdsObject):
+    def __init__(self, cameras: List[SimulatedCamera]) -> None:
+        self.cameras = cameras
+
+
+class _DirectoryItem(EdsObject):
+    def __init__(
+        self, camera: SimulatedCamera, name: str, size: int, group: int = 0
+    ) -> None:
+        self.camera = camera
+        self.name = name
+        self.size = size
+        self.group = group
+        self.attributes = 0
+        self.done = False
+        self.cancelled = threading.Event()
+        self._payload: Optional[bytes] = None
+        self._offset = 0
+
+    def payload(self) -> bytes:
+        if self._payload is None:
+            tag = f"{self.camera.port}/{self.name}"
+            if self.name.endswith(".CR3"):
+                self._payload = _cr3_payload(self.size, tag)
+            else:
+                self._payload = _jpeg_payload(self.size, tag)
+            self.size = len(self._payload)
+        return self._payload
+
+    def finish(self) -> None:
+        if not self.done:
+            self.done = True
+            self.camera._release_item()
+
+
+class _Stream(EdsObject):
+    """A memory stream (growable or over a caller's buffer) or a file stream."""
+
+    def __init__(
+        self,
+        buffer: Optional[Union[bytearray, memoryview]] = None,
+        *,
+        growable: bool = False,
+        file: Any = None,
+    ) -> None:
+        self.buffer = buffer
+        self.growable = growable
+        self.file = file
+        self.position = 0
+        self.length = len(buffer) if buffer is not None and growable else 0
+        self.progress: Optional[Callable[[int, bool], int]] = None
+
+    def __del__(self) -> None:
+        if self.file is not None:
+            self.file.close()
+
+    def write(self, data: Union[bytes, memoryview]) -> int:
+        size = len(data)
+        if self.file is not None:
+            self.file.seek(self.position)
+            self.file.write(data)
+        else:
+            end = self.position + size
+            if end > len(self.buffer):
+                if not self.growable:
+                    raise _error(EDS_ERR_STREAM_END_OF_STREAM)
+                self.buffer.extend(bytes(end - len(self.buffer)))
+            self.buffer[self.position : end] = data
+        self.position += size
+        self.length = max(self.length, self.position)
+        return size
+
+    def read(self, size: int) -> bytes:
+        if self.file is not None:
+            self.file.seek(self.position)
+            data = self.file.read(size)
+        else:
+            data = bytes(
+                self.buffer[self.position : min(self.position + size, self.length)]
+            )
+        self.position += len(data)
+        return data
+
+    def size(self) -> int:
+        if self.file is not None:
+            return max(os.fstat(self.file.fileno()).st_size, self.length)
+        return self.length if not self.growable else max(self.length, len(self.buffer))
+
+
+class _EvfImage(EdsObject):
+    def __init__(self, stream: _Stream) -> None:
+        self.stream = stream
+
+
+# ---------- Process-wide simulation state ----------
+_state_lock = threading.RLock()
+_cameras: List[SimulatedCamera] = []
+_initialized = False
+_camera_added: Optional[Callable[[], None]] = None
+_sdk_faults = _Faults()
+
+
+def configure(cameras: int = 1, **options: Any) -> List[SimulatedCamera]:
+    """Replace the connected simulated cameras with `cameras` new ones.
+
+    options are SimulatedCamera arguments; camera k gets port "sim{k}" and
+    seed k unless given.
+    """
+    with _state_lock:
+        for camera in _cameras:
+            camera.connected = False
+        _cameras[:] = [
+            SimulatedCamera(**{"port": f"sim{k}", "seed": k, **options})
+            for k in range(cameras)
+        ]
+        return list(_cameras)
+
+
+def connected_cameras() -> List[SimulatedCamera]:
+    with _state_lock:
+        return list(_cameras)
+
+
+def add_camera(**options: Any) -> SimulatedCamera:
+    """Connect a new simulated camera and fire the camera-added handler."""
+    with _state_lock:
+        options.setdefault("port", f"sim{len(_cameras)}")
+        camera = SimulatedCamera(**options)
+        _cameras.append(camera)
+        handler = _camera_added
+    if handler is not None:
+        _dispatcher.schedule(0.0, handler)
+    return camera
+
+
+def remove_camera(camera: SimulatedCamera) -> None:
+    """Unplug a camera: its calls fail and an open session gets StateEvent.Shutdown."""
+    with _state_lock:
+        if camera in _cameras:
+            _cameras.remove(camera)
+    camera.connected = False
+    if camera.session_open:
+        _dispatcher.schedule(0.0, camera._emit_state, StateEvent.Shutdown, 0)
+
+
+def set_event_delivery(mode: str) -> None:
+    """Deliver events from the dispatcher thread or only from GetEvent() calls.
+
+    mode is "thread" (the default) or "get_event".
+    """
+    if mode not in ("thread", "get_event"):
+        raise ValueError("mode must be 'thread' or 'get_event'")
+    _dispatcher.set_on_get_event(mode == "get_event")
+
+
+def fail(api: str, code: int = EDS_ERR_INTERNAL_ERROR, times: int = 1) -> None:
+    """Make the next `times` calls of a camera-independent API raise EdsError(code)."""
+    _sdk_faults.fail(api, code, times)
+
+
+def _camera_of(obj: EdsObject) -> SimulatedCamera:
+    if isinstance(obj, SimulatedCamera):
+        return obj
+    if isinstance(obj, _DirectoryItem):
+        return obj.camera
+    raise _error(EDS_ERR_INVALID_HANDLE)
+
+
+def _stream_of(obj: EdsObject) -> _Stream:
+    if isinstance(obj, _EvfImage):
+        return obj.stream
+    if isinstance(obj, _Stream):
+        return obj
+    raise _error(EDS_ERR_INVALID_HANDLE)
+
+
+def _unsupported(*_args: Any, **_kwargs: Any) -> Any:
+    raise _error(EDS_ERR_NOT_SUPPORTED)
+
+
+# ---------- SDK ----------
+def InitializeSDK() -> None:
+    global _initialized
+    _sdk_faults.enter("InitializeSDK")
+    with _state_lock:
+        if not _cameras and not _initialized:
+            configure(int(os.environ.get("EDSDK_SIMULATED_CAMERAS", "1")))
+        _initialized = True
+
+
+def TerminateSDK() -> None:
+    global _initialized, _camera_added
+    _sdk_faults.enter("TerminateSDK")
+    with _state_lock:
+        _initialized = False
+        _camera_added = None
+        for camera in _cameras:
+            camera.session_open = False
+            camera._object_handler = None
+            camera._property_handler = None
+            camera._state_handler = None
+
+
+def GetEvent() -> None:
+    _sdk_faults.enter("GetEvent")
+    _dispatcher.drain()
+
+
+def GetCameraList() -> EdsObject:
+    _sdk_faults.enter("GetCameraList")
+    return _CameraList(connected_cameras())
+
+
+def GetChildCount(parent: EdsObject) -> int:
+    if isinstance(parent, _CameraList):
+        return len(parent.cameras)
+    if isinstance(parent, SimulatedCamera):
+        return 0
+    raise _error(EDS_ERR_NOT_SUPPORTED)
+
+
+def GetChildAtIndex(parent: EdsObject, index: int) -> EdsObject:
+    if not isinstance(parent, _CameraList):
+        raise _error(EDS_ERR_NOT_SUPPORTED)
+    if not 0 <= index < len(parent.cameras):
+        raise _error(EDS_ERR_INVALID_INDEX)
+    return parent.cameras[index]
+
+
+def GetParent(item: EdsObject) -> EdsObject:
+    if isinstance(item, _DirectoryItem):
+        return item.camera
+    raise _error(EDS_ERR_NOT_SUPPORTED)
+
+
+def GetDeviceInfo(camera: EdsObject) -> Dict[str, Any]:
+    cam = _camera_of(camera)
+    cam._enter("GetDeviceInfo", session=False)
+    return {
+        "szPortName": cam.port,
+        "szDeviceDescription": cam.product_name,
+        "deviceSubType": 1,
+        "reserved": 0,
+    }
+
+
+def OpenSession(camera: EdsObject) -> None:
+    cam = _camera_of(camera)
+    cam._enter("OpenSession", session=False)
+    if cam.session_open:
+        raise _error(EDS_ERR_SESSION_ALREADY_OPEN)
+    cam.session_open = True
+
+
+def CloseSession(camera: EdsObject) -> None:
+    cam = _camera_of(camera)
+    cam.faults.enter("CloseSession")
+    cam.session_open = False
+
+
+def SendCommand(camera: EdsObject, command: CameraCommand, param: int = 0) -> None:
+    cam = _camera_of(camera)
+    cam._enter("SendCommand")
+    shutter_pressed = command == CameraCommand.PressShutterButton and param & 0x3 == 3
+    if command == CameraCommand.TakePicture or shutter_pressed:
+        cam._shoot()
+
+
+def SendStatusCommand(camera: EdsObject, command: int, param: int = 0) -> None:
+    _camera_of(camera)._enter("SendStatusCommand")
+
+
+def SetCapacity(camera: EdsObject, capacity: Dict[str, Any]) -> None:
+    cam = _camera_of(camera)
+    cam._enter("SetCapacity")
+    cam.capacity = dict(capacity)
+
+
+# ---------- Properties ----------
+def _encode_property(data_type: DataType, value: Any) -> bytes:
+    if data_type == DataType.String:
+        return value.encode() + b"\0"
+    if data_type == DataType.UInt32:
+        return struct.pack("=I", value)
+    if data_type == DataType.Time:
+        return struct.pack(
+            "=7I",
+            value.year,
+            value.month,
+            value.day,
+            value.hour,
+            value.minute,
+            value.second,
+            0,
+        )
+    raise _error(EDS_ERR_NOT_SUPPORTED)
+
+
+def _focus_info_dict(data: bytes) -> Dict[str, Any]:
+    from edsdk.focus_info import FOCUS_POINT_CAPACITY, _POINT, _POINTS_OFFSET
+
+    x, y, width, height, point_number = struct.unpack_from("=4iI", data)
+    points = []
+    for i in range(FOCUS_POINT_CAPACITY):
+        valid, selected, just, px, py, pw, ph, reserved = _POINT.unpack_from(
+            data, _POINTS_OFFSET + i * _POINT.size
+        )
+        points.append(
+            {
+                "valid": valid,
+                "selected": selected,
+                "justFocus": just,
+                "rect": (px, py, pw, ph),
+                "reserved": reserved,
+            }
+        )
+    return {
+        "imageRect": (x, y, width, height),
+        "pointNumber": point_number,
+        "focusPoint": tuple(points),
+        "executeMode": struct.unpack_from("=I", data, len(data) - 4)[0],
+    }
+
+
+def GetPropertySize(
+    camera_or_image: EdsObject, property_id: PropID, param: int = 0
+) -> Tuple[DataType, int]:
+    cam = _camera_of(camera_or_image)
+    cam._enter("GetPropertySize")
+    data_type, value = cam._property(property_id)
+    if data_type == DataType.FocusInfo:
+        return data_type, len(cam._focus_info_bytes())
+    return data_type, len(_encode_property(data_type, value))
+
+
+def GetPropertyData(
+    camera_or_image: EdsObject, property_id: PropID, param: int = 0
+) -> Any:
+    cam = _camera_of(camera_or_image)
+    cam._enter("GetPropertyData")
+    data_type, value = cam._property(property_id)
+    if data_type == DataType.FocusInfo:
+        return _focus_info_dict(cam._focus_info_bytes())
+    return value
+
+
+def GetPropertyDataBytes(
+    camera_or_image: EdsObject, property_id: PropID, param: int = 0
+) -> bytes:
+    cam = _camera_of(camera_or_image)
+    cam._enter("GetPropertyDataBytes")
+    data_type, value = cam._property(property_id)
+    if data_type == DataType.FocusInfo:
+        return cam._focus_info_bytes()
+    return _encode_property(data_type, value)
+
+
+def GetPropertyDataMany(
+    camera_or_image: EdsObject,
+    properties: Iterable[Union[PropID, int, Tuple[Union[PropID, int], int]]],
+) -> Tuple[Any, ...]:
+    cam = _camera_of(camera_or_image)
+    cam._enter("GetPropertyDataMany")
+    results: List[Any] = []
+    for item in properties:
+        prop_id = item[0] if isinstance(item, tuple) else item
+        try:
+            data_type, value = cam._property(prop_id)
+            if data_type == DataType.FocusInfo:
+                value = _focus_info_dict(cam._focus_info_bytes())
+            results.append(value)
+        except EdsError as e:
+            results.append(e)
+    return tuple(results)
+
+
+def SetPropertyData(
+    camera_or_image: EdsObject, property_id: PropID, param: int, data: Any
+) -> None:
+    cam = _camera_of(camera_or_image)
+    cam._enter("SetPropertyData")
+    data_type, _value = cam._property(property_id)
+    if property_id in cam.read_only:
+        raise _error(EDS_ERR_NOT_SUPPORTED)
+    allowed = cam.descriptors.get(property_id)
+    if allowed is not None and int(data) not in allowed:
+        raise _error(EDS_ERR_INVALID_PARAMETER)
+    cam.properties[property_id] = (data_type, data)
+    _dispatcher.schedule(
+        0.0, cam._emit_property, PropertyEvent.PropertyChanged, int(property_id), param
+    )
+
+
+def GetPropertyDesc(camera: EdsObject, property_id: PropID) -> Dict[str, Any]:
+    cam = _camera_of(camera)
+    cam._enter("GetPropertyDesc")
+    codes = cam.descriptors.get(property_id, ())
+    return {"form": 0, "access": 1, "propDesc": tuple(codes)}
+
+
+# ---------- Directory items and downloads ----------
+def GetDirectoryItemInfo(dir_item: EdsObject) -> Dict[str, Any]:
+    if not isinstance(dir_item, _DirectoryItem):
+        raise _error(EDS_ERR_INVALID_HANDLE)
+    dir_item.camera._enter("GetDirectoryItemInfo")
+    dir_item.payload()
+    return {
+        "size": dir_item.size,
+        "isFolder": False,
+        "groupID": dir_item.group,
+        "option": 0,
+        "szFileName": dir_item.name,
+        "format": _FORMAT_CR3 if dir_item.name.endswith(".CR3") else _FORMAT_JPEG,
+        "dateTime": int(time.time()),
+    }
+
+
+def Download(dir_item: EdsObject, size: int, stream: EdsObject) -> None:
+    if not isinstance(dir_item, _DirectoryItem):
+        raise _error(EDS_ERR_INVALID_HANDLE)
+    cam = dir_item.camera
+    cam._enter("Download")
+    out = _stream_of(stream)
+    if dir_item.cancelled.is_set():
+        # Downloading again after DownloadCancel starts over
+        dir_item.cancelled.clear()
+        dir_item._offset = 0
+    with cam._lock:
+        stall_at = cam._stalls.pop(0) if cam._stalls else None
+    data = memoryview(dir_item.payload())[dir_item._offset : dir_item._offset + size]
+    stall_offset = None if stall_at is None else int(len(data) * stall_at)
+    # Delivered in chunks so progress callbacks and download_rate apply
+    chunk = max(len(data) // 10, 1)
+    for start in range(0, len(data), chunk):
+        if stall_offset is not None and start >= stall_offset:
+            _wait_stalled(dir_item, out)
+        if dir_item.cancelled.is_set():
+            raise _error(EDS_ERR_OPERATION_CANCELLED)
+        part = data[start : start + chunk]
+        if cam.download_rate:
+            time.sleep(len(part) / cam.download_rate)
+        out.write(part)
+        dir_item._offset += len(part)
+        if out.progress is not None:
+            percent = dir_item._offset * 100 // max(dir_item.size, 1)
+            code = out.progress(percent, False)
+            if code:
+                dir_item._offset = 0
+                raise _error(int(code))
+
+
+def _wait_stalled(dir_item: _DirectoryItem, out: _Stream) -> None:
+    """Block like a stalled link: no data, only periodic progress callbacks."""
+    percent = dir_item._offset * 100 // max(dir_item.size, 1)
+    while not dir_item.cancelled.wait(_STALL_PROGRESS_INTERVAL):
+        if out.progress is not None:
+            code = out.progress(percent, False)
+            if code:
+                dir_item._offset = 0
+                raise _error(int(code))
+
+
+def DownloadCancel(dir_item: EdsObject) -> None:
+    if not isinstance(dir_item, _DirectoryItem):
+        raise _error(EDS_ERR_INVALID_HANDLE)
+    dir_item.camera.faults.enter("DownloadCancel")
+    dir_item.cancelled.set()
+    dir_item.finish()
+
+
+def DownloadComplete(dir_item: EdsObject) -> None:
+    if not isinstance(dir_item, _DirectoryItem):
+        raise _error(EDS_ERR_INVALID_HANDLE)
+    dir_item.camera._enter("DownloadComplete")
+    dir_item.finish()
+
+
+def DownloadThumbnail(dir_item: EdsObject, stream: EdsObject) -> None:
+    if not isinstance(dir_item, _DirectoryItem):
+        raise _error(EDS_ERR_INVALID_HANDLE)
+    cam = dir_item.camera
+    cam._enter("DownloadThumbnail")
+    thumbnail = _jpeg_payload(cam.thumbnail_size, f"{dir_item.name} thumbnail")
+    if cam.download_rate:
+        time.sleep(len(thumbnail) / cam.download_rate)
+    _stream_of(stream).write(thumbnail)
+
+
+def DeleteDirectoryItem(dir_item: EdsObject) -> None:
+    if not isinstance(dir_item, _DirectoryItem):
+        raise _error(EDS_ERR_INVALID_HANDLE)
+    dir_item.camera._enter("DeleteDirectoryItem")
+    dir_item.finish()
+
+
+def GetAttribute(dir_item: EdsObject) -> int:
+    if not isinstance(dir_item, _DirectoryItem):
+        raise _error(EDS_ERR_INVALID_HANDLE)
+    return dir_item.attributes
+
+
+def SetAttribute(dir_item: EdsObject, file_attributes: int) -> int:
+    if not isinstance(dir_item, _DirectoryItem):
+        raise _error(EDS_ERR_INVALID_HANDLE)
+    dir_item.attributes = int(file_attributes)
+    return dir_item.attributes
+
+
+GetVolumeInfo = _unsupported
+FormatVolume = _unsupported
+
+
+# ---------- Streams ----------
+def CreateFileStream(
+    filename: str, disposition: FileCreateDisposition, access: Access
+) -> EdsObject:
+    exists = os.path.exists(filename)
+    if disposition == FileCreateDisposition.CreateNew and exists:
+        raise _error(EDS_ERR_STREAM_OPEN_ERROR)
+    if (
+        disposition
+        in (FileCreateDisposition.OpenExisting, FileCreateDisposition.TruncateExisting)
+        and not exists
+    ):
+        raise _error(EDS_ERR_STREAM_OPEN_ERROR)
+    if access == Access.Read:
+        mode = "rb"
+    elif (
+        disposition
+        in (
+            FileCreateDisposition.CreateNew,
+            FileCreateDisposition.CreateAlways,
+            FileCreateDisposition.TruncateExisting,
+        )
+        or not exists
+    ):
+        mode = "w+b"
+    else:
+        mode = "r+b"
+    try:
+        return _Stream(file=open(filename, mode, buffering=0))
+    except OSError:
+        raise _error(EDS_ERR_STREAM_OPEN_ERROR) from None
+
+
+def CreateMemoryStream(buffer_size: int) -> EdsObject:
+    return _Stream(bytearray(buffer_size), growable=True)
+
+
+def CreateMemoryStreamFromPointer(
+    buffer: Union[bytes, bytearray, memoryview],
+) -> EdsObject:
+    return _Stream(memoryview(buffer).cast("B"))
+
+
+def GetPointer(stream: EdsObject) -> memoryview:
+    out = _stream_of(stream)
+    if out.buffer is None:
+        raise BufferError("the stream has no host memory")
+    return memoryview(out.buffer)[: out.size()]
+
+
+def Read(stream: EdsObject, read_size: int) -> bytes:
+    return _stream_of(stream).read(read_size)
+
+
+def Write(stream: EdsObject, data: Union[bytes, bytearray, memoryview]) -> int:
+    return _stream_of(stream).write(memoryview(data).cast("B"))
+
+
+def Seek(stream: EdsObject, offset: int, origin: SeekOrigin) -> None:
+    out = _stream_of(stream)
+    base = {
+        SeekOrigin.Cur: out.position,
+        SeekOrigin.Begin: 0,
+        SeekOrigin.End: out.size(),
+    }[SeekOrigin(origin)]
+    if base + offset < 0:
+        raise _error(EDS_ERR_INVALID_PARAMETER)
+    out.position = base + offset
+
+
+def GetPosition(stream_or_image: EdsObject) -> int:
+    return _stream_of(stream_or_image).position
+
+
+def GetLength(stream_or_image: EdsObject) -> int:
+    return _stream_of(stream_or_image).size()
+
+
+def CopyData(
+    in_stream_or_image: EdsObject, write_size: int, out_stream_or_image: EdsObject
+) -> None:
+    data = _stream_of(in_stream_or_image).read(write_size)
+    _stream_of(out_stream_or_image).write(data)
+
+
+def SetProgressCallback(
+    stream_or_image: EdsObject,
+    callback: Optional[Callable],
+    option: int,
+    context: Any = None,
+) -> None:
+    """Progress of Download into the stream.
+
+    A non-zero return ends the Download with that error code, so returning
+    EDS_ERR_OPERATION_CANCELLED cancels it as with the native backend.
+    """
+    out = _stream_of(stream_or_image)
+    if callback is None:
+        out.progress = None
+    elif context is not None:
+        out.progress = lambda percent, cancel: callback(percent, cancel, context)
+    else:
+        out.progress = callback
+
+
+CreateImageRef = _unsupported
+GetImageInfo = _unsupported
+GetImage = _unsupported
+
+
+# ---------- Live view ----------
+def CreateEvfImageRef(stream: EdsObject) -> EdsObject:
+    return _EvfImage(_stream_of(stream))
+
+
+def DownloadEvfImage(camera: EdsObject, evf_image: EdsObject) -> None:
+    cam = _camera_of(camera)
+    cam._enter("DownloadEvfImage")
+    if not isinstance(evf_image, _EvfImage):
+        raise _error(EDS_ERR_INVALID_HANDLE)
+    output = cam.properties[PropID.Evf_OutputDevice][1]
+    if not int(output) & int(EvfOutputDevice.PC):
+        raise _error(EDS_ERR_OBJECT_NOTREADY)
+    now = time.perf_counter()
+    if cam.evf_fps:
+        if now < cam._evf_next:
+            raise _error(EDS_ERR_OBJECT_NOTREADY)
+        cam._evf_next = max(cam._evf_next + 1.0 / cam.evf_fps, now)
+    cam._evf_frames += 1
+    evf_image.stream.write(_jpeg_payload(cam.evf_size, f"evf {cam._evf_frames}"))
+
+
+# ---------- Event handlers ----------
+def SetCameraAddedHandler(callback: Optional[Callable], context: Any = None) -> None:
+    global _camera_added
+    if callback is None:
+        _camera_added = None
+    elif context is not None:
+        _camera_added = lambda: callback(context)  # noqa: E731
+    else:
+        _camera_added = callback
+
+
+def SetPropertyEventHandler(
+    camera: EdsObject,
+    event: PropertyEvent,
+    callback: Optional[Callable],
+    context: Any = None,
+) -> None:
+    cam = _camera_of(camera)
+    cam._enter("SetPropertyEventHandler", session=False)
+    cam._property_handler = (
+        None if callback is None else _Handler(event, callback, context)
+    )
+
+
+def SetObjectEventHandler(
+    camera: EdsObject,
+    event: ObjectEvent,
+    callback: Optional[Callable],
+    context: Any = None,
+) -> None:
+    cam = _camera_of(camera)
+    cam._enter("SetObjectEventHandler", session=False)
+    cam._object_handler = (
+        None if callback is None else _Handler(event, callback, context)
+    )
+
+
+def SetCameraStateEventHandler(
+    camera: EdsObject,
+    event: StateEvent,
+    callback: Optional[Callable],
+    context: Any = None,
+) -> None:
+    cam = _camera_of(camera)
+    cam._enter("SetCameraStateEventHandler", session=False)
+    cam._state_handler = (
+        None if callback is None else _Handler(event, callback, context)
+    )
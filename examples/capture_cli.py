@@ -30,6 +30,17 @@ def main(argv: Optional[list[str]] = None) -> int:
     p.add_argument(
         "--timeout", type=float, default=5.0, help="Timeout per shot seconds"
     )
+    p.add_argument(
+        "--burst",
+        action="store_true",
+        help="Pipelined burst: trigger next shots while earlier files download",
+    )
+    p.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=4,
+        help="Burst: max shots triggered but not yet downloaded (default: 4)",
+    )
     p.add_argument(
         "--list", action="store_true", help="List camera supported values and exit"
     )
@@ -87,6 +98,21 @@ def main(argv: Optional[list[str]] = None) -> int:
                 print("Live view saved:", path)
                 return 0
 
+            if args.burst:
+                timings = cam.capture_burst(
+                    args.shots,
+                    timeout=args.timeout,
+                    max_in_flight=args.max_in_flight,
+                    interval=args.interval,
+                )
+                t0 = timings[0].triggered
+                for t in timings:
+                    print(
+                        f"Saved: {t.path} (trigger +{t.triggered - t0:.3f}s, "
+                        f"transfer {t.transfer_started - t0:.3f}-{t.transfer_done - t0:.3f}s)"
+                    )
+                return 0
+
             paths = cam.capture(
                 shots=args.shots,
                 timeout=args.timeout,
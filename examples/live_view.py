@@ -1,4 +1,5 @@
 import argparse
+import io
 import os
 import time
 from datetime import datetime
@@ -38,44 +39,58 @@ def _display_with_opencv(cam: CameraController, args) -> None:
     window = args.window
     cv2.namedWindow(window, cv2.WINDOW_NORMAL)
 
+    def decode(view):
+        # bytes -> OpenCV 画像 (BGR)。取得スレッド側でデコードされる
+        return cv2.imdecode(np.frombuffer(view, dtype=np.uint8), cv2.IMREAD_COLOR)
+
     i = 0
-    while True:
-        data = cam.grab_live_view_frame()
-        # bytes -> OpenCV 画像 (BGR)
-        if isinstance(data, str):
-            with open(data, "rb") as f:
-                raw = f.read()
-        else:
-            raw = data
-        arr = np.frombuffer(raw, dtype=np.uint8)
-        frame_bgr = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-        if args.scale and args.scale != 1.0:
-            h, w = frame_bgr.shape[:2]
-            sw, sh = int(w * args.scale), int(h * args.scale)
-            frame_bgr = cv2.resize(frame_bgr, (sw, sh))
-
-        cv2.imshow(window, frame_bgr)
-        key = cv2.waitKey(1) & 0xFF
-        if key in (27, ord("q")):  # ESC or q
-            break
-        if key in (ord("s"),):  # snapshot
-            if args.snapshot:
-                os.makedirs(args.save_dir, exist_ok=True)
-                fname = f"{args.prefix}{_now_stamp()}_{i:04d}.jpg"
-                out = os.path.join(args.save_dir, fname)
-                # すでにBGRなのでそのまま保存
-                cv2.imwrite(out, frame_bgr)
-                print("Saved:", out)
-                i += 1
-            else:
-                print("Snapshot disabled (use --snapshot to enable)")
+    # 取得・デコードはバックグラウンドのスレッドで行い、表示ループは最新フレームだけを受け取る
+    with cam.live_view_stream(policy=args.policy, decode=decode) as stream:
+        while True:
+            _show_opencv_frame(cv2, stream.get(timeout=5.0), args, window)
+            key = cv2.waitKey(1) & 0xFF
+            if key in (27, ord("q")):  # ESC or q
+                break
+            if key in (ord("s"),):  # snapshot
+                if args.snapshot:
+                    os.makedirs(args.save_dir, exist_ok=True)
+                    fname = f"{args.prefix}{_now_stamp()}_{i:04d}.jpg"
+                    out = os.path.join(args.save_dir, fname)
+                    _save_frame(stream, out)
+                    print("Saved:", out)
+                    i += 1
+                else:
+                    print("Snapshot disabled (use --snapshot to enable)")
+        if args.verbose:
+            print("Live view stats:", stream.stats())
 
     cv2.destroyWindow(window)
 
 
+def _save_frame(stream, out: str) -> None:
+    # 直近に受け取ったフレームの JPEG をそのまま保存（カメラへの追加要求なし）
+    frame = stream.last_frame
+    if frame is None:
+        return
+    with open(out, "wb") as f:
+        f.write(frame.data)
+
+
+def _show_opencv_frame(cv2, frame, args, window: str) -> None:
+    frame_bgr = frame.image
+    if frame_bgr is None:
+        return
+    if args.scale and args.scale != 1.0:
+        h, w = frame_bgr.shape[:2]
+        sw, sh = int(w * args.scale), int(h * args.scale)
+        frame_bgr = cv2.resize(frame_bgr, (sw, sh))
+
+    cv2.imshow(window, frame_bgr)
+
+
 def _display_with_tk(cam: CameraController, args) -> None:
     try:
-        from PIL import ImageTk  # type: ignore
+        from PIL import Image, ImageTk  # type: ignore
         import tkinter as tk
     except Exception:  # pragma: no cover - optional path
         raise RuntimeError(
@@ -83,6 +98,18 @@ def _display_with_tk(cam: CameraController, args) -> None:
             "'pip install edsdk-python[display]' または 'pip install Pillow' を実行してください。"
         )
 
+    def decode(view):
+        # 取得スレッド側で JPEG -> PIL 画像にデコード
+        img = Image.open(io.BytesIO(view))
+        img.load()
+        if args.scale and args.scale != 1.0:
+            w, h = img.size
+            img = img.resize((int(w * args.scale), int(h * args.scale)))
+        return img
+
+    stream = cam.live_view_stream(policy=args.policy, decode=decode)
+    stream.start()
+
     root = tk.Tk()
     root.title(args.window)
     lbl = tk.Label(root)
@@ -100,7 +127,7 @@ def _display_with_tk(cam: CameraController, args) -> None:
                 os.makedirs(args.save_dir, exist_ok=True)
                 fname = f"{args.prefix}{_now_stamp()}_{i['n']:04d}.jpg"
                 out = os.path.join(args.save_dir, fname)
-                cam.grab_live_view_frame(save_path=out)
+                _save_frame(stream, out)
                 print("Saved:", out)
                 i["n"] += 1
             else:
@@ -110,22 +137,26 @@ def _display_with_tk(cam: CameraController, args) -> None:
 
     def update_frame():
         try:
-            img = cam.grab_live_view_pil()
-            if args.scale and args.scale != 1.0:
-                w, h = img.size
-                img = img.resize((int(w * args.scale), int(h * args.scale)))
-            imgtk = ImageTk.PhotoImage(image=img)
-            lbl.imgtk = imgtk  # keep ref
-            lbl.configure(image=imgtk)
+            # 新しいフレームがなければ None（GUI スレッドをブロックしない）
+            frame = stream.poll()
+            if frame is not None and frame.image is not None:
+                imgtk = ImageTk.PhotoImage(image=frame.image)
+                lbl.imgtk = imgtk  # keep ref
+                lbl.configure(image=imgtk)
         except Exception:
             # 取りこぼしはスキップ
             pass
         finally:
-            # 約30FPS目安（必要なら --interval を別用途に使わず固定）
-            root.after(33, update_frame)
+            # 約100Hzで新着フレームを確認
+            root.after(10, update_frame)
 
     update_frame()
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        stream.stop()
+        if args.verbose:
+            print("Live view stats:", stream.stats())
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -155,6 +186,12 @@ def main(argv: Optional[list[str]] = None) -> int:
     )
     p.add_argument("--window", default="Canon Live View", help="ウィンドウタイトル")
     p.add_argument("--scale", type=float, default=1.0, help="表示スケール (1.0=等倍)")
+    p.add_argument(
+        "--policy",
+        choices=["latest", "block"],
+        default="latest",
+        help="(display時) latest=最新フレームのみ表示 / block=全フレームを順に表示",
+    )
     p.add_argument(
         "--snapshot",
         action="store_true",
@@ -0,0 +1,37 @@
+"""Shared fixtures: every test runs against the simulated backend."""
+
+import os
+
+# Must be set before edsdk is first imported
+os.environ["EDSDK_BACKEND"] = "simulated"
+
+import pytest  # noqa: E402
+
+from edsdk import simulated  # noqa: E402
+from edsdk.camera_controller import CameraController  # noqa: E402
+
+
+@pytest.fixture
+def body() -> simulated.SimulatedCamera:
+    """A single simulated body with quick transfers, for fault injection."""
+    (camera,) = simulated.configure(1, transfer_delay=0.01)
+    return camera
+
+
+@pytest.fixture
+def camera(body, tmp_path):
+    """An open CameraController on the simulated body, saving into tmp_path."""
+    with CameraController(index=0, save_dir=str(tmp_path), auto_capacity=False) as cam:
+        yield cam
+
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    """Poll predicate until it holds; for events delivered on the SDK thread."""
+    import time
+
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from edsdk import simulated
+from edsdk.camera_controller import CameraController
+
+
+@pytest.fixture
+def burst_body():
+    (camera,) = simulated.configure(
+        1, transfer_delay=0.01, transfer_jitter=0.01, download_rate=50e6, seed=1
+    )
+    return camera
+
+
+def _names(paths):
+    return [os.path.basename(p) for p in paths]
+
+
+def test_burst_one_timing_per_shot(burst_body, tmp_path):
+    with CameraController(index=0, save_dir=str(tmp_path), auto_capacity=False) as cam:
+        timings = cam.capture_burst(5, max_in_flight=2)
+    assert [t.index for t in timings] == list(range(5))
+    assert [os.path.basename(t.path) for t in timings] == [
+        f"IMG_{i:04d}.JPG" for i in range(1, 6)
+    ]
+    for t in timings:
+        assert t.paths == (t.path,)
+        assert t.triggered <= t.transfer_requested
+        assert t.transfer_started <= t.transfer_done
+    assert sorted(os.listdir(tmp_path)) == [f"IMG_{i:04d}.JPG" for i in range(1, 6)]
+
+
+def test_burst_raw_and_jpeg_grouped_per_shot(burst_body, tmp_path):
+    burst_body.payload = "raw+jpeg"
+    with CameraController(index=0, save_dir=str(tmp_path), auto_capacity=False) as cam:
+        timings = cam.capture_burst(4, max_in_flight=2)
+        # Every file was downloaded before capture_burst() returned
+        saved = sorted(os.listdir(tmp_path))
+    assert len(timings) == 4
+    for i, t in enumerate(timings, start=1):
+        assert sorted(_names(t.paths)) == [f"IMG_{i:04d}.CR3", f"IMG_{i:04d}.JPG"]
+        assert t.triggered <= t.transfer_requested
+    triggers = [t.triggered for t in timings]
+    assert triggers == sorted(triggers)
+    assert saved == sorted(
+        f"IMG_{i:04d}.{ext}" for i in range(1, 5) for ext in ("CR3", "JPG")
+    )
+
+
+def test_burst_image_quality_sets_files_per_shot(burst_body, tmp_path):
+    with CameraController(index=0, save_dir=str(tmp_path), auto_capacity=False) as cam:
+        cam.set_properties(image_quality="LRLJF")
+        timings = cam.capture_burst(2)
+    assert burst_body.payload == "raw+jpeg"
+    assert [len(t.paths) for t in timings] == [2, 2]
+
+
+def test_burst_waits_for_full_buffer(tmp_path):
+    (body,) = simulated.configure(
+        1, transfer_delay=0.01, download_rate=20e6, buffer_size=1
+    )
+    with CameraController(index=0, save_dir=str(tmp_path), auto_capacity=False) as cam:
+        timings = cam.capture_burst(3, max_in_flight=3)
+    assert len(timings) == 3
+    assert body.shots == 3
+
+
+def test_burst_rejects_bad_arguments(camera):
+    with pytest.raises(ValueError):
+        camera.capture_burst(0)
+    with pytest.raises(ValueError):
+        camera.capture_burst(1, max_in_flight=0)
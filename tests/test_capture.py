@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from edsdk import EdsError
+from edsdk.camera_controller import CameraController
+
+JPEG_SOI = b"\xff\xd8"
+
+
+def test_capture_saves_file(camera, tmp_path):
+    paths = camera.capture()
+    assert paths == [str(tmp_path / "IMG_0001.JPG")]
+    with open(paths[0], "rb") as f:
+        assert f.read(2) == JPEG_SOI
+
+
+def test_capture_several_shots(camera):
+    paths = camera.capture(shots=3)
+    assert [os.path.basename(p) for p in paths] == [
+        "IMG_0001.JPG",
+        "IMG_0002.JPG",
+        "IMG_0003.JPG",
+    ]
+    assert all(os.path.exists(p) for p in paths)
+
+
+def test_capture_explicit_filename_keeps_extension(camera, tmp_path):
+    assert camera.capture(filename="frame.png") == [str(tmp_path / "frame.JPG")]
+
+
+def test_capture_bytes_returns_image_without_files(body, camera, tmp_path):
+    (data,) = camera.capture_bytes()
+    assert data.startswith(JPEG_SOI)
+    assert len(data) == body.image_size
+    assert os.listdir(tmp_path) == []
+
+
+def test_capture_bytes_keep_files(camera, tmp_path):
+    (data,) = camera.capture_bytes(keep_files=True)
+    with open(tmp_path / "IMG_0001.JPG", "rb") as f:
+        assert f.read() == data
+
+
+def test_capture_reports_busy_body(body, camera):
+    body.fail("SendCommand", code=0x81)
+    with pytest.raises(EdsError) as excinfo:
+        camera.capture()
+    assert excinfo.value.code == 0x81
+    assert len(camera.capture()) == 1
+
+
+def test_capture_bytes_returns_the_download_buffers(camera):
+    (data,) = camera.capture_bytes()
+    assert type(data) is bytearray
+
+
+def test_capture_bytes_keep_files_follows_patterns(body, tmp_path):
+    with CameraController(
+        index=0,
+        save_dir=str(tmp_path),
+        auto_capacity=False,
+        file_pattern="shot_{seq:02d}.{ext}",
+        dir_pattern="{ext}",
+    ) as cam:
+        first = cam.capture_bytes(keep_files=True)
+        (path,) = cam.capture()
+    with open(tmp_path / "JPG" / "shot_01.JPG", "rb") as f:
+        assert f.read() == first[0]
+    assert path == str(tmp_path / "JPG" / "shot_02.JPG")
@@ -0,0 +1,82 @@
+import os
+import threading
+import time
+
+import pytest
+
+from edsdk.camera_controller import CameraController, _FilenamePlanner
+
+
+def test_no_pattern_keeps_camera_name(tmp_path):
+    planner = _FilenamePlanner(None)
+    assert planner.plan(str(tmp_path), "IMG_0001.JPG") == (str(tmp_path), None)
+
+
+def test_file_pattern_fields(tmp_path):
+    planner = _FilenamePlanner("{basename}_{seq:03d}.{ext}", seq_start=7)
+    assert planner.plan(str(tmp_path), "IMG_0001.JPG")[1] == "IMG_0001_007.JPG"
+    assert planner.plan(str(tmp_path), "IMG_0002.CR3")[1] == "IMG_0002_008.CR3"
+
+
+def test_date_fields_follow_the_clock(tmp_path):
+    planner = _FilenamePlanner("{year}{month}{day}-{date}.{ext}")
+    name = planner.plan(str(tmp_path), "IMG_0001.JPG")[1]
+    today = time.strftime("%Y%m%d")
+    assert name.startswith(today + "-")
+    assert name.endswith(".JPG")
+
+
+def test_explicit_name_wins_and_keeps_extension(tmp_path):
+    planner = _FilenamePlanner("{seq}.{ext}")
+    directory, name = planner.plan(str(tmp_path), "IMG_0001.CR3", explicit="a/b.png")
+    assert directory == str(tmp_path)
+    assert name == "a_b.CR3"
+    # The explicit name did not consume a sequence number
+    assert planner.plan(str(tmp_path), "IMG_0002.JPG")[1] == "1.JPG"
+
+
+def test_dir_pattern_creates_directory(tmp_path):
+    planner = _FilenamePlanner(None, dir_pattern="{ext}")
+    directory, name = planner.plan(str(tmp_path), "IMG_0001.CR3")
+    assert directory == os.path.join(str(tmp_path), "CR3")
+    assert name is None
+    assert os.path.isdir(directory)
+
+
+def test_unknown_field_is_rejected():
+    with pytest.raises(ValueError):
+        _FilenamePlanner("{frame}.{ext}")
+
+
+def test_sequence_is_unique_across_threads(tmp_path):
+    planner = _FilenamePlanner("{seq:05d}.{ext}")
+    names = []
+    lock = threading.Lock()
+
+    def plan_many():
+        for _ in range(200):
+            name = planner.plan(str(tmp_path), "IMG.JPG")[1]
+            with lock:
+                names.append(name)
+
+    threads = [threading.Thread(target=plan_many) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(names)) == len(names) == 1600
+
+
+def test_controller_saves_with_patterns(body, tmp_path):
+    with CameraController(
+        index=0,
+        save_dir=str(tmp_path),
+        auto_capacity=False,
+        file_pattern="shot_{seq:02d}.{ext}",
+        dir_pattern="{ext}",
+    ) as cam:
+        (first,) = cam.capture()
+        (second,) = cam.capture()
+    assert first == os.path.join(str(tmp_path), "JPG", "shot_01.JPG")
+    assert second == os.path.join(str(tmp_path), "JPG", "shot_02.JPG")
+    assert os.path.isfile(first) and os.path.isfile(second)
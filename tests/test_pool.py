@@ -0,0 +1,27 @@
+import pytest
+
+from edsdk import simulated
+from edsdk.camera_controller import CameraPool
+
+
+@pytest.fixture(params=["thread", "get_event"])
+def delivery(request):
+    """Events from the SDK's callback thread, or only when GetEvent() is pumped."""
+    simulated.set_event_delivery(request.param)
+    yield request.param
+    simulated.set_event_delivery("thread")
+
+
+def test_pool_opens_hot_plugged_camera(delivery, tmp_path, monkeypatch):
+    # No body is open at first, so only the pool's own thread takes events
+    monkeypatch.setenv("EDSDK_SIMULATED_CAMERAS", "0")
+    simulated.configure(0)
+    with CameraPool(save_dir=str(tmp_path), auto_capacity=False) as pool:
+        assert not pool.wait_ready(1, timeout=0.2)
+        simulated.add_camera(port="sim0", transfer_delay=0.01)
+        assert pool.wait_ready(1, timeout=2)
+        simulated.add_camera(port="sim1", transfer_delay=0.01)
+        assert pool.wait_ready(2, timeout=2)
+        with pool.lease("sim1", timeout=1) as cam:
+            (path,) = cam.capture()
+    assert path.startswith(str(tmp_path / "sim1"))
@@ -0,0 +1,49 @@
+import asyncio
+import os
+import queue
+
+import pytest
+
+from edsdk.camera_controller import AsyncCameraController, TransferSkipped
+
+
+def test_preview_arrives_before_the_file(camera, tmp_path):
+    previews = queue.Queue()
+    camera.enable_previews(preview_queue=previews)
+    (path,) = camera.capture()
+    preview = previews.get(timeout=1)
+    assert preview.filename == "IMG_0001.JPG"
+    assert preview.data.startswith(b"\xff\xd8")
+    assert path == str(tmp_path / "IMG_0001.JPG")
+
+
+def test_rejected_preview_raises_in_capture(camera, tmp_path):
+    verdicts = iter([False, True])
+    camera.enable_previews(lambda _preview: next(verdicts))
+    with pytest.raises(TransferSkipped) as excinfo:
+        camera.capture()
+    assert excinfo.value.filename == "IMG_0001.JPG"
+    # The rejected frame is not counted as a finished transfer
+    assert camera._transfer_count == 0
+    assert camera.capture() == [str(tmp_path / "IMG_0002.JPG")]
+    camera.disable_previews()
+    assert os.listdir(tmp_path) == ["IMG_0002.JPG"]
+
+
+def test_previews_only_skips_every_file(camera, tmp_path):
+    camera.enable_previews(download=False)
+    with pytest.raises(TransferSkipped, match="download=False"):
+        camera.capture()
+    assert os.listdir(tmp_path) == []
+
+
+def test_async_capture_raises_for_rejected_preview(body, tmp_path):
+    async def main():
+        async with AsyncCameraController(
+            index=0, save_dir=str(tmp_path), auto_capacity=False
+        ) as cam:
+            await cam.run(lambda c: c.enable_previews(lambda _preview: False))
+            with pytest.raises(TransferSkipped):
+                await cam.capture()
+
+    asyncio.run(main())
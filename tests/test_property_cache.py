@@ -0,0 +1,146 @@
+import time
+
+import pytest
+
+from edsdk import PropertyEvent, PropID
+from edsdk.camera_controller import (
+    _MISSING,
+    CameraController,
+    _PropertyCache,
+    _SupportedCodes,
+)
+
+from conftest import wait_for
+
+
+def test_value_is_served_after_store():
+    cache = _PropertyCache()
+    assert cache.get_value(PropID.Tv) is _MISSING
+    cache.put_value(PropID.Tv, 0, 0x70, cache.generation)
+    assert cache.get_value(PropID.Tv) == 0x70
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_property_changed_drops_every_param_of_the_property():
+    cache = _PropertyCache()
+    generation = cache.generation
+    cache.put_value(PropID.Tv, 0, 0x70, generation)
+    cache.put_value(PropID.Tv, 1, 0x78, generation)
+    cache.put_value(PropID.Av, 0, 0x30, generation)
+    cache.put_desc(PropID.Tv, (0x70, 0x78), generation)
+    cache.invalidate(PropertyEvent.PropertyChanged, PropID.Tv)
+    assert cache.get_value(PropID.Tv, 0) is _MISSING
+    assert cache.get_value(PropID.Tv, 1) is _MISSING
+    assert cache.get_value(PropID.Av) == 0x30
+    assert cache.get_desc(PropID.Tv) == (0x70, 0x78)
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_desc_changed_drops_only_the_descriptor():
+    cache = _PropertyCache()
+    generation = cache.generation
+    cache.put_value(PropID.Tv, 0, 0x70, generation)
+    cache.put_desc(PropID.Tv, (0x70, 0x78), generation)
+    cache.invalidate(PropertyEvent.PropertyDescChanged, PropID.Tv)
+    assert cache.get_desc(PropID.Tv) is _MISSING
+    assert cache.get_value(PropID.Tv) == 0x70
+
+
+def test_unknown_property_clears_everything():
+    cache = _PropertyCache()
+    generation = cache.generation
+    cache.put_value(PropID.Tv, 0, 0x70, generation)
+    cache.put_desc(PropID.Av, (0x30,), generation)
+    cache.invalidate(PropertyEvent.PropertyChanged, PropID.Unknown)
+    assert cache.get_value(PropID.Tv) is _MISSING
+    assert cache.get_desc(PropID.Av) is _MISSING
+
+
+def test_read_that_raced_with_an_event_is_not_stored():
+    cache = _PropertyCache()
+    generation = cache.generation
+    # The event arrives while the value is being fetched
+    cache.invalidate(PropertyEvent.PropertyChanged, PropID.Tv)
+    cache.put_value(PropID.Tv, 0, 0x70, generation)
+    assert cache.get_value(PropID.Tv) is _MISSING
+
+
+def test_entries_expire_after_max_age():
+    cache = _PropertyCache(max_age=0.05)
+    cache.put_value(PropID.Tv, 0, 0x70, cache.generation)
+    assert cache.get_value(PropID.Tv) == 0x70
+    time.sleep(0.1)
+    assert cache.get_value(PropID.Tv) is _MISSING
+
+
+def test_descriptors_are_cached_without_values():
+    cache = _PropertyCache(cache_values=False)
+    codes = _SupportedCodes((0x78, 0x70), frozenset((0x70, 0x78)))
+    cache.put_desc(PropID.Tv, codes, cache.generation)
+    assert cache.get_desc(PropID.Tv).ordered == (0x78, 0x70)
+    assert 0x70 in cache.get_desc(PropID.Tv).members
+    cache.invalidate(PropertyEvent.PropertyDescChanged, PropID.Tv)
+    assert cache.get_desc(PropID.Tv) is _MISSING
+
+
+@pytest.fixture
+def cached(body, tmp_path):
+    with CameraController(
+        index=0, save_dir=str(tmp_path), auto_capacity=False, property_cache=True
+    ) as cam:
+        yield cam
+
+
+def test_second_read_is_served_from_cache(cached):
+    first = cached.get_properties()
+    misses = cached.property_cache_stats()["misses"]
+    assert cached.get_properties() == first
+    stats = cached.property_cache_stats()
+    assert stats["misses"] == misses
+    assert stats["hits"] > 0
+
+
+def test_property_changed_event_invalidates(body, cached):
+    assert cached.get_properties()["Tv"] == "1/125"
+    invalidations = cached.property_cache_stats()["invalidations"]
+    body.properties[PropID.Tv] = (body.properties[PropID.Tv][0], 0x78)  # 1/250
+    # Without an event the stale value is still served
+    assert cached.get_properties()["Tv"] == "1/125"
+    body.fire_property_changed(PropID.Tv)
+    assert wait_for(
+        lambda: cached.property_cache_stats()["invalidations"] > invalidations
+    )
+    assert cached.get_properties()["Tv"] == "1/250"
+
+
+def test_set_properties_is_read_back(cached):
+    cached.get_properties()
+    cached.set_properties(tv="1/500", av="8")
+    props = cached.get_properties()
+    assert props["Tv"] == "1/500"
+    assert props["Av"] == "8"
+
+
+def test_invalidate_property_cache_drops_values(cached):
+    cached.get_properties()
+    assert cached.property_cache_stats()["values"] > 0
+    cached.invalidate_property_cache()
+    assert cached.property_cache_stats()["values"] == 0
+
+
+def test_cache_disabled_reads_the_body(body, camera):
+    assert camera.get_properties()["Tv"] == "1/125"
+    body.properties[PropID.Tv] = (body.properties[PropID.Tv][0], 0x78)  # 1/250
+    assert camera.get_properties()["Tv"] == "1/250"
+    assert camera.property_cache_stats()["values"] == 0
+
+
+def test_descriptors_are_memoized_without_value_cache(camera):
+    camera.set_properties(tv="1/250")
+    misses = camera.property_cache_stats()["misses"]
+    camera.set_properties(tv="1/500")
+    stats = camera.property_cache_stats()
+    assert stats["misses"] == misses
+    assert stats["hits"] > 0
+    assert camera.get_properties()["Tv"] == "1/500"
@@ -0,0 +1,113 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from edsdk import ObjectEvent, simulated
+from edsdk.camera_controller import AsyncCameraController, CameraController
+
+
+@pytest.fixture
+def slow_body():
+    """A body whose downloads take long enough to stall midway."""
+    (camera,) = simulated.configure(
+        1, transfer_delay=0.01, download_rate=20e6, image_size=1_000_000
+    )
+    return camera
+
+
+def _controller(tmp_path, **options):
+    return CameraController(
+        index=0, save_dir=str(tmp_path), auto_capacity=False, **options
+    )
+
+
+def test_stalled_download_is_retried(slow_body, tmp_path):
+    reports = []
+    with _controller(tmp_path, stall_timeout=0.1, stall_retries=2) as cam:
+        cam.on_progress(reports.append)
+        slow_body.stall(times=1, at=0.3)
+        (path,) = cam.capture()
+    assert os.path.getsize(path) == 1_000_000
+    assert {r.attempt for r in reports} == {1, 2}
+    assert slow_body._in_flight == 0
+
+
+def test_stalled_capture_bytes_is_retried(slow_body, tmp_path):
+    with _controller(tmp_path, stall_timeout=0.1) as cam:
+        slow_body.stall(times=1)
+        (data,) = cam.capture_bytes()
+    assert len(data) == 1_000_000
+    assert os.listdir(tmp_path) == []
+
+
+def test_exhausted_retries_fail_the_capture(slow_body, tmp_path):
+    with _controller(tmp_path, stall_timeout=0.1, stall_retries=1) as cam:
+        slow_body.stall(times=2)
+        start = time.monotonic()
+        with pytest.raises(TimeoutError, match="stalled"):
+            cam.capture(timeout=5)
+        assert time.monotonic() - start < 2
+        # The item was cancelled on the body and the next shot goes through
+        assert slow_body._in_flight == 0
+        (path,) = cam.capture()
+    assert os.path.getsize(path) == 1_000_000
+
+
+def test_capture_retry_takes_a_new_picture(slow_body, tmp_path):
+    with _controller(tmp_path, stall_timeout=0.1, stall_retries=0) as cam:
+        slow_body.stall(times=1)
+        (path,) = cam.capture(retry=1, retry_delay=0.01)
+    assert slow_body.shots == 2
+    assert os.path.getsize(path) == 1_000_000
+
+
+def test_burst_survives_a_stall(slow_body, tmp_path):
+    with _controller(tmp_path, stall_timeout=0.1) as cam:
+        slow_body.stall(times=1)
+        timings = cam.capture_burst(3)
+    assert len(timings) == 3
+    assert all(os.path.getsize(t.path) == 1_000_000 for t in timings)
+
+
+def test_async_capture_fails_fast_on_exhausted_retries(slow_body, tmp_path):
+    async def main():
+        async with AsyncCameraController(
+            index=0,
+            save_dir=str(tmp_path),
+            auto_capacity=False,
+            stall_timeout=0.1,
+            stall_retries=1,
+        ) as cam:
+            slow_body.stall(times=2)
+            start = time.monotonic()
+            with pytest.raises(TimeoutError, match="stalled"):
+                await cam.capture(timeout=5)
+            assert time.monotonic() - start < 2
+            return await cam.capture()
+
+    path = asyncio.run(main())
+    assert os.path.getsize(path) == 1_000_000
+
+
+def test_object_handler_sees_failed_transfers(slow_body, tmp_path):
+    events = []
+    with _controller(tmp_path, stall_timeout=0.1, stall_retries=0) as cam:
+        cam.on_object(lambda event, _item: events.append(event) or 0)
+        slow_body.stall(times=1)
+        with pytest.raises(TimeoutError, match="stalled"):
+            cam.capture(timeout=5)
+    assert events == [ObjectEvent.DirItemRequestTransfer]
+
+
+def test_retry_log_counts_retries(slow_body, tmp_path):
+    logs = []
+    with _controller(
+        tmp_path, stall_timeout=0.1, stall_retries=2, logger=logs.append
+    ) as cam:
+        slow_body.stall(times=3)
+        with pytest.raises(TimeoutError, match="stalled 3 times"):
+            cam.capture(timeout=5)
+    retries = [m for m in logs if m.startswith("Retry stalled download")]
+    assert [m.rsplit("(", 1)[1] for m in retries] == ["retry 1/2)", "retry 2/2)"]